@@ -3,25 +3,28 @@ import argparse
 import signal
 import sys
 import time
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from flask import Flask, request, g
+from flask import Flask, Response, request, g
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
-from flask_graphql import GraphQLView
 from graphene import Schema
 from src.schema import Query, Mutation
-from src.scrapers.games_scraper import fetch_game_schedule
-from src.scrapers.youtube_stats import fetch_videos
+from src.scrapers.scrape_planner import FULL_SCRAPE_INTERVAL, PLAN_INTERVAL, scrape_scheduler
+from src.scrapers.youtube_stats import fetch_videos, refresh_video_metadata
 from src.scrapers.daily_sun_scrape import fetch_news
 from src.services.article_service import ArticleService
+from src.services.game_archive_service import GameArchiveService
+from src.services.live_score_service import LiveScoreService, TooManySubscribers
 from src.utils.constants import JWT_SECRET_KEY
+from src.utils.graphql_view import StreamingGraphQLView
 from src.utils.team_loader import TeamLoader
-from src.database import db
+from src.utils.token_blocklist import token_blocklist
+from src.utils.migrations import migrate_dates_to_bson, migrate_game_results
 
 app = Flask(__name__)
 
@@ -39,8 +42,11 @@ jwt = JWTManager(app)
 @jwt.token_in_blocklist_loader
 def check_if_token_revoked(jwt_header, jwt_payload: dict) -> bool:
     """Reject the request if the token's jti is in the blocklist (e.g. after logout)."""
-    jti = jwt_payload["jti"]
-    return db["token_blocklist"].find_one({"jti": jti}) is not None
+    return token_blocklist.is_revoked(jwt_payload["jti"])
+
+
+# Preload revoked tokens so authenticated requests never wait on MongoDB
+token_blocklist.load()
 
 
 @app.before_request
@@ -106,11 +112,59 @@ def create_context():
 
 app.add_url_rule(
     "/graphql",
-    view_func=GraphQLView.as_view(
+    view_func=StreamingGraphQLView.as_view(
         "graphql", schema=schema, graphiql=True, get_context=create_context
     ),
 )
 
+# Seconds between keep-alive comments, and before a live stream is closed so
+# the client reconnects (resuming from Last-Event-ID)
+LIVE_HEARTBEAT_INTERVAL = 15
+LIVE_STREAM_DURATION = 300
+
+# Seconds a client rejected for too many open streams should wait
+LIVE_RETRY_AFTER = 30
+
+
+@app.route("/live/games")
+def live_games():
+    """
+    Stream live score changes as Server-Sent Events, for one game (`?gameId=`),
+    one sport (`?sport=&gender=`), or every game. Answers 503 when the
+    process already serves its maximum number of streams.
+    """
+    try:
+        subscription = LiveScoreService.subscribe(
+            game_id=request.args.get("gameId"),
+            sport=request.args.get("sport"),
+            gender=request.args.get("gender"),
+            last_event_id=request.headers.get("Last-Event-ID"),
+        )
+    except TooManySubscribers as e:
+        logging.warning(f"Rejected live stream: {e}")
+        return Response(
+            "Too many live streams, retry later",
+            status=503,
+            headers={"Retry-After": str(LIVE_RETRY_AFTER)},
+            mimetype="text/plain",
+        )
+
+    def events():
+        try:
+            deadline = time.monotonic() + LIVE_STREAM_DURATION
+            yield "retry: 5000\n\n"
+            while time.monotonic() < deadline:
+                change = subscription.get(timeout=LIVE_HEARTBEAT_INTERVAL)
+                yield LiveScoreService.to_event(change) if change else ": keep-alive\n\n"
+        finally:
+            subscription.close()
+
+    return Response(
+        events(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 # Setup command line arguments
 def parse_args():
     parser = argparse.ArgumentParser(description="Skip scraping tasks, for dev purposes.")
@@ -146,6 +200,10 @@ signal.signal(signal.SIGTERM, signal_handler)
 # Only parse arguments when running directly (not when imported by gunicorn)
 if __name__ == "__main__":
     args = parse_args()
+    # Under gunicorn the migrations run once before the workers start (see the
+    # Dockerfile), not in every worker
+    migrate_dates_to_bson()
+    migrate_game_results()
 else:
     # Default args when imported by gunicorn
     class DefaultArgs:
@@ -160,27 +218,31 @@ if not args.no_scrape:
     scheduler.init_app(app)
     scheduler.start()
 
-    @scheduler.task("interval", id="cleanse_token_blocklist", seconds=86400)  # 24 hours
-    def cleanse_token_blocklist():
-        """Remove expired tokens from blocklist so the collection doesn't grow forever."""
-        from datetime import timezone
-        from src.database import db
-        result = db["token_blocklist"].delete_many(
-            {"expires_at": {"$lt": datetime.now(timezone.utc)}}
-        )
-        if result.deleted_count:
-            logging.info(f"Cleansed {result.deleted_count} expired token(s) from blocklist")
-
-    @scheduler.task("interval", id="scrape_schedules", seconds=43200) # 12 hours
+    @scheduler.task("interval", id="scrape_schedules", seconds=FULL_SCRAPE_INTERVAL)
     def scrape_schedules():
         logging.info("Scraping game schedules...")
-        fetch_game_schedule()
+        scrape_scheduler.scrape_all()
+
+    @scheduler.task("interval", id="scrape_due_games", seconds=PLAN_INTERVAL)
+    def scrape_due_games():
+        scrape_scheduler.run_due()
 
     @scheduler.task("interval", id="scrape_videos", seconds=43200) # 12 hours
     def scrape_videos():
         logging.info("Scraping YouTube videos...")
         fetch_videos()
 
+    @scheduler.task("interval", id="refresh_video_metadata", seconds=604800) # 1 week
+    def refresh_videos():
+        logging.info("Refreshing YouTube video metadata...")
+        refresh_video_metadata()
+
+    @scheduler.task("interval", id="archive_seasons", seconds=86400) # 1 day
+    def archive_seasons():
+        logging.info("Archiving past seasons...")
+        GameArchiveService.archive_past_seasons()
+
+    archive_seasons()
     scrape_schedules()
     scrape_videos()
 
@@ -3,8 +3,10 @@ import time
 import signal
 import sys
 from apscheduler.schedulers.background import BackgroundScheduler
-from src.scrapers.games_scraper import fetch_game_schedule
-from src.scrapers.youtube_stats import fetch_videos
+from src.scrapers.scrape_planner import FULL_SCRAPE_INTERVAL, PLAN_INTERVAL, scrape_scheduler
+from src.scrapers.youtube_stats import fetch_videos, refresh_video_metadata
+from src.services.game_archive_service import GameArchiveService
+from src.utils.migrations import migrate_dates_to_bson, migrate_game_results
 
 logging.basicConfig(
     format="%(asctime)s %(levelname)-8s %(message)s",
@@ -18,11 +20,15 @@ scheduler = BackgroundScheduler(daemon=True)
 def scrape_schedules():
     start_time = time.time()
     logging.info("Starting scraping games")
-    fetch_game_schedule()
+    scrape_scheduler.scrape_all()
     elapsed_time = time.time() - start_time
     logging.info(f"Completed scraping games in {elapsed_time:.2f} seconds")
 
 
+def scrape_due_games():
+    scrape_scheduler.run_due()
+
+
 def scrape_videos():
     start_time = time.time()
     logging.info("Scraping YouTube videos")
@@ -31,6 +37,20 @@ def scrape_videos():
     logging.info(f"Completed scraping videos in {elapsed_time:.2f} seconds")
 
 
+def refresh_videos():
+    start_time = time.time()
+    logging.info("Refreshing YouTube video metadata")
+    refresh_video_metadata()
+    elapsed_time = time.time() - start_time
+    logging.info(f"Completed refreshing video metadata in {elapsed_time:.2f} seconds")
+
+
+def archive_seasons():
+    logging.info("Archiving past seasons")
+    archived = GameArchiveService.archive_past_seasons()
+    logging.info(f"Archived {archived} games")
+
+
 def signal_handler(sig, frame):
     logging.info("Shutting down scheduler...")
     scheduler.shutdown(wait=True)
@@ -41,13 +61,25 @@ signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
 if __name__ == "__main__":
+    migrate_dates_to_bson()
+    migrate_game_results()
+    scheduler.add_job(
+        scrape_schedules, "interval", seconds=FULL_SCRAPE_INTERVAL, id="scrape_schedules"
+    )
+    scheduler.add_job(
+        scrape_due_games, "interval", seconds=PLAN_INTERVAL, id="scrape_due_games"
+    )
+    scheduler.add_job(
+        scrape_videos, "interval", seconds=60 * 60 * 12, id="scrape_videos"
+    )
     scheduler.add_job(
-        scrape_schedules, "interval", seconds=60 * 60, id="scrape_schedules"
+        refresh_videos, "interval", seconds=60 * 60 * 24 * 7, id="refresh_videos"
     )
     scheduler.add_job(
-        scrape_videos, "interval", seconds=60 * 60 * 24, id="scrape_videos"
+        archive_seasons, "interval", seconds=60 * 60 * 24, id="archive_seasons"
     )
     scheduler.start()
+    archive_seasons()
     scrape_schedules()
     scrape_videos()
 
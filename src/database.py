@@ -1,4 +1,14 @@
 from pymongo import MongoClient
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from contextlib import contextmanager
 import os
 from dotenv import load_dotenv
 import threading
@@ -9,7 +19,8 @@ load_dotenv()
 # Determine certificate path and TLS usage
 if os.getenv("STAGE") == "local":
     file_name = "ca-certificate.crt"
-    use_tls = os.getenv("MONGO_URI") != "mongodb://localhost:27017/"
+    # Local servers, including a local replica set, run without TLS
+    use_tls = not (os.getenv("MONGO_URI") or "").startswith("mongodb://localhost:")
 else:
     file_name = "/etc/ssl/ca-certificate.crt"
     use_tls = True
@@ -20,9 +31,10 @@ if use_tls:
         os.getenv("MONGO_URI"),
         tls=True,
         tlsCAFile=file_name,
+        tz_aware=True,
     )
 else:
-    client = MongoClient(os.getenv("MONGO_URI"))
+    client = MongoClient(os.getenv("MONGO_URI"), tz_aware=True)
 
 # Force connection on startup
 try:
@@ -50,57 +62,87 @@ threading.Thread(target=keep_connection_alive, daemon=True).start()
 db = client[os.getenv("MONGO_DB", "score_db")]
 daily_sun_db = client[os.getenv("DAILY_SUN_DB", "daily_sun_db")]
 
+# Opt-in fast path for large list queries: documents are returned as raw BSON and
+# only decoded as their fields are accessed, with nested documents left raw
+RAW_BSON_READS = os.getenv("RAW_BSON_READS", "false").lower() == "true"
+RAW_BSON_CODEC_OPTIONS = CodecOptions(document_class=RawBSONDocument, tz_aware=True)
+
+
+# Read preference of the reads made while resolving GraphQL queries. Everything
+# else (scrapers, scheduled jobs, mutations and every write) uses the primary.
+# Secondaries more than MAX_STALENESS_SECONDS behind the primary are not read
+# from; MongoDB does not accept less than 90.
+READ_PREFERENCES = {
+    "primary": Primary,
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+READ_PREFERENCE = os.getenv("READ_PREFERENCE") or "secondaryPreferred"
+MAX_STALENESS_SECONDS = max(int(os.getenv("MAX_STALENESS_SECONDS") or 90), 90)
+
+if READ_PREFERENCE not in READ_PREFERENCES:
+    raise ValueError(
+        f"Unknown READ_PREFERENCE {READ_PREFERENCE!r}, expected one of {', '.join(READ_PREFERENCES)}"
+    )
+REPLICA_READS = READ_PREFERENCE != "primary"
+replica_read_preference = (
+    READ_PREFERENCES[READ_PREFERENCE](max_staleness=MAX_STALENESS_SECONDS)
+    if REPLICA_READS
+    else Primary()
+)
+
+_read_scope = threading.local()
+
+
+@contextmanager
+def replica_reads():
+    """
+    Routes the reads made through `get_read_collection` in this thread to the
+    configured read preference until the block exits.
+    """
+    previous = getattr(_read_scope, "active", False)
+    _read_scope.active = True
+    try:
+        yield
+    finally:
+        _read_scope.active = previous
+
+
+def get_read_collection(name, database=None):
+    """
+    Returns the collection handle used for reads. Inside `replica_reads()` it
+    reads with the configured read preference, so it may return data up to
+    MAX_STALENESS_SECONDS old; elsewhere it reads from the primary. Writes
+    always go through `db[name]`.
+    """
+    collection = (database if database is not None else db)[name]
+    if REPLICA_READS and getattr(_read_scope, "active", False):
+        return collection.with_options(read_preference=replica_read_preference)
+    return collection
+
+
+def get_list_collection(name, database=None):
+    """
+    Returns the collection handle used by large list queries, which reads like
+    `get_read_collection` and returns RawBSONDocument instances when
+    RAW_BSON_READS is enabled.
+    """
+    collection = get_read_collection(name, database)
+    if RAW_BSON_READS:
+        return collection.with_options(codec_options=RAW_BSON_CODEC_OPTIONS)
+    return collection
+
 
 def setup_database_indexes():
     """Set up MongoDB indexes for optimal query performance"""
-    from pymongo.errors import DuplicateKeyError, OperationFailure
+    from src.utils.index_spec import apply_index_spec, load_index_spec
 
     try:
-        game_collection = db["game"]
-
-        # Create single field indexes for commonly queried fields
-        game_collection.create_index([("sport", 1)], background=True)
-        game_collection.create_index([("date", 1)], background=True)
-        game_collection.create_index([("gender", 1)], background=True)
-
-        # Create compound indexes for common query combinations
-        game_collection.create_index([("sport", 1), ("gender", 1)], background=True)
-
-        # Index for sorting operations
-        game_collection.create_index([("date", -1)], background=True)
-
-        try:
-            game_collection.create_index(
-                [
-                    ("sport", 1),
-                    ("gender", 1),
-                    ("date", 1),
-                    ("opponent_id", 1),
-                    ("city", 1),
-                    ("state", 1),
-                    ("location", 1),
-                ],
-                unique=True,
-                background=True
-            )
-        except (DuplicateKeyError, OperationFailure) as e:
-            print(f"Warning: Could not create unique index due to existing duplicates: {e}")
-
-        # Additional index for tournament games (without opponent_id)
-        game_collection.create_index(
-            [
-                ("sport", 1),
-                ("gender", 1),
-                ("date", 1),
-                ("city", 1),
-                ("state", 1),
-            ],
-            background=True
+        apply_index_spec(
+            {"score_db": db, "daily_sun_db": daily_sun_db}, load_index_spec()
         )
-
-        # JWT blocklist: fast lookup by jti
-        db["token_blocklist"].create_index([("jti", 1)], background=True)
-
         print("✅ MongoDB indexes created successfully")
     except Exception as e:
         print(f"❌ Failed to create MongoDB indexes: {e}")
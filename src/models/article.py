@@ -1,5 +1,5 @@
 from bson.objectid import ObjectId
-from datetime import datetime
+from datetime import datetime, timezone
 
 class Article:
     """
@@ -9,7 +9,7 @@ class Article:
         - title: The title of the article
         - image: The filename of the article's main image
         - sports_type: The specific sport category
-        - published_at: The publication date
+        - published_at: The publication date (UTC datetime)
         - url: The URL to the full article
         - slug: Unique identifier from the source
         - created_at: When the article was added to our DB
@@ -22,7 +22,7 @@ class Article:
         self.published_at = published_at
         self.url = url
         self.slug = slug
-        self.created_at = created_at if created_at else datetime.now()
+        self.created_at = created_at if created_at else datetime.now(timezone.utc)
 
     def to_dict(self):
         """
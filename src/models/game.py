@@ -1,10 +1,36 @@
 from bson.objectid import ObjectId
 
+# Marks a nested field that has not been decoded yet
+_UNDECODED = object()
+
+
+def _field(name):
+    """
+    A read-only attribute backed by a key of the underlying document.
+    """
+    return property(lambda self: self._data.get(name))
+
+
+def _decode(value):
+    """
+    Converts raw BSON sub-documents (e.g. RawBSONDocument) into plain dicts and
+    lists; plain values are returned unchanged.
+    """
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if hasattr(value, "raw"):
+        return {key: _decode(item) for key, item in value.items()}
+    return value
+
 
 class Game:
     """
     A model representing a game.
 
+    A game is a thin view over its MongoDB document: attributes read straight
+    from the document instead of being copied, and the nested `box_score` and
+    `score_breakdown` are only decoded the first time they are accessed.
+
     Attributes:
         - `city`            The city of the game.
         - `date`            The date of the game.
@@ -18,8 +44,13 @@ class Game:
         - `box_score`       The scoring summary of the game (optional)
         - `score_breakdown` The scoring breakdown of the game (optional)
         - 'ticket_link'    The ticket link for the game (optional)
+        - `outcome`         "W", "L" or "T", parsed from the result (optional)
+        - `cornell_score`   Cornell's final score, parsed from the result (optional)
+        - `opponent_score`  The opponent's final score, parsed from the result (optional)
     """
 
+    __slots__ = ("_data", "_box_score", "_score_breakdown")
+
     def __init__(
         self,
         city,
@@ -37,22 +68,67 @@ class Game:
         team=None,
         utc_date=None,
         ticket_link=None,
+        outcome=None,
+        cornell_score=None,
+        opponent_score=None,
     ):
-        self.id = id if id else str(ObjectId())
-        self.city = city
-        self.date = date
-        self.gender = gender
-        self.location = location
-        self.opponent_id = opponent_id
-        self.result = result
-        self.sport = sport
-        self.state = state
-        self.time = time
-        self.box_score = box_score
-        self.score_breakdown = score_breakdown
-        self.team = team
-        self.utc_date = utc_date
-        self.ticket_link = ticket_link
+        self._data = {
+            "_id": id if id else str(ObjectId()),
+            "city": city,
+            "date": date,
+            "gender": gender,
+            "location": location,
+            "opponent_id": opponent_id,
+            "result": result,
+            "sport": sport,
+            "state": state,
+            "time": time,
+            "box_score": box_score,
+            "score_breakdown": score_breakdown,
+            "team": team,
+            "utc_date": utc_date,
+            "ticket_link": ticket_link,
+            "outcome": outcome,
+            "cornell_score": cornell_score,
+            "opponent_score": opponent_score,
+        }
+        self._box_score = box_score
+        self._score_breakdown = score_breakdown
+
+    id = _field("_id")
+    city = _field("city")
+    date = _field("date")
+    gender = _field("gender")
+    location = _field("location")
+    opponent_id = _field("opponent_id")
+    result = _field("result")
+    sport = _field("sport")
+    state = _field("state")
+    time = _field("time")
+    team = _field("team")
+    utc_date = _field("utc_date")
+    ticket_link = _field("ticket_link")
+    outcome = _field("outcome")
+    cornell_score = _field("cornell_score")
+    opponent_score = _field("opponent_score")
+    # The opponent's team document, when the game was loaded with a team join
+    joined_team = _field("joined_team")
+
+    @property
+    def is_team_joined(self):
+        return "joined_team" in self._data
+
+    @property
+    def box_score(self):
+        if self._box_score is _UNDECODED:
+            self._box_score = _decode(self._data.get("box_score"))
+        return self._box_score
+
+    @property
+    def score_breakdown(self):
+        if self._score_breakdown is _UNDECODED:
+            self._score_breakdown = _decode(self._data.get("score_breakdown"))
+        return self._score_breakdown
 
     def to_dict(self):
         """
@@ -74,27 +150,18 @@ class Game:
             "team": self.team,
             "utc_date": self.utc_date,
             "ticket_link": self.ticket_link,
+            "outcome": self.outcome,
+            "cornell_score": self.cornell_score,
+            "opponent_score": self.opponent_score,
         }
 
     @staticmethod
     def from_dict(data) -> None:
         """
-        Converts a MongoDB document to a Game object.
+        Wraps a MongoDB document in a Game object without copying it.
         """
-        return Game(
-            id=data.get("_id"),
-            city=data.get("city"),
-            date=data.get("date"),
-            gender=data.get("gender"),
-            location=data.get("location"),
-            opponent_id=data.get("opponent_id"),
-            result=data.get("result"),
-            sport=data.get("sport"),
-            state=data.get("state"),
-            time=data.get("time"),
-            box_score=data.get("box_score"),
-            score_breakdown=data.get("score_breakdown"),
-            team=data.get("team"),
-            utc_date=data.get("utc_date"),
-            ticket_link=data.get("ticket_link"),
-        )
+        game = Game.__new__(Game)
+        game._data = data
+        game._box_score = _UNDECODED
+        game._score_breakdown = _UNDECODED
+        return game
@@ -13,10 +13,11 @@ class YoutubeVideo:
         - `url`             The URL of the video.
         - `published_at`    The date and time the video was published.
         - `duration`        The duration of the video.
+        - `sports_type`     The sport classified from the title at ingest time.
     """
 
     def __init__(
-        self, title, description, thumbnail, b64_thumbnail, url, published_at, duration=None, id=None
+        self, title, description, thumbnail, b64_thumbnail, url, published_at, duration=None, id=None, sports_type=None
     ):
         self.id = id if id else str(ObjectId())
         self.title = title
@@ -26,6 +27,7 @@ class YoutubeVideo:
         self.url = url
         self.published_at = published_at
         self.duration = duration
+        self.sports_type = sports_type
 
     def to_dict(self):
         """
@@ -40,6 +42,7 @@ class YoutubeVideo:
             "url": self.url,
             "published_at": self.published_at,
             "duration": self.duration,
+            "sports_type": self.sports_type,
         }
 
     @staticmethod
@@ -56,4 +59,5 @@ class YoutubeVideo:
             url=data.get("url"),
             published_at=data.get("published_at"),
             duration=data.get("duration"),
+            sports_type=data.get("sports_type"),
         )
@@ -1,10 +1,8 @@
-from bson import ObjectId
 from graphql import GraphQLError
 from graphene import Mutation, String, Boolean
 
 from flask_jwt_extended import get_jwt_identity, jwt_required
-from src.database import db
-from src.services.game_service import GameService
+from src.services.favorite_service import FavoriteService
 
 
 class AddFavoriteGame(Mutation):
@@ -15,11 +13,7 @@ class AddFavoriteGame(Mutation):
 
     @jwt_required()
     def mutate(self, info, game_id):
-        if not GameService.get_game_by_id(game_id):
-            raise GraphQLError("Game not found.")
         user_id = get_jwt_identity()
-        db["users"].update_one(
-            {"_id": ObjectId(user_id)},
-            {"$addToSet": {"favorite_game_ids": game_id}},
-        )
+        if not FavoriteService.add_favorite_game(user_id, game_id):
+            raise GraphQLError("Game not found.")
         return AddFavoriteGame(success=True)
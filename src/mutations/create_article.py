@@ -1,6 +1,7 @@
 from graphene import Mutation, String, Field
 from src.types import ArticleType
 from src.services.article_service import ArticleService
+from src.utils.convert_to_utc import parse_utc_iso
 
 class CreateArticle(Mutation):
     class Arguments:
@@ -17,7 +18,7 @@ class CreateArticle(Mutation):
         article_data = {
             "title": title,
             "sports_type": sports_type,
-            "published_at": published_at,  # Already in ISO 8601 format
+            "published_at": parse_utc_iso(published_at),
             "url": url,
             "slug": slug,
             "image": image
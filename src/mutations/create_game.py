@@ -1,6 +1,7 @@
 from graphene import Mutation, String, Field
 from src.types import GameType
 from src.services import GameService
+from src.utils.convert_to_utc import parse_utc_iso
 
 
 class CreateGame(Mutation):
@@ -50,7 +51,7 @@ class CreateGame(Mutation):
             "time": time,
             "box_score": box_score,
             "score_breakdown": score_breakdown,
-            "utc_date": utc_date,
+            "utc_date": parse_utc_iso(utc_date),
             "ticket_link": ticket_link
         }
         new_game = GameService.create_game(game_data)
@@ -4,6 +4,7 @@ from graphene import Mutation, Boolean
 
 from flask_jwt_extended import get_jwt, jwt_required
 from src.database import db
+from src.utils.token_blocklist import token_blocklist
 
 
 class LogoutUser(Mutation):
@@ -15,5 +16,11 @@ class LogoutUser(Mutation):
         jti = token["jti"]
         exp = token["exp"]
         expires_at = datetime.fromtimestamp(exp, tz=timezone.utc)
-        db["token_blocklist"].insert_one({"jti": jti, "expires_at": expires_at})
+        # Insert only if absent, so logging out twice with the same token is a no-op
+        db["token_blocklist"].update_one(
+            {"jti": jti},
+            {"$setOnInsert": {"jti": jti, "expires_at": expires_at}},
+            upsert=True,
+        )
+        token_blocklist.add(jti, expires_at)
         return LogoutUser(success=True)
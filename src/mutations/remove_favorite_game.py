@@ -1,8 +1,7 @@
-from bson import ObjectId
 from graphene import Mutation, String, Boolean
 
 from flask_jwt_extended import get_jwt_identity, jwt_required
-from src.database import db
+from src.services.favorite_service import FavoriteService
 
 
 class RemoveFavoriteGame(Mutation):
@@ -14,8 +13,5 @@ class RemoveFavoriteGame(Mutation):
     @jwt_required()
     def mutate(self, info, game_id):
         user_id = get_jwt_identity()
-        db["users"].update_one(
-            {"_id": ObjectId(user_id)},
-            {"$pull": {"favorite_game_ids": game_id}},
-        )
+        FavoriteService.remove_favorite_game(user_id, game_id)
         return RemoveFavoriteGame(success=True)
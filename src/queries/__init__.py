@@ -1,4 +1,7 @@
 from .game_query import GameQuery
 from .team_query import TeamQuery
 from .youtube_video_query import YoutubeVideoQuery
-from .article_query import ArticleQuery
\ No newline at end of file
+from .article_query import ArticleQuery
+from .feed_query import FeedQuery
+from .archive_query import ArchiveQuery
+from .season_record_query import SeasonRecordQuery
@@ -0,0 +1,41 @@
+from graphene import ObjectType, String, List, Int
+from src.queries.game_query import game_list_fields
+from src.services.game_archive_service import GameArchiveService
+from src.types import ArchivedSeasonType, GameType
+
+
+class ArchiveQuery(ObjectType):
+    archived_games = List(
+        GameType,
+        season=String(required=True, description='The season, e.g. "2023-24"'),
+        sport=String(required=False),
+        gender=String(required=False),
+        limit=Int(default_value=100, description="Number of games to return"),
+        offset=Int(default_value=0, description="Number of games to skip"),
+        description="Games of a completed past season, in date order.",
+    )
+    archived_seasons = List(
+        ArchivedSeasonType,
+        sport=String(required=False),
+        gender=String(required=False),
+        description="The archived seasons of every sport and gender, newest first.",
+    )
+
+    def resolve_archived_games(self, info, season, sport=None, gender=None, limit=100, offset=0):
+        """
+        Resolver for browsing the archived games of a past season.
+        """
+        return GameArchiveService.get_archived_games(
+            season,
+            sport=sport,
+            gender=gender,
+            limit=limit,
+            offset=offset,
+            **game_list_fields(info),
+        )
+
+    def resolve_archived_seasons(self, info, sport=None, gender=None):
+        """
+        Resolver for the seasons available in the archive.
+        """
+        return GameArchiveService.get_archived_seasons(sport=sport, gender=gender)
@@ -0,0 +1,19 @@
+from graphene import ObjectType, String, Field, Int
+from src.services.feed_service import FeedService
+from src.types import FeedType
+
+
+class FeedQuery(ObjectType):
+    feed = Field(
+        FeedType,
+        sport=String(required=False),
+        gender=String(required=False),
+        limit=Int(required=False, description="Number of upcoming and recent games to return"),
+        description="Upcoming games and recent results, across all sports or for one sport and gender.",
+    )
+
+    def resolve_feed(self, info, sport=None, gender=None, limit=None):
+        """
+        Resolver for the materialized feed of upcoming games and recent results.
+        """
+        return FeedService.get_feed(sport, gender, limit)
@@ -1,9 +1,24 @@
-from bson import ObjectId
 from flask_jwt_extended import get_jwt_identity, jwt_required
 from graphene import ObjectType, String, Field, List, Int, DateTime
-from src.database import db
+from src.services.favorite_service import FavoriteService
 from src.services.game_service import GameService
 from src.types import GameType
+from src.utils.selection import fields_of, get_selection
+
+# Document fields read by GameType resolvers beyond the field itself
+GAME_FIELD_DEPENDENCIES = {"team": ["team", "opponent_id"]}
+
+
+def game_list_fields(info):
+    """
+    Returns the `fields` to load for a game list query and, when the client
+    selected `team`, the `team_fields` to join into each game in the same query.
+    """
+    selection = get_selection(info)
+    return {
+        "fields": fields_of(selection, GAME_FIELD_DEPENDENCIES),
+        "team_fields": fields_of(selection["team"]) if "team" in selection else None,
+    }
 
 
 class GameQuery(ObjectType):
@@ -30,24 +45,31 @@ class GameQuery(ObjectType):
         GameType, sport=String(required=True), gender=String(required=True)
     )
     games_by_date = List(GameType, startDate=DateTime(required=True), endDate=DateTime(required=True))
-    my_favorited_games = List(GameType, description="Current user's favorited games (requires auth).")
+    my_favorited_games = List(
+        GameType,
+        limit=Int(required=False, description="Number of games to return"),
+        offset=Int(default_value=0, description="Number of games to skip"),
+        description="Current user's favorited games, upcoming games first (requires auth).",
+    )
 
     @jwt_required()
-    def resolve_my_favorited_games(self, info):
+    def resolve_my_favorited_games(self, info, limit=None, offset=0):
+        """
+        Resolver for the current user's favorited games, upcoming games first.
+        """
         user_id = get_jwt_identity()
-        user = db["users"].find_one({"_id": ObjectId(user_id)})
-        if not user:
-            return []
-        favorite_ids = user.get("favorite_game_ids") or []
-        if not favorite_ids:
-            return []
-        return GameService.get_games_by_ids(favorite_ids)
+        return FavoriteService.get_favorite_games(
+            user_id,
+            limit=limit,
+            offset=offset,
+            include_box_score="boxScore" in get_selection(info),
+        )
 
     def resolve_games(self, info, limit=100, offset=0):
         """
         Resolver for retrieving all games with pagination.
         """
-        return GameService.get_all_games(limit=limit, offset=offset)
+        return GameService.get_all_games(limit=limit, offset=offset, **game_list_fields(info))
 
     def resolve_game(self, info, id):
         """
@@ -69,22 +91,22 @@ class GameQuery(ObjectType):
         """
         Resolver for retrieving all games by its sport.
         """
-        return GameService.get_games_by_sport(sport)
+        return GameService.get_games_by_sport(sport, **game_list_fields(info))
 
     def resolve_games_by_gender(self, info, gender):
         """
         Resolver for retrieving all games by its gender.
         """
-        return GameService.get_games_by_gender(gender)
+        return GameService.get_games_by_gender(gender, **game_list_fields(info))
 
     def resolve_games_by_sport_gender(self, info, sport, gender):
         """
         Resolver for retrieving all games by its sport and gender.
         """
-        return GameService.get_games_by_sport_gender(sport, gender)
+        return GameService.get_games_by_sport_gender(sport, gender, **game_list_fields(info))
     
     def resolve_games_by_date(self, info, startDate, endDate):
         """
         Resolver for retrieving games by date.
         """
-        return GameService.get_games_by_date(startDate, endDate)
+        return GameService.get_games_by_date(startDate, endDate, **game_list_fields(info))
@@ -0,0 +1,19 @@
+from graphene import ObjectType, String, Field
+from src.services.season_record_service import SeasonRecordService
+from src.types import SeasonRecordType
+
+
+class SeasonRecordQuery(ObjectType):
+    season_record = Field(
+        SeasonRecordType,
+        sport=String(required=True),
+        gender=String(required=True),
+        season=String(required=False, description='The season, e.g. "2024-25"; defaults to the current one'),
+        description="Cornell's win-loss-tie record over a season, with home/away splits and the current streak.",
+    )
+
+    def resolve_season_record(self, info, sport, gender, season=None):
+        """
+        Resolver for the precomputed record of a sport and gender over a season.
+        """
+        return SeasonRecordService.get_record(sport, gender, season)
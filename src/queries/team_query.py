@@ -1,6 +1,7 @@
 from graphene import ObjectType, String, Field, List
 from src.services.team_service import TeamService
 from src.types import TeamType
+from src.utils.selection import selected_fields
 
 
 class TeamQuery(ObjectType):
@@ -12,7 +13,7 @@ class TeamQuery(ObjectType):
         """
         Resolver for retrieving all teams.
         """
-        return TeamService.get_all_teams()
+        return TeamService.get_all_teams(fields=selected_fields(info))
 
     def resolve_team(self, info, id):
         """
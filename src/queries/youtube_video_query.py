@@ -1,16 +1,20 @@
 from graphene import ObjectType, String, Field, List
 from src.services.youtube_video_service import YoutubeVideoService
 from src.types import YoutubeVideoType
+from src.utils.selection import selected_fields
 
 class YoutubeVideoQuery(ObjectType):
-    youtube_videos = List(YoutubeVideoType)
+    youtube_videos = List(YoutubeVideoType, sports_type=String())
     youtube_video = Field(YoutubeVideoType, id=String(required=True))
 
-    def resolve_youtube_videos(self, info):
+    def resolve_youtube_videos(self, info, sports_type=None):
         """
-        Resolver for retrieving all YouTube videos.
+        Resolver for retrieving all YouTube videos, optionally filtered by sports_type.
         """
-        return YoutubeVideoService.get_all_videos()
+        fields = selected_fields(info)
+        if sports_type:
+            return YoutubeVideoService.get_videos_by_sports_type(sports_type, fields=fields)
+        return YoutubeVideoService.get_all_videos(fields=fields)
 
     def resolve_youtube_video(self, info, id):
         """
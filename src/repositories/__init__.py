@@ -1,4 +1,12 @@
 from .game_repository import GameRepository
 from .team_repository import TeamRepository
 from .youtube_video_repository import YoutubeVideoRepository
-from .article_repository import ArticleRepository
\ No newline at end of file
+from .article_repository import ArticleRepository
+from .sync_state_repository import SyncStateRepository
+from .favorite_repository import FavoriteRepository
+from .feed_repository import FeedRepository
+from .generation_repository import GenerationRepository
+from .game_change_repository import GameChangeRepository
+from .scrape_run_repository import ScrapeRunRepository
+from .game_archive_repository import GameArchiveRepository
+from .season_record_repository import SeasonRecordRepository
@@ -1,7 +1,8 @@
-from src.database import daily_sun_db
+from src.database import daily_sun_db, get_read_collection
 from src.models.article import Article
+from src.repositories.generation_repository import GenerationRepository
+from src.utils.query_filters import recent_articles_filter, stale_articles_filter
 from pymongo import UpdateOne
-from datetime import datetime, timedelta, timezone
 
 class ArticleRepository:
     @staticmethod
@@ -14,11 +15,12 @@ class ArticleRepository:
         # Remove _id from the update to avoid MongoDB error
         article_dict.pop("_id", None)
         
-        article_collection.update_one(
+        result = article_collection.update_one(
             {"slug": article.slug},
             {"$set": article_dict},
             upsert=True
         )
+        GenerationRepository.increment_if_changed("news_articles", result)
 
     @staticmethod
     def bulk_upsert(articles):
@@ -44,18 +46,16 @@ class ArticleRepository:
             )
         
         if operations:
-            article_collection.bulk_write(operations)
+            result = article_collection.bulk_write(operations)
+            GenerationRepository.increment_if_changed("news_articles", result)
 
     @staticmethod
     def find_recent(limit_days=3):
         """
         Retrieve articles from the last N days, sorted by published_at descending.
         """
-        article_collection = daily_sun_db["news_articles"]
-        # Calculate threshold as ISO 8601 string
-        threshold = (datetime.now(timezone.utc) - timedelta(days=limit_days)).isoformat().replace('+00:00', 'Z')
-        query = {"published_at": {"$gte": threshold}}
-        articles = article_collection.find(query).sort("published_at", -1)
+        article_collection = get_read_collection("news_articles", daily_sun_db)
+        articles = article_collection.find(recent_articles_filter(limit_days)).sort("published_at", -1)
         return [Article.from_dict(article) for article in articles]
 
     @staticmethod
@@ -63,14 +63,10 @@ class ArticleRepository:
         """
         Retrieve articles by sports_type from the last N days, sorted by published_at descending.
         """
-        article_collection = daily_sun_db["news_articles"]
-        # Calculate threshold as ISO 8601 string
-        threshold = (datetime.now(timezone.utc) - timedelta(days=limit_days)).isoformat().replace('+00:00', 'Z')
-        query = {
-            "sports_type": sports_type,
-            "published_at": {"$gte": threshold}
-        }
-        articles = article_collection.find(query).sort("published_at", -1)
+        article_collection = get_read_collection("news_articles", daily_sun_db)
+        articles = article_collection.find(
+            {"sports_type": sports_type, **recent_articles_filter(limit_days)}
+        ).sort("published_at", -1)
         return [Article.from_dict(article) for article in articles]
     
     @staticmethod
@@ -79,7 +75,5 @@ class ArticleRepository:
         Delete articles older than N days, sorted by published_at descending.
         """
         article_collection = daily_sun_db["news_articles"]
-        # Calculate threshold as ISO 8601 string
-        threshold = (datetime.now(timezone.utc) - timedelta(days=limit_days)).isoformat().replace('+00:00', 'Z')
-        query = {"published_at": {"$lt": threshold}}
-        article_collection.delete_many(query)
\ No newline at end of file
+        result = article_collection.delete_many(stale_articles_filter(limit_days))
+        GenerationRepository.increment_if_changed("news_articles", result)
\ No newline at end of file
@@ -0,0 +1,57 @@
+from bson import ObjectId
+from src.database import db
+from src.repositories.generation_repository import GenerationRepository
+
+
+class FavoriteRepository:
+    @staticmethod
+    def find_game_ids(user_id):
+        """
+        Fetch the IDs of a user's favorited games, reading only that field of
+        the user document.
+
+        Args:
+            user_id (str): The ID of the user.
+
+        Returns:
+            List[str]: The favorited game IDs, or None if the user does not exist.
+        """
+        user_collection = db["users"]
+        user = user_collection.find_one(
+            {"_id": ObjectId(user_id)}, {"favorite_game_ids": 1}
+        )
+        if not user:
+            return None
+        return user.get("favorite_game_ids") or []
+
+    @staticmethod
+    def add_game(user_id, game_id):
+        """
+        Add a game to a user's favorites.
+
+        Args:
+            user_id (str): The ID of the user.
+            game_id (str): The ID of the game to add.
+        """
+        user_collection = db["users"]
+        result = user_collection.update_one(
+            {"_id": ObjectId(user_id)},
+            {"$addToSet": {"favorite_game_ids": game_id}},
+        )
+        GenerationRepository.increment_if_changed("users", result)
+
+    @staticmethod
+    def remove_game(user_id, game_id):
+        """
+        Remove a game from a user's favorites.
+
+        Args:
+            user_id (str): The ID of the user.
+            game_id (str): The ID of the game to remove.
+        """
+        user_collection = db["users"]
+        result = user_collection.update_one(
+            {"_id": ObjectId(user_id)},
+            {"$pull": {"favorite_game_ids": game_id}},
+        )
+        GenerationRepository.increment_if_changed("users", result)
@@ -0,0 +1,39 @@
+from src.database import db, get_read_collection
+from src.repositories.generation_repository import GenerationRepository
+
+
+class FeedRepository:
+    @staticmethod
+    def find_by_key(key):
+        """
+        Fetch a materialized feed document by its key.
+
+        Args:
+            key (str): "sport|gender" for a single sport, or "all".
+
+        Returns:
+            dict: The feed document or None if it was never built.
+        """
+        feed_collection = get_read_collection("game_feed")
+        return feed_collection.find_one({"_id": key})
+
+    @staticmethod
+    def find_sport_feeds():
+        """
+        Fetch the feed documents of every sport/gender.
+        """
+        feed_collection = db["game_feed"]
+        return list(feed_collection.find({"_id": {"$ne": "all"}}))
+
+    @staticmethod
+    def replace(key, feed):
+        """
+        Replace (or create) a materialized feed document.
+
+        Args:
+            key (str): "sport|gender" for a single sport, or "all".
+            feed (dict): The feed document, without its _id.
+        """
+        feed_collection = db["game_feed"]
+        result = feed_collection.replace_one({"_id": key}, feed, upsert=True)
+        GenerationRepository.increment_if_changed("game_feed", result)
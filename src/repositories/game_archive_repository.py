@@ -0,0 +1,117 @@
+from pymongo import ReplaceOne
+from src.database import db, get_list_collection, get_read_collection
+from src.models.game import Game
+from src.repositories.game_repository import find_games
+from src.repositories.generation_repository import GenerationRepository
+from src.utils.query_filters import RESULT_FIELDS, archive_season_filter
+
+
+class GameArchiveRepository:
+    """
+    Games of completed past seasons, moved out of the 'game' collection. Each
+    archived game is its original document plus a `season` label, e.g. "2023-24".
+    """
+
+    @staticmethod
+    def upsert_many(games, season_of):
+        """
+        Store games in the 'game_archive' collection, replacing any earlier copy,
+        so an interrupted archive run can simply be repeated.
+
+        Args:
+            games (List[Game]): The games to archive.
+            season_of (callable): Returns the season label of a game's utc_date.
+        """
+        if not games:
+            return
+        archive_collection = db["game_archive"]
+        requests = []
+        for game in games:
+            document = game.to_dict()
+            document["season"] = season_of(game.utc_date)
+            requests.append(ReplaceOne({"_id": game.id}, document, upsert=True))
+        result = archive_collection.bulk_write(requests, ordered=False)
+        GenerationRepository.increment_if_changed("game_archive", result)
+
+    @staticmethod
+    def find_by_season(
+        season, sport=None, gender=None, limit=100, offset=0, fields=None, team_fields=None
+    ):
+        """
+        Retrieve the archived games of a season, optionally of one sport and
+        gender, in date order. Only `fields` are loaded when given, and the team
+        is joined when `team_fields` is given.
+        """
+        archive_collection = get_list_collection("game_archive")
+        return find_games(
+            archive_collection,
+            archive_season_filter(season, sport, gender),
+            fields,
+            team_fields,
+            sort=[("utc_date", 1)],
+            skip=offset,
+            limit=limit,
+        )
+
+    @staticmethod
+    def find_results_by_season(sport, gender, season):
+        """
+        Retrieve the outcome, final score, city and date of the archived games
+        of a sport, gender and season, in date order.
+        """
+        archive_collection = db["game_archive"]
+        games = archive_collection.find(
+            archive_season_filter(season, sport, gender), RESULT_FIELDS
+        ).sort("utc_date", 1)
+        return [Game.from_dict(game) for game in games]
+
+    @staticmethod
+    def find_seasons(sport=None, gender=None):
+        """
+        Summarize the archive: the number of games of every season, sport and
+        gender, newest season first.
+
+        Returns:
+            list: Dicts with `season`, `sport`, `gender` and `game_count`.
+        """
+        archive_collection = get_read_collection("game_archive")
+        match = {}
+        if sport:
+            match["sport"] = sport
+        if gender:
+            match["gender"] = gender
+        summaries = archive_collection.aggregate(
+            [
+                {"$match": match},
+                {
+                    "$group": {
+                        "_id": {"season": "$season", "sport": "$sport", "gender": "$gender"},
+                        "game_count": {"$sum": 1},
+                    }
+                },
+                {"$sort": {"_id.season": -1, "_id.sport": 1, "_id.gender": 1}},
+            ]
+        )
+        return [{**summary["_id"], "game_count": summary["game_count"]} for summary in summaries]
+
+    @staticmethod
+    def find_by_id(game_id):
+        """
+        Fetch an archived game by its ID, or None if it is not archived.
+        """
+        archive_collection = get_read_collection("game_archive")
+        game_data = archive_collection.find_one({"_id": game_id})
+        return Game.from_dict(game_data) if game_data else None
+
+    @staticmethod
+    def find_by_ids(game_ids, include_box_score=True):
+        """
+        Fetch archived games by a list of IDs.
+        The box score can be left out when the caller does not need it.
+        """
+        if not game_ids:
+            return []
+        archive_collection = get_read_collection("game_archive")
+        projection = None if include_box_score else {"box_score": 0}
+        cursor = archive_collection.find({"_id": {"$in": game_ids}}, projection)
+        return [Game.from_dict(game) for game in cursor]
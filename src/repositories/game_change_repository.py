@@ -0,0 +1,61 @@
+from pymongo import CursorType
+from pymongo.errors import CollectionInvalid
+from src.database import db
+
+# Size in bytes of the capped change feed; the oldest changes are overwritten
+GAME_CHANGES_SIZE = 16 * 1024 * 1024
+
+
+class GameChangeRepository:
+    """
+    The `game_changes` capped collection: an append-only feed of live score
+    changes written by the scraper and tailed by the API processes.
+    """
+
+    @staticmethod
+    def ensure_collection():
+        """
+        Create the capped collection if it does not exist yet.
+        """
+        try:
+            db.create_collection("game_changes", capped=True, size=GAME_CHANGES_SIZE)
+        except CollectionInvalid:
+            pass
+
+    @staticmethod
+    def insert(change):
+        """
+        Append a change to the feed.
+
+        Args:
+            change (dict): The change document.
+        """
+        change_collection = db["game_changes"]
+        change_collection.insert_one(change)
+
+    @staticmethod
+    def find_latest_id():
+        """
+        Retrieve the _id of the newest change, or None if the feed is empty.
+        """
+        change_collection = db["game_changes"]
+        change = change_collection.find_one({}, {"_id": 1}, sort=[("$natural", -1)])
+        return change["_id"] if change else None
+
+    @staticmethod
+    def find_after(after_id):
+        """
+        Retrieve the changes after `after_id`, oldest first.
+        """
+        change_collection = db["game_changes"]
+        return list(change_collection.find({"_id": {"$gt": after_id}}).sort("$natural", 1))
+
+    @staticmethod
+    def tail(after_id=None):
+        """
+        Open a tailable cursor over the changes after `after_id`, which blocks
+        briefly waiting for new changes instead of ending.
+        """
+        change_collection = db["game_changes"]
+        query = {"_id": {"$gt": after_id}} if after_id else {}
+        return change_collection.find(query, cursor_type=CursorType.TAILABLE_AWAIT)
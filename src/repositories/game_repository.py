@@ -1,5 +1,14 @@
-from src.database import db
+from src.database import db, get_list_collection, get_read_collection
 from src.models.game import Game
+from src.repositories.generation_repository import GenerationRepository
+from src.utils.query_filters import (
+    RESULT_FIELDS,
+    date_range_filter,
+    game_key_filter,
+    sport_gender_filter,
+    tournament_key_filter,
+)
+from src.utils.selection import projection
 
 import threading
 import logging
@@ -11,11 +20,66 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def find_games(collection, query, fields=None, team_fields=None, sort=None, skip=0, limit=0):
+    """
+    Runs a game list query, loading only `fields` when given.
+
+    When `team_fields` is given, the opponent's team is joined in the same
+    round trip with a `$lookup` on the team's _id, projected to `team_fields`
+    and embedded as `joined_team` (None if the team does not exist).
+
+    Args:
+        collection: The game (or game archive) collection.
+        query (dict): The filter.
+        fields (list): The game fields to load, or None for all of them.
+        team_fields (list): The team fields to join, or None for no join.
+        sort (list): (field, direction) pairs to sort by. (optional)
+        skip (int): Number of games to skip.
+        limit (int): Maximum number of games to return, 0 for no limit.
+
+    Returns:
+        list: The games.
+    """
+    if team_fields is None:
+        cursor = collection.find(query, projection(fields))
+        if sort:
+            cursor = cursor.sort(sort)
+        return [Game.from_dict(game) for game in cursor.skip(skip).limit(limit)]
+
+    pipeline = [{"$match": query}]
+    if sort:
+        pipeline.append({"$sort": dict(sort)})
+    if skip:
+        pipeline.append({"$skip": skip})
+    if limit:
+        pipeline.append({"$limit": limit})
+    if fields:
+        pipeline.append({"$project": projection(fields)})
+    pipeline += [
+        {
+            "$lookup": {
+                "from": "team",
+                # Older games reference their team in `team` instead of `opponent_id`
+                "let": {"team_id": {"$ifNull": ["$team", "$opponent_id"]}},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$_id", "$$team_id"]}}},
+                    {"$project": projection(team_fields)},
+                ],
+                "as": "joined_team",
+            }
+        },
+        {"$addFields": {"joined_team": {"$ifNull": [{"$arrayElemAt": ["$joined_team", 0]}, None]}}},
+    ]
+    return [Game.from_dict(game) for game in collection.aggregate(pipeline)]
+
+
 class GameRepository:
     @staticmethod
-    def find_all(limit=100, offset=0):
+    def find_all(limit=100, offset=0, fields=None, team_fields=None):
         """
         Retrieve all games from the 'game' collection in MongoDB with pagination.
+        Only `fields` are loaded when given, and the team is joined when
+        `team_fields` is given.
         """
         request_id = id(threading.current_thread())  # Get a unique ID for this request
         logger.info(
@@ -23,20 +87,13 @@ class GameRepository:
         )
 
         try:
-            game_collection = db["game"]
+            game_collection = get_list_collection("game")
             logger.info(f"Request {request_id}: Connected to game collection")
 
-            cursor = game_collection.find().skip(offset).limit(limit)
-            logger.info(f"Request {request_id}: Created cursor")
-
-            # Force MongoDB to actually perform the query
-            games_list = list(cursor)
-            logger.info(f"Request {request_id}: Retrieved {len(games_list)} games")
-
-            result = [Game.from_dict(game) for game in games_list]
-            logger.info(
-                f"Request {request_id}: Converted to {len(result)} Game objects"
+            result = find_games(
+                game_collection, {}, fields, team_fields, skip=offset, limit=limit
             )
+            logger.info(f"Request {request_id}: Retrieved {len(result)} games")
 
             return result
         except Exception as e:
@@ -54,7 +111,7 @@ class GameRepository:
         Returns:
             Game: The retrieved game or None if not found.
         """
-        game_collection = db["game"]
+        game_collection = get_read_collection("game")
         game_data = game_collection.find_one({"_id": game_id})
         return Game.from_dict(game_data) if game_data else None
 
@@ -64,7 +121,8 @@ class GameRepository:
         Inserts a new game into the 'games' collection in MongoDB.
         """
         game_collection = db["game"]
-        game_collection.insert_one(game.to_dict())
+        result = game_collection.insert_one(game.to_dict())
+        GenerationRepository.increment_if_changed("game", result)
 
     @staticmethod
     def delete_by_id(game_id):
@@ -72,15 +130,21 @@ class GameRepository:
         Delete a game from the MongoDB collection by its ID.
         """
         game_collection = db["game"]
-        game_collection.delete_one({"_id": game_id})
+        result = game_collection.delete_one({"_id": game_id})
+        GenerationRepository.increment_if_changed("game", result)
 
     @staticmethod
     def update_by_id(game_id, data):
         """
         Update a game in the MongoDB collection by its ID.
+
+        Returns:
+            bool: Whether any field actually changed.
         """
         game_collection = db["game"]
-        game_collection.update_one({"_id": game_id}, {"$set": data})
+        result = game_collection.update_one({"_id": game_id}, {"$set": data})
+        GenerationRepository.increment_if_changed("game", result)
+        return result.modified_count > 0
 
     @staticmethod
     def find_by_data(city, date, gender, location, opponent_id, sport, state, time):
@@ -90,13 +154,7 @@ class GameRepository:
         game_collection = db["game"]
         game_data = game_collection.find_one(
             {
-                "city": city,
-                "date": date,
-                "gender": gender,
-                "location": location,
-                "opponent_id": opponent_id,
-                "sport": sport,
-                "state": state,
+                **game_key_filter(city, date, gender, location, opponent_id, sport, state),
                 "time": time,
             }
         )
@@ -110,15 +168,7 @@ class GameRepository:
         game_collection = db["game"]
         games = list(
             game_collection.find(
-                {
-                    "city": city,
-                    "date": date,
-                    "gender": gender,
-                    "location": location,
-                    "opponent_id": opponent_id,
-                    "sport": sport,
-                    "state": state,
-                }
+                game_key_filter(city, date, gender, location, opponent_id, sport, state)
             )
         )
 
@@ -138,38 +188,7 @@ class GameRepository:
         Uses flexible matching to handle TBD/TBA values.
         """
         game_collection = db["game"]
-        
-        # Build flexible query that can handle TBD/TBA values
-        query = {
-            "date": date,
-            "gender": gender,
-            "sport": sport,
-        }
-        
-        # For city, state, and location, use flexible matching
-        # This allows finding games even when TBD/TBA values change to real values
-        city_conditions = []
-        if city:
-            city_conditions.append(city)
-        else:
-            city_conditions = [None]
-        
-        state_conditions = []
-        if state:
-            state_conditions.append(state)
-        else:
-            state_conditions = [None]
-        
-        location_conditions = []
-        if location:
-            location_conditions.append(location)
-        else:
-            location_conditions = [None]
-        
-        query["city"] = {"$in": city_conditions}
-        query["state"] = {"$in": state_conditions}
-        query["location"] = {"$in": location_conditions}
-        
+        query = tournament_key_filter(city, date, gender, location, sport, state)
         games = list(game_collection.find(query))
 
         if not games:
@@ -181,31 +200,36 @@ class GameRepository:
         return [Game.from_dict(game) for game in games]
 
     @staticmethod
-    def find_by_sport(sport):
+    def find_by_sport(sport, fields=None, team_fields=None):
         """
         Retrieves all games from the MongoDB collection by its sport.
+        Only `fields` are loaded when given, and the team is joined when
+        `team_fields` is given.
         """
-        game_collection = db["game"]
-        games = game_collection.find({"sport": sport})
-        return [Game.from_dict(game) for game in games]
+        game_collection = get_list_collection("game")
+        return find_games(game_collection, {"sport": sport}, fields, team_fields)
 
     @staticmethod
-    def find_by_gender(gender):
+    def find_by_gender(gender, fields=None, team_fields=None):
         """
         Retrieve all games from the MongoDB collection by its gender.
+        Only `fields` are loaded when given, and the team is joined when
+        `team_fields` is given.
         """
-        game_collection = db["game"]
-        games = game_collection.find({"gender": gender})
-        return [Game.from_dict(game) for game in games]
+        game_collection = get_list_collection("game")
+        return find_games(game_collection, {"gender": gender}, fields, team_fields)
 
     @staticmethod
-    def find_by_sport_gender(sport, gender):
+    def find_by_sport_gender(sport, gender, fields=None, team_fields=None):
         """
         Retrieve all games from the MongoDB collection by its sport and gender.
+        Only `fields` are loaded when given, and the team is joined when
+        `team_fields` is given.
         """
-        game_collection = db["game"]
-        games = game_collection.find({"sport": sport, "gender": gender})
-        return [Game.from_dict(game) for game in games]
+        game_collection = get_list_collection("game")
+        return find_games(
+            game_collection, sport_gender_filter(sport, gender), fields, team_fields
+        )
 
     @staticmethod
     def find_games_by_sport_gender_after_date(sport, gender, after_date=None):
@@ -213,51 +237,186 @@ class GameRepository:
         Find games for a specific sport and gender, optionally after a specific date.
         This method returns raw game data without team information.
         """
-        game_collection = db["game"]
-        
-        query = {
-            "sport": sport,
-            "gender": gender
-        }
-        
-        if after_date:
-            query["utc_date"] = {"$gt": after_date}
-        
-        games = game_collection.find(query)
+        game_collection = get_read_collection("game")
+        utc_date = {"$gt": after_date} if after_date else None
+        games = game_collection.find(sport_gender_filter(sport, gender, utc_date))
         return [Game.from_dict(game) for game in games]
     
     @staticmethod
-    def find_by_date(startDate, endDate):
+    def find_upcoming_by_sport_gender(sport, gender, after_date, limit):
         """
-        Retrieve all games from the 'game' collection in MongoDB for games
-        between certain dates. 
+        Retrieve the next games of a sport and gender starting at or after a date,
+        soonest first, without their box scores.
         """
         game_collection = db["game"]
-        
-        start_str = startDate.isoformat()
-        endDate = endDate.isoformat()
-        
-        query = {
-            "utc_date": {
-                "$gte": start_str,
-                "$lte": endDate
+        games = (
+            game_collection.find(
+                sport_gender_filter(sport, gender, {"$gte": after_date}),
+                {"box_score": 0},
+            )
+            .sort("utc_date", 1)
+            .limit(limit)
+        )
+        return [Game.from_dict(game) for game in games]
+
+    @staticmethod
+    def find_recent_by_sport_gender(sport, gender, before_date, limit):
+        """
+        Retrieve the latest games of a sport and gender before a date,
+        most recent first, without their box scores.
+        """
+        game_collection = db["game"]
+        games = (
+            game_collection.find(
+                sport_gender_filter(sport, gender, {"$lt": before_date}),
+                {"box_score": 0},
+            )
+            .sort("utc_date", -1)
+            .limit(limit)
+        )
+        return [Game.from_dict(game) for game in games]
+
+    @staticmethod
+    def find_by_date(startDate, endDate, fields=None, team_fields=None):
+        """
+        Retrieve all games from the 'game' collection in MongoDB for games
+        between certain dates. Only `fields` are loaded when given, and the
+        team is joined when `team_fields` is given.
+        """
+        game_collection = get_list_collection("game")
+        return find_games(game_collection, date_range_filter(startDate, endDate), fields, team_fields)
+
+    @staticmethod
+    def find_schedule_summary(start_date, end_date, now):
+        """
+        Summarize the calendar of every sport and gender with games between two
+        dates: the start of its latest game at or before `now` and of its next
+        game after `now`.
+
+        Returns:
+            dict: A mapping of (sport, gender) to {"last_start", "next_start"},
+            either of which may be None.
+        """
+        game_collection = get_read_collection("game")
+        summaries = game_collection.aggregate(
+            [
+                {"$match": date_range_filter(start_date, end_date)},
+                {
+                    "$group": {
+                        "_id": {"sport": "$sport", "gender": "$gender"},
+                        "last_start": {
+                            "$max": {"$cond": [{"$lte": ["$utc_date", now]}, "$utc_date", None]}
+                        },
+                        "next_start": {
+                            "$min": {"$cond": [{"$gt": ["$utc_date", now]}, "$utc_date", None]}
+                        },
+                    }
+                },
+            ]
+        )
+        return {
+            (summary["_id"]["sport"], summary["_id"]["gender"]): {
+                "last_start": summary["last_start"],
+                "next_start": summary["next_start"],
             }
+            for summary in summaries
         }
-        
-        games = game_collection.find(query)
+
+    @staticmethod
+    def find_results_between(sport, gender, start_date, end_date):
+        """
+        Retrieve the outcome, final score, city and date of the games of a sport
+        and gender between two dates, in date order.
+        """
+        game_collection = db["game"]
+        games = game_collection.find(
+            sport_gender_filter(sport, gender, {"$gte": start_date, "$lt": end_date}),
+            RESULT_FIELDS,
+        ).sort("utc_date", 1)
+        return [Game.from_dict(game) for game in games]
+
+    @staticmethod
+    def find_before(before_date, limit):
+        """
+        Retrieve up to `limit` games that started before a date.
+        Games without a utc_date are never returned.
+        """
+        game_collection = db["game"]
+        games = game_collection.find({"utc_date": {"$lt": before_date}}).limit(limit)
         return [Game.from_dict(game) for game in games]
 
     @staticmethod
-    def find_by_ids(game_ids):
+    def find_by_ids(game_ids, include_box_score=True):
         """
         Fetch games from the MongoDB collection by a list of IDs.
+        The box score can be left out when the caller does not need it.
         """
         if not game_ids:
             return []
-        game_collection = db["game"]
-        cursor = game_collection.find({"_id": {"$in": game_ids}})
+        game_collection = get_read_collection("game")
+        projection = None if include_box_score else {"box_score": 0}
+        cursor = game_collection.find({"_id": {"$in": game_ids}}, projection)
         return [Game.from_dict(g) for g in cursor]
 
+    @staticmethod
+    def find_favorites(game_ids, now, limit=None, offset=0, include_box_score=True):
+        """
+        Fetch games by a list of IDs from the 'game' collection and the archive
+        in one aggregation: upcoming games first (soonest first), then past
+        games (most recent first), then games without a date. Ordering, `offset`
+        and `limit` are applied server-side; the games are matched through the
+        _id index of each collection.
+        """
+        if not game_ids or limit == 0:
+            return []
+        game_collection = get_read_collection("game")
+        match = [{"$match": {"_id": {"$in": game_ids}}}]
+        if not include_box_score:
+            match.append({"$project": {"box_score": 0}})
+
+        dated = {"$eq": [{"$type": "$utc_date"}, "date"]}
+        upcoming = {"$and": [dated, {"$gte": ["$utc_date", now]}]}
+        pipeline = match + [
+            # Favorites from past seasons have been moved to the archive
+            {"$unionWith": {"coll": "game_archive", "pipeline": match}},
+            # A game being archived may briefly be in both; keep the live copy
+            {"$group": {"_id": "$_id", "game": {"$first": "$$ROOT"}}},
+            {"$replaceRoot": {"newRoot": "$game"}},
+            {
+                "$addFields": {
+                    "_favorite_rank": {"$cond": [upcoming, 0, {"$cond": [dated, 1, 2]}]},
+                    "_favorite_order": {
+                        "$cond": [
+                            dated,
+                            {
+                                "$cond": [
+                                    upcoming,
+                                    {"$toLong": "$utc_date"},
+                                    {"$subtract": [0, {"$toLong": "$utc_date"}]},
+                                ]
+                            },
+                            0,
+                        ]
+                    },
+                }
+            },
+            {"$sort": {"_favorite_rank": 1, "_favorite_order": 1, "_id": 1}},
+        ]
+        if offset:
+            pipeline.append({"$skip": offset})
+        if limit is not None:
+            pipeline.append({"$limit": limit})
+        pipeline.append({"$project": {"_favorite_rank": 0, "_favorite_order": 0}})
+        return [Game.from_dict(game) for game in game_collection.aggregate(pipeline)]
+
+    @staticmethod
+    def exists(game_id):
+        """
+        Check whether a game exists, using only the _id index.
+        """
+        game_collection = db["game"]
+        return game_collection.find_one({"_id": game_id}, {"_id": 1}) is not None
+
     @staticmethod
     def delete_games_by_ids(game_ids):
         """
@@ -265,4 +424,5 @@ class GameRepository:
         """
         game_collection = db["game"]
         result = game_collection.delete_many({"_id": {"$in": game_ids}})
+        GenerationRepository.increment_if_changed("game", result)
         return result.deleted_count
@@ -0,0 +1,50 @@
+from src.database import db
+
+
+class GenerationRepository:
+    """
+    Per-collection generation counters, bumped whenever a write changes a
+    collection. Read queries use them to build ETags without re-running.
+    """
+
+    @staticmethod
+    def find_by_names(names):
+        """
+        Retrieve the current generation of each collection.
+
+        Args:
+            names (List[str]): The collection names.
+
+        Returns:
+            dict: A mapping of collection name to generation (0 if never written).
+        """
+        generation_collection = db["generations"]
+        generations = {name: 0 for name in names}
+        for entry in generation_collection.find({"_id": {"$in": list(names)}}):
+            generations[entry["_id"]] = entry.get("generation", 0)
+        return generations
+
+    @staticmethod
+    def increment(name):
+        """
+        Bump the generation of a collection.
+        """
+        generation_collection = db["generations"]
+        generation_collection.update_one({"_id": name}, {"$inc": {"generation": 1}}, upsert=True)
+
+    @staticmethod
+    def increment_if_changed(name, result):
+        """
+        Bump the generation of a collection if a pymongo write result reports
+        that any document was inserted, modified, upserted or deleted.
+        """
+        changed = (
+            getattr(result, "inserted_id", None) is not None
+            or getattr(result, "upserted_id", None) is not None
+            or getattr(result, "inserted_count", 0)
+            or getattr(result, "upserted_count", 0)
+            or getattr(result, "modified_count", 0)
+            or getattr(result, "deleted_count", 0)
+        )
+        if changed:
+            GenerationRepository.increment(name)
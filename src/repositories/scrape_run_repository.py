@@ -0,0 +1,43 @@
+from bson.objectid import ObjectId
+from bson.errors import InvalidId
+from src.database import db
+
+
+class ScrapeRunRepository:
+    @staticmethod
+    def insert(run):
+        """
+        Insert a scrape run into the 'scrape_runs' collection.
+
+        Args:
+            run (dict): The run document.
+
+        Returns:
+            ObjectId: The _id of the stored run.
+        """
+        run_collection = db["scrape_runs"]
+        return run_collection.insert_one(run).inserted_id
+
+    @staticmethod
+    def find_recent(limit=20, kind=None):
+        """
+        Retrieve the most recent scrape runs, newest first.
+
+        Args:
+            limit (int): Maximum number of runs to return.
+            kind (str): Only runs of this kind ("full" or "due"). (optional)
+        """
+        run_collection = db["scrape_runs"]
+        query = {"kind": kind} if kind else {}
+        return list(run_collection.find(query).sort("started_at", -1).limit(limit))
+
+    @staticmethod
+    def find_by_id(run_id):
+        """
+        Retrieve a scrape run by its ID, or None if it does not exist.
+        """
+        run_collection = db["scrape_runs"]
+        try:
+            return run_collection.find_one({"_id": ObjectId(run_id)})
+        except (InvalidId, TypeError):
+            return None
@@ -0,0 +1,31 @@
+from src.database import db, get_read_collection
+from src.repositories.generation_repository import GenerationRepository
+
+
+class SeasonRecordRepository:
+    @staticmethod
+    def find_by_key(key):
+        """
+        Fetch a season record document by its key.
+
+        Args:
+            key (str): "sport|gender|season".
+
+        Returns:
+            dict: The record document or None if it was never built.
+        """
+        record_collection = get_read_collection("season_record")
+        return record_collection.find_one({"_id": key})
+
+    @staticmethod
+    def replace(key, record):
+        """
+        Replace (or create) a season record document.
+
+        Args:
+            key (str): "sport|gender|season".
+            record (dict): The record document, without its _id.
+        """
+        record_collection = db["season_record"]
+        result = record_collection.replace_one({"_id": key}, record, upsert=True)
+        GenerationRepository.increment_if_changed("season_record", result)
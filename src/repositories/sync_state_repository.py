@@ -0,0 +1,29 @@
+from src.database import db
+
+
+class SyncStateRepository:
+    @staticmethod
+    def find_by_key(key):
+        """
+        Retrieve the stored sync state for a key (e.g. a YouTube channel).
+
+        Args:
+            key (str): The key identifying the synced source.
+
+        Returns:
+            dict: The stored state document or None if the source was never synced.
+        """
+        state_collection = db["sync_state"]
+        return state_collection.find_one({"_id": key})
+
+    @staticmethod
+    def update_by_key(key, data):
+        """
+        Create or update the sync state for a key.
+
+        Args:
+            key (str): The key identifying the synced source.
+            data (dict): The fields to set on the state document.
+        """
+        state_collection = db["sync_state"]
+        state_collection.update_one({"_id": key}, {"$set": data}, upsert=True)
@@ -1,19 +1,24 @@
-from src.database import db
+from src.database import db, get_list_collection
 from src.models.team import Team
+from src.repositories.generation_repository import GenerationRepository
 from bson.objectid import ObjectId
+from src.utils.selection import projection
 
 
 class TeamRepository:
     @staticmethod
-    def find_all():
+    def find_all(fields=None):
         """
         Retrieve all teams from the 'team' collection in MongoDB.
 
+        Args:
+            fields (List[str]): The fields to load, or None for all of them.
+
         Returns:
             List[Team]: A list of Team objects.
         """
-        team_collection = db["team"]
-        teams = team_collection.find()
+        team_collection = get_list_collection("team")
+        teams = team_collection.find({}, projection(fields))
         return [Team.from_dict(team) for team in teams]
 
     @staticmethod
@@ -25,7 +30,8 @@ class TeamRepository:
             team (Team): The Team object to insert.
         """
         team_collection = db["team"]
-        team_collection.insert_one(team.to_dict())
+        result = team_collection.insert_one(team.to_dict())
+        GenerationRepository.increment_if_changed("team", result)
 
     @staticmethod
     def find_by_id(team_id):
@@ -51,7 +57,8 @@ class TeamRepository:
             team_id (str): The ID of the team to delete.
         """
         team_collection = db["team"]
-        team_collection.delete_one({"_id": team_id})
+        result = team_collection.delete_one({"_id": team_id})
+        GenerationRepository.increment_if_changed("team", result)
 
     @staticmethod
     def update_by_id(team_id, team_data):
@@ -63,7 +70,8 @@ class TeamRepository:
             team_data (dict): The updated data for the team.
         """
         team_collection = db["team"]
-        team_collection.update_one({"_id": team_id}, {"$set": team_data})
+        result = team_collection.update_one({"_id": team_id}, {"$set": team_data})
+        GenerationRepository.increment_if_changed("team", result)
 
     @staticmethod
     def find_by_name(name):
@@ -81,16 +89,20 @@ class TeamRepository:
         return Team.from_dict(team_data) if team_data else None
 
     @staticmethod
-    def find_by_ids(team_ids):
+    def find_by_ids(team_ids, include_image=True):
         """
         Fetch a list of teams from the MongoDB collection by their IDs.
 
         Args:
             team_ids (List[str]): The IDs of the teams to retrieve.
+            include_image (bool): Whether to load the base64 encoded image.
 
         Returns:
             List[Team]: The retrieved teams.
         """
+        # Always read from the primary: these teams fill the shared team cache,
+        # where a stale copy from a secondary would outlive the next write
         team_collection = db["team"]
-        team_data = team_collection.find({"_id": {"$in": team_ids}})
+        projection = None if include_image else {"b64_image": 0}
+        team_data = team_collection.find({"_id": {"$in": team_ids}}, projection)
         return [Team.from_dict(team) for team in team_data]
\ No newline at end of file
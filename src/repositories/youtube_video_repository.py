@@ -1,15 +1,41 @@
-from src.database import db
+from src.database import db, get_list_collection, get_read_collection
+from src.repositories.generation_repository import GenerationRepository
 from src.models.youtube_video import YoutubeVideo
+from pymongo import UpdateOne
+from src.utils.query_filters import UNCLASSIFIED_VIDEOS_FILTER
+from src.utils.selection import projection
 
 
 class YoutubeVideoRepository:
     @staticmethod
-    def find_all():
+    def find_all(fields=None):
         """
         Retrieve all YouTube videos from the MongoDB collection.
+        Only `fields` are loaded when given.
+        """
+        collection = get_list_collection("youtubevideo")
+        videos = collection.find({}, projection(fields))
+        return [YoutubeVideo.from_dict(video) for video in videos]
+
+    @staticmethod
+    def find_by_sports_type(sports_type, fields=None):
+        """
+        Retrieve YouTube videos of a sport, newest first.
+        Only `fields` are loaded when given.
+        """
+        collection = get_list_collection("youtubevideo")
+        videos = collection.find({"sports_type": sports_type}, projection(fields)).sort(
+            "published_at", -1
+        )
+        return [YoutubeVideo.from_dict(video) for video in videos]
+
+    @staticmethod
+    def find_without_sports_type():
+        """
+        Retrieve YouTube videos stored before sports were classified at ingest time.
         """
         collection = db["youtubevideo"]
-        videos = collection.find()
+        videos = collection.find(UNCLASSIFIED_VIDEOS_FILTER, {"title": 1})
         return [YoutubeVideo.from_dict(video) for video in videos]
 
     @staticmethod
@@ -17,7 +43,7 @@ class YoutubeVideoRepository:
         """
         Retrieve a YouTube video by its ID.
         """
-        collection = db["youtubevideo"]
+        collection = get_read_collection("youtubevideo")
         video_data = collection.find_one({"_id": video_id})
         return YoutubeVideo.from_dict(video_data) if video_data else None
 
@@ -27,7 +53,8 @@ class YoutubeVideoRepository:
         Inserts a new YouTube video into the MongoDB collection.
         """
         collection = db["youtubevideo"]
-        collection.insert_one(video.to_dict())
+        result = collection.insert_one(video.to_dict())
+        GenerationRepository.increment_if_changed("youtubevideo", result)
 
     @staticmethod
     def update_by_id(video_id, data):
@@ -35,7 +62,8 @@ class YoutubeVideoRepository:
         Updates an existing YouTube video in the MongoDB collection.
         """
         collection = db["youtubevideo"]
-        collection.update_one({"_id": video_id}, {"$set": data})
+        result = collection.update_one({"_id": video_id}, {"$set": data})
+        GenerationRepository.increment_if_changed("youtubevideo", result)
 
     @staticmethod
     def delete_by_id(video_id):
@@ -43,4 +71,69 @@ class YoutubeVideoRepository:
         Deletes a YouTube video from the MongoDB collection.
         """
         collection = db["youtubevideo"]
-        collection.delete_one({"_id": video_id})
+        result = collection.delete_one({"_id": video_id})
+        GenerationRepository.increment_if_changed("youtubevideo", result)
+
+    @staticmethod
+    def find_existing_ids(video_ids):
+        """
+        Return the subset of the given video IDs that are already stored.
+        """
+        if not video_ids:
+            return set()
+        collection = db["youtubevideo"]
+        cursor = collection.find({"_id": {"$in": list(video_ids)}}, {"_id": 1})
+        return {video["_id"] for video in cursor}
+
+    @staticmethod
+    def find_all_ids():
+        """
+        Retrieve the IDs of all stored YouTube videos.
+        """
+        collection = db["youtubevideo"]
+        return [video["_id"] for video in collection.find({}, {"_id": 1})]
+
+    @staticmethod
+    def bulk_update(updates):
+        """
+        Update several YouTube videos in a single bulk write.
+
+        Args:
+            updates (dict): A mapping of video ID to the fields to set.
+        """
+        if not updates:
+            return
+
+        collection = db["youtubevideo"]
+        operations = [
+            UpdateOne({"_id": video_id}, {"$set": data})
+            for video_id, data in updates.items()
+        ]
+        result = collection.bulk_write(operations, ordered=False)
+        GenerationRepository.increment_if_changed("youtubevideo", result)
+
+    @staticmethod
+    def bulk_upsert(videos):
+        """
+        Bulk upsert YouTube videos into the MongoDB collection, keyed on video ID.
+        A missing thumbnail or duration never overwrites one that is already stored.
+        """
+        if not videos:
+            return
+
+        collection = db["youtubevideo"]
+        operations = []
+        for video in videos:
+            video_dict = video.to_dict()
+            # Remove _id from the update to avoid MongoDB error
+            video_dict.pop("_id", None)
+            for field in ("b64_thumbnail", "duration"):
+                if video_dict.get(field) is None:
+                    video_dict.pop(field, None)
+
+            operations.append(
+                UpdateOne({"_id": video.id}, {"$set": video_dict}, upsert=True)
+            )
+
+        result = collection.bulk_write(operations, ordered=False)
+        GenerationRepository.increment_if_changed("youtubevideo", result)
@@ -19,10 +19,19 @@ from src.mutations import (
     AddFavoriteGame,
     RemoveFavoriteGame,
 )
-from src.queries import GameQuery, TeamQuery, YoutubeVideoQuery, ArticleQuery
+from src.queries import GameQuery, TeamQuery, YoutubeVideoQuery, ArticleQuery, FeedQuery, ArchiveQuery, SeasonRecordQuery
 
 
-class Query(TeamQuery, GameQuery, YoutubeVideoQuery, ArticleQuery, ObjectType):
+class Query(
+    TeamQuery,
+    GameQuery,
+    YoutubeVideoQuery,
+    ArticleQuery,
+    FeedQuery,
+    ArchiveQuery,
+    SeasonRecordQuery,
+    ObjectType,
+):
     pass
 
 
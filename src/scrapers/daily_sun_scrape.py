@@ -1,10 +1,10 @@
 import os
-import requests
 from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 from ..services import ArticleService
 from ..utils.constants import ARTICLE_IMG_TAG
 from ..utils.helpers import extract_sport_type_from_title
+from ..utils.http_client import fetch
 import logging
 from bs4 import BeautifulSoup
 import base64
@@ -15,7 +15,7 @@ load_dotenv()
 def fetch_news():
     try:
         url = os.getenv("DAILY_SUN_URL")
-        response = requests.get(
+        response = fetch(
             url,
             headers={
                 "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
@@ -31,12 +31,11 @@ def fetch_news():
         # Process articles
         articles_to_store = []
         for article in data.get("articles", []):
-            published_at_dt = datetime.strptime(article["published_at"], "%Y-%m-%d %H:%M:%S")
-            # Assume the timezone is UTC and convert to ISO 8601 format string
-            published_at_dt = published_at_dt.replace(tzinfo=timezone.utc)
-            published_at = published_at_dt.isoformat().replace('+00:00', 'Z')
-            
-            if published_at_dt >= three_days_ago:
+            published_at = datetime.strptime(article["published_at"], "%Y-%m-%d %H:%M:%S")
+            # Assume the timezone is UTC
+            published_at = published_at.replace(tzinfo=timezone.utc)
+
+            if published_at >= three_days_ago:
                 # Extract sport type from title
                 title = article["headline"]
                 sports_type = extract_sport_type_from_title(title)
@@ -44,7 +43,7 @@ def fetch_news():
 
                 article_image = None
                 try:
-                    response = requests.get(
+                    response = fetch(
                         article_url,
                         headers={
                             "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
@@ -64,7 +63,7 @@ def fetch_news():
                     "published_at": published_at,
                     "url": article_url,
                     "slug": article["slug"],
-                    "created_at": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+                    "created_at": datetime.now(timezone.utc)
                 }
                 articles_to_store.append(article_doc)
              
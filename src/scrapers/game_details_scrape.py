@@ -1,7 +1,7 @@
 import re
-import requests
 from bs4 import BeautifulSoup
 from src.utils.constants import *
+from src.utils.http_client import fetch
 
 def clean_name(name):
     """Strip extra information from player names, keeping only first and last name."""
@@ -22,273 +22,295 @@ def clean_name(name):
     return cleaned
 
 def fetch_page(url):
-    response = requests.get(url)
-    return BeautifulSoup(response.text, 'html.parser')
-
-def extract_teams_and_scores(box_score_section, sport):
-    score_table = box_score_section.find(TAG_TABLE, class_=CLASS_SIDEARM_TABLE)
-    team_names = []
-    period_scores = []
-
-    for row in score_table.find(TAG_TBODY).find_all(TAG_TR):
-        # Check if team name is in <th> (some sports) or first <td> (other sports)
-        team_name_cell = row.find(TAG_TH)
-        if team_name_cell:
-            # Team name is in <th>, all <td> elements are period scores
-            team_name = team_name_cell.text.strip().replace("Winner", "").strip()
-            scores = [td.text.strip() for td in row.find_all(TAG_TD)]
-        else:
-            # Team name is in first <td>, remaining <td> elements are period scores
-            team_name_cell = row.find(TAG_TD)
-            team_name = team_name_cell.text.strip().replace("Winner", "").strip() if team_name_cell else "Unknown"
-            scores = [td.text.strip() for td in row.find_all(TAG_TD)[1:]]
-        
-        # Basketball box score includes a "Records" column at the end - exclude it
-        if sport == 'basketball' and scores:
-            scores = scores[:-1]
-        
-        team_name = ' '.join(team_name.split())
-        team_names.append(team_name)
-        period_scores.append(scores)
-
-    return team_names, period_scores
-
-def soccer_summary(box_score_section):
-    summary = []
-    scoring_section = box_score_section.find(TAG_SECTION, {ATTR_ARIA_LABEL: LABEL_SCORING_SUMMARY})
-    if scoring_section:
-        scoring_rows = scoring_section.find(TAG_TBODY)
-        if scoring_rows:
-            cornell_score = 0
-            opp_score = 0
-            for row in scoring_rows.find_all(TAG_TR):
-                time = row.find_all(TAG_TD)[0].text.strip()
-                team = row.find_all(TAG_TD)[1].find(TAG_IMG)[ATTR_ALT]
-                event = row.find_all(TAG_TD)[2]
-                desc = event.find_all(TAG_SPAN)[-1].text.strip()
-                
-                if team == "COR" or team == "CU" or team == "CRNL":
-                    cornell_score += 1
-                else:
-                    opp_score += 1
-                    
-                summary.append({
-                    'time': time, 
-                    'team': team, 
-                    'description': desc,
-                    'cor_score': cornell_score,
-                    'opp_score': opp_score
-                })
-    if not summary:
-        summary = [{"message": "No scoring events in this game."}]
-    return summary
-
-def football_summary(box_score_section):
-    summary = []
-    scoring_section = box_score_section.find(TAG_SECTION, {ATTR_ARIA_LABEL: LABEL_SCORING_SUMMARY})
-    if scoring_section:
-        scoring_rows = scoring_section.find(TAG_TBODY)
-        if scoring_rows:
-            for row in scoring_rows.find_all(TAG_TR):
-                period = row.find_all(TAG_TD)[1].text.strip()
-                time = row.find_all(TAG_TD)[0].text.strip()
-                description = row.find_all(TAG_TD)[3].text.strip()
-                cornell_score = row.find_all(TAG_TD)[4].text.strip()
-                opp_score = row.find_all(TAG_TD)[5].text.strip()
-                description_parts = description.split(' - ', 1)
-                team = description_parts[0].strip() if len(description_parts) > 1 else ""
-                summary.append({
-                    'team': team,
-                    'period': period,
-                    'time': time,
-                    'description': description,
-                    'cor_score': cornell_score,
-                    'opp_score': opp_score
-                })
-    if not summary:
-        summary = [{"message": "No scoring events in this game."}]
-    return summary
-
-def hockey_summary(box_score_section):
-    summary = []
-    scoring_table = box_score_section.find(TAG_TABLE, class_=CLASS_SCORING_SUMMARY)
-    if scoring_table:
-        scoring_rows = scoring_table.find(TAG_TBODY)
-        if scoring_rows:
-            cornell_score = 0
-            opp_score = 0
-            for row in scoring_rows.find_all(TAG_TR):
-                team = row.find_all(TAG_TD)[1].find(TAG_IMG)[ATTR_ALT]
-                period = row.find_all(TAG_TD)[2].text.strip()
-                time = row.find_all(TAG_TD)[3].text.strip()
-                scorer = row.find_all(TAG_TD)[4].text.strip()
-                assist = row.find_all(TAG_TD)[5].text.strip()
-                
-                if team == "COR" or team == "CU" or team == "Cornell":
-                    cornell_score += 1
-                else:
-                    opp_score += 1
+    response = fetch(url, conditional=True)
+    response.raise_for_status()
+    return response.text
+
+# Opening tag of the box score section: <... id="box-score"> or, on baseball and
+# softball pages, the first tag with the box-score class
+BOX_SCORE_BY_ID = re.compile(
+    r'<(\w+)(?:\s[^>]*?)?\sid\s*=\s*["\']?' + re.escape(ID_BOX_SCORE) + r'(?=["\'\s/>])', re.IGNORECASE
+)
+BOX_SCORE_BY_CLASS = re.compile(
+    r'<(\w+)(?:\s[^>]*?)?\sclass\s*=\s*["\'](?:[^"\']*\s)?' + re.escape(CLASS_BOX_SCORE) + r'(?=["\'\s])',
+    re.IGNORECASE,
+)
+
+def element_html(html, opening):
+    """
+    Returns the HTML of the element whose opening tag `opening` matched, up to
+    its matching closing tag. Only tags with the element's name are scanned, and
+    scanning stops at the closing tag, so the rest of the page is never read.
+    """
+    tags = re.compile(rf'<(/?){re.escape(opening.group(1))}\b[^>]*>', re.IGNORECASE)
+    depth = 0
+    for tag in tags.finditer(html, opening.start()):
+        if tag.group(1):
+            depth -= 1
+        elif not tag.group(0).endswith('/>'):
+            depth += 1
+        if depth == 0:
+            return html[opening.start():tag.end()]
+    return html[opening.start():]
+
+# Scoring-summary abbreviations Cornell appears under on the box score pages
+CORNELL_ALIASES = frozenset({"COR", "CU", "CRNL", "CORFH", "CORNELL", "Cornell"})
+
+
+def _cell_text(cell):
+    return cell.text.strip()
+
+def _cell_image_alt(cell):
+    # team logos carry the team abbreviation; fall back to the cell text
+    image = cell.find(TAG_IMG)
+    return image[ATTR_ALT] if image and image.has_attr(ATTR_ALT) else cell.text.strip()
+
+def _cell_last_span(cell):
+    spans = cell.find_all(TAG_SPAN)
+    return spans[-1].text.strip() if spans else cell.text.strip()
+
+def _cell_own_text(cell):
+    # text directly inside the cell, without nested tags (e.g. baseball's score tooltips)
+    return ''.join(cell.find_all(string=True, recursive=False)).strip()
 
-                summary.append({
-                    'team': team,
-                    'period': period,
-                    'time': time,
-                    'scorer': scorer,
-                    'assist': assist,
-                    'cor_score': cornell_score,
-                    'opp_score': opp_score,
-                    'description': f"Scored by {scorer}. Assisted by {assist}."
-                })
-    if not summary:
-        summary = [{"message": "No scoring events in this game."}]
-    return summary
-
-def field_hockey_summary(box_score_section):
-    summary = []
-    scoring_rows = box_score_section.find(TAG_TABLE, class_=CLASS_OVERALL_STATS).find(TAG_TBODY)
-    if scoring_rows:
+def _cell_player(cell):
+    return clean_name(cell.text.strip())
+
+# How a summary column's value is read from its <td>
+CELL_EXTRACTORS = {
+    'text': _cell_text,
+    'image_alt': _cell_image_alt,
+    'last_span': _cell_last_span,
+    'own_text': _cell_own_text,
+    'player': _cell_player,
+}
+
+
+def football_derived(event):
+    # descriptions look like "COR - Smith 5 yd run (Jones kick)"
+    parts = event['description'].split(' - ', 1)
+    return {'team': parts[0].strip() if len(parts) > 1 else ""}
+
+def hockey_derived(event):
+    return {'description': f"Scored by {event['scorer']}. Assisted by {event['assist']}."}
+
+def lacrosse_derived(event):
+    if event['assist'] and event['assist'] != "Unassisted":
+        return {'description': f"Scored by {event['scorer']}, assisted by {event['assist']}"}
+    return {'description': f"Scored by {event['scorer']}"}
+
+
+class BoxScoreParser:
+    """
+    Extracts the score table and scoring summary of one sport's box score page
+    from a declarative description of its layout. The description is compiled
+    once, when the parser is registered, into a list of (field, column,
+    extractor) steps, so every row is read in a single pass over its cells.
+
+    Args:
+        by_class (bool): The box score section is found by class rather than id.
+        summary (tuple): The (tag, attrs) of the scoring summary element, or None
+            for sports without one.
+        columns (dict): Maps each event field to its (column index, extractor
+            name in CELL_EXTRACTORS) in a scoring summary row.
+        running_score (bool): Compute `cor_score`/`opp_score` by counting events
+            per team instead of reading them from columns.
+        derived (callable): Returns extra fields computed from a parsed event. (optional)
+        trailing_columns (int): Columns at the end of the score table that are
+            not period scores (e.g. basketball's records).
+        cornell_aliases (frozenset): Team values in the summary that mean Cornell.
+    """
+
+    def __init__(
+        self,
+        by_class=False,
+        summary=None,
+        columns=None,
+        running_score=False,
+        derived=None,
+        trailing_columns=0,
+        cornell_aliases=CORNELL_ALIASES,
+    ):
+        self.by_class = by_class
+        self.summary = summary
+        self.running_score = running_score
+        self.derived = derived
+        self.trailing_columns = trailing_columns
+        self.cornell_aliases = cornell_aliases
+        self._steps = [
+            (field, index, CELL_EXTRACTORS[kind]) for field, (index, kind) in (columns or {}).items()
+        ]
+        self._width = max((index for _, index, _ in self._steps), default=-1) + 1
+
+    def find_section(self, soup):
+        return soup.find(class_=CLASS_BOX_SCORE) if self.by_class else soup.find(id=ID_BOX_SCORE)
+
+    def section_soup(self, html):
+        """
+        Parses only the box score section of a page. The play-by-play, stats
+        tabs, navigation and scripts around it are skipped without being
+        tokenized; the whole page is parsed if the section can't be located.
+        """
+        opening = (BOX_SCORE_BY_CLASS if self.by_class else BOX_SCORE_BY_ID).search(html)
+        return BeautifulSoup(element_html(html, opening) if opening else html, 'html.parser')
+
+    def parse(self, box_score_section):
+        team_names, scores = self.parse_scores(box_score_section)
+        return {
+            'teams': team_names,
+            'scores': scores,
+            'scoring_summary': self.parse_summary(box_score_section)
+            or [{"message": "No scoring events in this game."}],
+        }
+
+    def parse_scores(self, box_score_section):
+        team_names = []
+        period_scores = []
+        score_table = box_score_section.find(TAG_TABLE, class_=CLASS_SIDEARM_TABLE)
+        body = score_table.find(TAG_TBODY) if score_table else None
+        if not body:
+            return team_names, period_scores
+
+        for row in body.find_all(TAG_TR):
+            cells = row.find_all(TAG_TD)
+            # The team name is in a <th> on some sports and in the first <td> on others
+            team_name_cell = row.find(TAG_TH)
+            if not team_name_cell and cells:
+                team_name_cell, cells = cells[0], cells[1:]
+            team_name = team_name_cell.text.replace("Winner", "") if team_name_cell else "Unknown"
+            scores = [cell.text.strip() for cell in cells]
+            if self.trailing_columns and scores:
+                scores = scores[:-self.trailing_columns]
+
+            team_names.append(' '.join(team_name.split()))
+            period_scores.append(scores)
+
+        return team_names, period_scores
+
+    def parse_summary(self, box_score_section):
+        if not self.summary:
+            return []
+        tag, attrs = self.summary
+        summary_element = box_score_section.find(tag, attrs)
+        body = summary_element.find(TAG_TBODY) if summary_element else None
+        if not body:
+            return []
+
+        summary = []
         cornell_score = 0
         opp_score = 0
-        for row in scoring_rows.find_all(TAG_TR):
-            time = row.find_all(TAG_TD)[0].text.strip()
-            team = row.find_all(TAG_TD)[1].find(TAG_IMG)[ATTR_ALT]
-            event = row.find_all(TAG_TD)[2]
-            desc = event.find_all(TAG_SPAN)[-1].text.strip()
-            
-            if team == "COR" or team == "CU" or team == "CORFH" or team == "CORNELL":
-                cornell_score += 1
-            else:
-                opp_score += 1
-                
-            summary.append({
-                'time': time,
-                'team': team,
-                'description': desc,
-                'cor_score': cornell_score,
-                'opp_score': opp_score
-            })
-    if not summary:
-        summary = [{"message": "No scoring events in this game."}]
-    return summary
-
-def lacrosse_summary(box_score_section):
-    summary = []
-    scoring_table = box_score_section.find(TAG_TABLE, class_=CLASS_SCORING_SUMMARY)
-    if scoring_table:
-        scoring_rows = scoring_table.find(TAG_TBODY)
-        if scoring_rows:
-            for row in scoring_rows.find_all(TAG_TR):
-                team = row.find_all(TAG_TD)[1].find(TAG_IMG)[ATTR_ALT]
-                period = row.find_all(TAG_TD)[2].text.strip()
-                time = row.find_all(TAG_TD)[3].text.strip()
-                scorer = clean_name(row.find_all(TAG_TD)[4].text.strip())
-                assist = clean_name(row.find_all(TAG_TD)[5].text.strip())
-                opp_score = row.find_all(TAG_TD)[7].text.strip()
-                cor_score = row.find_all(TAG_TD)[6].text.strip()
-                
-                if assist and assist != "Unassisted":
-                    desc = f"Scored by {scorer}, assisted by {assist}"
+        for row in body.find_all(TAG_TR):
+            cells = row.find_all(TAG_TD)
+            if len(cells) < self._width:
+                continue
+            event = {field: extract(cells[index]) for field, index, extract in self._steps}
+            if self.derived:
+                event.update(self.derived(event))
+            if self.running_score:
+                if event['team'] in self.cornell_aliases:
+                    cornell_score += 1
                 else:
-                    desc = f"Scored by {scorer}"
-
-                summary.append({
-                    'team': team,
-                    'period': period,
-                    'time': time,
-                    'scorer': scorer,
-                    'description': desc,
-                    'assist': assist,
-                    'cor_score': cor_score,
-                    'opp_score': opp_score,
-                })
-    if not summary:
-        summary = [{"message": "No scoring events in this game."}]
-    return summary
-
-def baseball_summary(box_score_section):
-    summary = []
-    scoring_rows = box_score_section.find(TAG_TABLE, class_=CLASS_SIDEARM_TABLE + " " + CLASS_SCORING_SUMMARY)
-    if scoring_rows:
-        scoring_rows = scoring_rows.find(TAG_TBODY)
-        if scoring_rows:
-            for row in scoring_rows.find_all(TAG_TR):
-                team = row.find_all(TAG_TD)[1].text.strip()
-                period = row.find_all(TAG_TD)[3].text.strip()
-                desc_td = row.find_all(TAG_TD)[4]
-                desc = ''.join(desc_td.find_all(text=True, recursive=False)).strip()
-                cor_score = row.find_all(TAG_TD)[5].text.strip()
-                opp_score = row.find_all(TAG_TD)[6].text.strip()
-                summary.append({
-                    'team': team,
-                    'period': period,
-                    'description': desc,
-                    'cor_score': cor_score,
-                    'opp_score': opp_score
-                })
-    if not summary:
-        summary = [{"message": "No scoring events in this game."}]
-    return summary
-
-# def basketball_summary(box_score_section):
-#     summary = []
-#     scoring_section = box_score_section.find(TAG_SECTION, {ATTR_ARIA_LABEL: LABEL_SCORING_SUMMARY})
-#     if scoring_section:
-#         scoring_rows = scoring_section.find(TAG_TBODY)
-#         if scoring_rows:
-#             cornell_score = 0
-#             opp_score = 0
-#             for row in scoring_rows.find_all(TAG_TR):
-#                 time = row.find_all(TAG_TD)[0].text.strip()
-#                 team = row.find_all(TAG_TD)[1].find(TAG_IMG)[ATTR_ALT]
-#                 event = row.find_all(TAG_TD)[2]
-#                 desc = event.find_all(TAG_SPAN)[-1].text.strip()
-                
-#                 if team == "COR" or team == "CU" or team == "CRNL":
-#                     cornell_score += 1
-#                 else:
-#                     opp_score += 1
-                    
-#                 summary.append({
-#                     'time': time, 
-#                     'team': team, 
-#                     'description': desc,
-#                     'cor_score': cornell_score,
-#                     'opp_score': opp_score
-#                 })
-#     if not summary:
-#         summary = [{"message": "No scoring events in this game."}]
-#     return summary
+                    opp_score += 1
+                event['cor_score'] = cornell_score
+                event['opp_score'] = opp_score
+            if not event.get('time') and event.get('period'):
+                event['time'] = event['period']
+            summary.append(event)
+        return summary
+
+
+# Box score parsers by lowercase sport name
+BOX_SCORE_PARSERS = {}
+
+def register_parser(*sports, **layout):
+    """
+    Compile a BoxScoreParser from `layout` and register it for `sports`.
+    """
+    parser = BoxScoreParser(**layout)
+    for sport in sports:
+        BOX_SCORE_PARSERS[sport] = parser
+    return parser
+
+
+SCORING_SUMMARY_SECTION = (TAG_SECTION, {ATTR_ARIA_LABEL: LABEL_SCORING_SUMMARY})
+SCORING_SUMMARY_TABLE = (TAG_TABLE, {'class': CLASS_SCORING_SUMMARY})
+
+register_parser(
+    'soccer',
+    summary=SCORING_SUMMARY_SECTION,
+    columns={'time': (0, 'text'), 'team': (1, 'image_alt'), 'description': (2, 'last_span')},
+    running_score=True,
+)
+register_parser(
+    'football',
+    summary=SCORING_SUMMARY_SECTION,
+    columns={
+        'time': (0, 'text'),
+        'period': (1, 'text'),
+        'description': (3, 'text'),
+        'cor_score': (4, 'text'),
+        'opp_score': (5, 'text'),
+    },
+    derived=football_derived,
+)
+register_parser(
+    'ice hockey',
+    summary=SCORING_SUMMARY_TABLE,
+    columns={
+        'team': (1, 'image_alt'),
+        'period': (2, 'text'),
+        'time': (3, 'text'),
+        'scorer': (4, 'text'),
+        'assist': (5, 'text'),
+    },
+    running_score=True,
+    derived=hockey_derived,
+)
+register_parser(
+    'field hockey',
+    summary=(TAG_TABLE, {'class': CLASS_OVERALL_STATS}),
+    columns={'time': (0, 'text'), 'team': (1, 'image_alt'), 'description': (2, 'last_span')},
+    running_score=True,
+)
+register_parser(
+    'lacrosse',
+    summary=SCORING_SUMMARY_TABLE,
+    columns={
+        'team': (1, 'image_alt'),
+        'period': (2, 'text'),
+        'time': (3, 'text'),
+        'scorer': (4, 'player'),
+        'assist': (5, 'player'),
+        'cor_score': (6, 'text'),
+        'opp_score': (7, 'text'),
+    },
+    derived=lacrosse_derived,
+)
+register_parser(
+    'baseball',
+    by_class=True,
+    summary=(TAG_TABLE, {'class': CLASS_SIDEARM_TABLE + " " + CLASS_SCORING_SUMMARY}),
+    columns={
+        'team': (1, 'text'),
+        'period': (3, 'text'),
+        'description': (4, 'own_text'),
+        'cor_score': (5, 'text'),
+        'opp_score': (6, 'text'),
+    },
+)
+# Basketball and volleyball pages have no scoring summary, only the score table
+# (basketball's ends with each team's record)
+register_parser('basketball', trailing_columns=1)
+register_parser('volleyball')
+
 
 def scrape_game(url, sport):
-    soup = fetch_page(url)
-    box_score_section = soup.find(class_=CLASS_BOX_SCORE) if sport in ['baseball', 'softball'] else soup.find(id=ID_BOX_SCORE)
+    parser = BOX_SCORE_PARSERS.get(sport)
+    if not parser:
+        return {"error": "Sport parser not found"}
+
+    html = fetch_page(url)
+    box_score_section = parser.find_section(parser.section_soup(html))
     if not box_score_section:
         return {"error": "Box score section not found"}
-    
-    sport_parsers = {
-        'soccer': (lambda: extract_teams_and_scores(box_score_section, 'soccer'), soccer_summary),
-        'football': (lambda: extract_teams_and_scores(box_score_section, 'football'), football_summary),
-        'ice hockey': (lambda: extract_teams_and_scores(box_score_section, 'ice hockey'), hockey_summary),
-        'field hockey': (lambda: extract_teams_and_scores(box_score_section, 'field hockey'), field_hockey_summary),
-        'lacrosse': (lambda: extract_teams_and_scores(box_score_section, 'lacrosse'), lacrosse_summary),
-        'baseball': (lambda: extract_teams_and_scores(box_score_section, 'baseball'), baseball_summary),
-        'basketball': (lambda: extract_teams_and_scores(box_score_section, 'basketball'), lambda _: []),
-    }
-
-    extract_teams_func, summary_func = sport_parsers.get(sport, (None, None))
-    
-    if extract_teams_func and summary_func:
-        team_names, scores = extract_teams_func()
-        scoring_summary = summary_func(box_score_section)
-        
-        for event in scoring_summary:
-            if not event.get("time") and event.get("period"):
-                event["time"] = event["period"]
-                
-        return {
-            'teams': team_names,
-            'scores': scores,
-            'scoring_summary': scoring_summary or [{"message": "No scoring events in this game."}]
-        }
-    
-    return {"error": "Sport parser not found"}
\ No newline at end of file
+    return parser.parse(box_score_section)
@@ -1,15 +1,32 @@
-import requests
+import logging
+import time
+from datetime import datetime, timezone
 from bs4 import BeautifulSoup
-from src.services import GameService, TeamService
+from src.services import (
+    GameService,
+    TeamService,
+    FeedService,
+    LiveScoreService,
+    GameArchiveService,
+    SeasonRecordService,
+)
 from src.utils.convert_to_utc import convert_to_utc
 from src.utils.constants import *
 from src.scrapers.game_details_scrape import scrape_game
 from src.utils.helpers import get_dominant_color, normalize_game_data, is_tournament_placeholder_team, is_cornell_loss
+from src.utils.http_client import DeadlineExceeded, deadline, fetch
+from src.utils.scrape_ledger import count, new_record, recording, stage
+from src.services.scrape_run_service import ScrapeRunService
 import base64
 import re
 from src.database import db
 import threading
 
+# Wall-clock budget (seconds) of one sport's scrape; fetches fail fast once it
+# has passed, and the runner stops waiting for the sport shortly after
+SPORT_DEADLINE = 5 * 60
+JOIN_GRACE = 30
+
 
 def extract_season_years(page_title):
     """
@@ -42,126 +59,260 @@ def infer_game_year(date_text, season_years):
 
 def fetch_game_schedule():
     """
-    Scrape the game schedule from the given URLs in parallel using threads.
-    Each sport is scraped in its own thread for improved performance.
+    Scrape the game schedule of every sport in parallel.
+
+    Returns:
+        list: The per-sport reports of `run_sport_jobs`.
+    """
+    jobs = [
+        (SCHEDULE_PREFIX + sport + SCHEDULE_POSTFIX, data["sport"], data["gender"], None)
+        for sport, data in SPORT_URLS.items()
+    ]
+    reports = run_sport_jobs(jobs, kind="full")
+    FeedService.rebuild_all_feed()
+    return reports
+
+def run_sport_jobs(jobs, kind="due"):
+    """
+    Scrape several sports in parallel, each in its own thread and bounded by
+    SPORT_DEADLINE, so a slow or hung upstream cannot stall the whole run.
+    The run is recorded in the scrape run ledger.
+
+    Args:
+        jobs (list): (url, sport, gender, window) tuples for `parse_schedule_page`.
+        kind (str): What triggered the run ("full" or "due"), for the ledger.
+
+    Returns:
+        list: One report per sport with its `sport`, `gender`, `status` ("ok",
+        "partial" if some games failed, "failed" or "timed_out"), `games`,
+        `failed_games`, `error` and `elapsed` seconds, plus its ledger record
+        (stage timings, pages, bytes and inserted/updated/unchanged games).
     """
+    started_at = datetime.now(timezone.utc)
+    started = time.monotonic()
+    # Each job fills its own working report; the runner only reads it once the
+    # job has finished, or copies it if the job is still running at the deadline
+    work_reports = []
     threads = []
-    
-    for sport, data in SPORT_URLS.items():
-        url = SCHEDULE_PREFIX + sport + SCHEDULE_POSTFIX
+    for url, sport, gender, window in jobs:
+        work = {
+            "sport": sport,
+            "gender": gender,
+            "status": "timed_out",
+            "games": 0,
+            "failed_games": 0,
+            "error": None,
+            "elapsed": None,
+            **new_record(),
+        }
+        work_reports.append(work)
 
         # create thread for each sport
         thread = threading.Thread(
-            target=parse_schedule_page,
-            args=(url, data["sport"], data["gender"]),
-            name=f"Scraper-{sport}"
+            target=_run_sport_job,
+            args=(work, url, sport, gender, window),
+            name=f"Scraper-{gender}-{sport}",
         )
         thread.daemon = True
         threads.append(thread)
         thread.start()
-    
+
+    ends_at = started + SPORT_DEADLINE + JOIN_GRACE
     for thread in threads:
-        thread.join()
+        thread.join(timeout=max(0, ends_at - time.monotonic()))
+
+    reports = []
+    for thread, work in zip(threads, work_reports):
+        if not thread.is_alive():
+            reports.append(work)
+            continue
+        # The job keeps running in the background and keeps updating `work`;
+        # report what it had done by the deadline
+        report = dict(work, stages=dict(work["stages"]))
+        report["status"] = "timed_out"
+        report["error"] = report["error"] or "Still running after the deadline"
+        report["elapsed"] = time.monotonic() - started
+        reports.append(report)
+
+    problems = [report for report in reports if report["status"] != "ok"]
+    for report in problems:
+        logging.warning(
+            f"Scrape of {report['gender']} {report['sport']} {report['status']}: "
+            f"{report['failed_games']} game(s) failed"
+            + (f", {report['error']}" if report["error"] else "")
+        )
+    logging.info(f"Scraped {len(reports) - len(problems)}/{len(reports)} sports without errors")
 
-def parse_schedule_page(url, sport, gender):
+    try:
+        ScrapeRunService.record_run(kind, started_at, datetime.now(timezone.utc), reports)
+    except Exception as e:
+        logging.error(f"Error recording scrape run: {e}")
+    return reports
+
+def _run_sport_job(report, url, sport, gender, window):
+    started = time.monotonic()
+    try:
+        with deadline(SPORT_DEADLINE), recording(report):
+            result = parse_schedule_page(url, sport, gender, window)
+        report["games"] = result["games"]
+        report["failed_games"] = result["failed_games"]
+        report["status"] = "partial" if result["failed_games"] else "ok"
+    except DeadlineExceeded as e:
+        report["status"] = "timed_out"
+        report["error"] = str(e)
+    except Exception as e:
+        report["status"] = "failed"
+        report["error"] = str(e)
+    finally:
+        report["elapsed"] = time.monotonic() - started
+
+def parse_schedule_page(url, sport, gender, window=None):
     """
-    Parse the game schedule page and store the data in the database.
+    Parse the game schedule page and store the data in the database. A game
+    that fails to scrape is logged and skipped. The sport's feed and the
+    records of the seasons scraped are rebuilt afterwards.
     Args:
         url (str): The URL of the game schedule page.
         sport (str): The sport of the games.
         gender (str): The gender of the games.
+        window (tuple): Only process games whose UTC date falls in this
+            (start, end) range. (optional)
+    Returns:
+        dict: The number of `games` stored and `failed_games`.
     """
-    response = requests.get(url)
-    soup = BeautifulSoup(response.content, "html.parser")
-
-    page_title = soup.title.text.strip() if soup.title else ""
-    season_years = extract_season_years(page_title)
-
-    for game_item in soup.select(GAME_TAG):
-        game_data = {}
-        game_data["gender"] = gender
-        game_data["sport"] = sport
-
-        opponent_name_tag = game_item.select_one(OPPONENT_NAME_TAG_A)
-        opponent_name = (
-            opponent_name_tag.text.strip()
-            if opponent_name_tag
-            else game_item.select_one(OPPONENT_NAME_TAG).text.strip()
-        )
-        game_data["opponent_name"] = opponent_name
+    response = fetch(url, conditional=True)
+    response.raise_for_status()
+    with stage("parse"):
+        soup = BeautifulSoup(response.content, "html.parser")
+        page_title = soup.title.text.strip() if soup.title else ""
+        season_years = extract_season_years(page_title)
+        game_items = soup.select(GAME_TAG)
 
-        opponent_logo_tag = game_item.select_one(OPPONENT_LOGO_TAG)
-        opponent_logo = (
-            opponent_logo_tag[OPPONENT_LOGO_URL_ATTR] if opponent_logo_tag else None
-        )
-        game_data["opponent_logo"] = (
-            BASE_URL + opponent_logo if opponent_logo else None
-        )
+    games = failed_games = 0
+    game_dates = set()
+    try:
+        for game_item in game_items:
+            try:
+                with stage("parse"):
+                    game_data = parse_game_item(game_item, sport, gender, season_years, window)
+                if game_data is None:
+                    continue
+                with stage("diff"):
+                    process_game_data(game_data)
+                games += 1
+                game_dates.add(game_data["utc_date"])
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                failed_games += 1
+                logging.error(f"Error scraping a {gender} {sport} game: {e}")
+    finally:
+        FeedService.rebuild_sport_feed(sport, gender)
+        SeasonRecordService.rebuild_records_for_dates(sport, gender, game_dates)
 
-        date_tag = game_item.select_one(DATE_TAG)
-        if date_tag:
-            date_text = date_tag.get_text(strip=True)
-        else:
-            date_text = ""
+    return {"games": games, "failed_games": failed_games}
 
-        time_tag = game_item.select_one(TIME_TAG)
-        time_text = time_tag.text.strip() if time_tag else None
-        
-        game_year = infer_game_year(date_text, season_years)
 
-        # keep old date field for now
-        if date_text and game_year:
-            full_date_text = f"{date_text} {game_year}"
-            game_data["date"] = full_date_text
-            game_data["utc_date"] = convert_to_utc(full_date_text, time_text)
-        else:
-            game_data["date"] = date_text
-            game_data["utc_date"] = None
+def parse_game_item(game_item, sport, gender, season_years, window=None):
+    """
+    Extract a game's data from its entry on a schedule page, scraping its box
+    score if it has one.
 
-        game_data["time"] = time_text
+    Returns:
+        dict: The game data, or None if the game is outside `window` or in an
+        archived season.
+    """
+    game_data = {}
+    game_data["gender"] = gender
+    game_data["sport"] = sport
 
-        location_tag = game_item.select_one(LOCATION_TAG)
-        game_data["location"] = location_tag.text.strip() if location_tag else None
+    opponent_name_tag = game_item.select_one(OPPONENT_NAME_TAG_A)
+    opponent_name = (
+        opponent_name_tag.text.strip()
+        if opponent_name_tag
+        else game_item.select_one(OPPONENT_NAME_TAG).text.strip()
+    )
+    game_data["opponent_name"] = opponent_name
 
-        result_tag = game_item.select_one(RESULT_TAG)
-        if result_tag:
-            game_data["result"] = result_tag.text.strip().replace("\n", "")
-        else:
-            game_data["result"] = None
-            
-        box_score_tag = game_item.select_one(BOX_SCORE_TAG)
-        if box_score_tag:
-            box_score_link = box_score_tag["href"]
-            game_details = scrape_game(f"{BASE_URL}{box_score_link}", sport.lower())
-            if game_details.get('error') == 'Sport parser not found':
-                game_data["box_score"] = None
-                game_data["score_breakdown"] = None
-            else:
-                game_data["box_score"] = game_details.get("scoring_summary")
-                game_data["score_breakdown"] = game_details.get("scores")
-
-                if sport in ["Baseball", "Football", "Lacrosse"]:
-                    location_data = game_data["location"].split("\n") if game_data["location"] else [""]
-                    geo_location = location_data[0]
-                    is_home_game = "Ithaca" in geo_location
-                    
-                    if is_home_game and game_data["box_score"]:
-                        for event in game_data["box_score"]:
-                            if "cor_score" in event and "opp_score" in event:
-                                event["cor_score"], event["opp_score"] = event["opp_score"], event["cor_score"]
+    opponent_logo_tag = game_item.select_one(OPPONENT_LOGO_TAG)
+    opponent_logo = (
+        opponent_logo_tag[OPPONENT_LOGO_URL_ATTR] if opponent_logo_tag else None
+    )
+    game_data["opponent_logo"] = (
+        BASE_URL + opponent_logo if opponent_logo else None
+    )
 
-        else:
+    date_tag = game_item.select_one(DATE_TAG)
+    if date_tag:
+        date_text = date_tag.get_text(strip=True)
+    else:
+        date_text = ""
+
+    time_tag = game_item.select_one(TIME_TAG)
+    time_text = time_tag.text.strip() if time_tag else None
+
+    game_year = infer_game_year(date_text, season_years)
+
+    # keep old date field for now
+    if date_text and game_year:
+        full_date_text = f"{date_text} {game_year}"
+        game_data["date"] = full_date_text
+        game_data["utc_date"] = convert_to_utc(full_date_text, time_text)
+    else:
+        game_data["date"] = date_text
+        game_data["utc_date"] = None
+
+    if window and not (game_data["utc_date"] and window[0] <= game_data["utc_date"] < window[1]):
+        return None
+
+    # Past seasons are archived; schedule pages still listing them are not re-scraped
+    if GameArchiveService.is_archived_date(game_data["utc_date"]):
+        return None
+
+    game_data["time"] = time_text
+
+    location_tag = game_item.select_one(LOCATION_TAG)
+    game_data["location"] = location_tag.text.strip() if location_tag else None
+
+    result_tag = game_item.select_one(RESULT_TAG)
+    if result_tag:
+        game_data["result"] = result_tag.text.strip().replace("\n", "")
+    else:
+        game_data["result"] = None
+
+    box_score_tag = game_item.select_one(BOX_SCORE_TAG)
+    if box_score_tag:
+        box_score_link = box_score_tag["href"]
+        game_details = scrape_game(f"{BASE_URL}{box_score_link}", sport.lower())
+        if game_details.get('error') == 'Sport parser not found':
             game_data["box_score"] = None
             game_data["score_breakdown"] = None
-        
-        ticket_link_tag = game_item.select_one(GAME_TICKET_LINK)
-        ticket_link = (
-        ticket_link_tag["href"] if ticket_link_tag else None
-        )
-        game_data["ticket_link"] = (
-            ticket_link if ticket_link else None
-        )
-        process_game_data(game_data)
+        else:
+            game_data["box_score"] = game_details.get("scoring_summary")
+            game_data["score_breakdown"] = game_details.get("scores")
+
+            if sport in ["Baseball", "Football", "Lacrosse"]:
+                location_data = game_data["location"].split("\n") if game_data["location"] else [""]
+                geo_location = location_data[0]
+                is_home_game = "Ithaca" in geo_location
+
+                if is_home_game and game_data["box_score"]:
+                    for event in game_data["box_score"]:
+                        if "cor_score" in event and "opp_score" in event:
+                            event["cor_score"], event["opp_score"] = event["opp_score"], event["cor_score"]
+
+    else:
+        game_data["box_score"] = None
+        game_data["score_breakdown"] = None
+
+    ticket_link_tag = game_item.select_one(GAME_TICKET_LINK)
+    ticket_link = (
+    ticket_link_tag["href"] if ticket_link_tag else None
+    )
+    game_data["ticket_link"] = (
+        ticket_link if ticket_link else None
+    )
+    return game_data
 
 
 def process_game_data(game_data):
@@ -194,7 +345,7 @@ def process_game_data(game_data):
         encoded_opponent_logo = ""
         if game_data["opponent_logo"]:
             try:
-                response = requests.get(game_data["opponent_logo"])
+                response = fetch(game_data["opponent_logo"])
                 response.raise_for_status()
                 encoded_opponent_logo = base64.b64encode(response.content).decode('utf-8')
             except Exception as e:
@@ -205,10 +356,8 @@ def process_game_data(game_data):
             "b64_image": encoded_opponent_logo,
             "name": game_data["opponent_name"],
         }
-        team = TeamService.create_team(team_data)
-
-    # ISO format
-    utc_date_str = game_data["utc_date"].isoformat() if game_data["utc_date"] else None
+        with stage("write"):
+            team = TeamService.create_team(team_data)
 
     game_time = game_data["time"]
     if game_time is None:
@@ -274,7 +423,7 @@ def process_game_data(game_data):
             "result": game_data["result"],
             "box_score": game_data["box_score"],
             "score_breakdown": game_data["score_breakdown"],
-            "utc_date": utc_date_str,
+            "utc_date": game_data["utc_date"],
             "city": city,
             "location": location,
             "state": state,
@@ -288,7 +437,12 @@ def process_game_data(game_data):
             if is_cornell_loss(game_data["result"]) and game_data["utc_date"]:
                 GameService.handle_tournament_loss(game_data["sport"], game_data["gender"], game_data["utc_date"])
                         
-        GameService.update_game(curr_game.id, updates)
+        changed = LiveScoreService.changed_fields(curr_game, updates)
+        with stage("write"):
+            updated = GameService.update_game(curr_game.id, updates)
+            if changed:
+                LiveScoreService.publish_change(curr_game, updates, changed)
+        count("updated" if updated else "unchanged")
         return
         
     game_data = {
@@ -303,8 +457,10 @@ def process_game_data(game_data):
         "time": game_time,
         "box_score": game_data["box_score"],
         "score_breakdown": game_data["score_breakdown"],
-        "utc_date": utc_date_str,
+        "utc_date": game_data["utc_date"],
         "ticket_link": game_data["ticket_link"]
     }
     
-    GameService.create_game(game_data)
\ No newline at end of file
+    with stage("write"):
+        created = GameService.create_game(game_data)
+    count("inserted" if created else "unchanged")
\ No newline at end of file
@@ -0,0 +1,191 @@
+"""
+Adaptive game scraping driven by the game calendar.
+
+Every sport is put in a tier from the games already stored for it, and the tier
+decides how often its schedule page is scraped:
+
+    live        a game started in the last LIVE_WINDOW or starts within LIVE_LEAD;
+                only those games are re-scraped, every 2 minutes
+    game_day    the next game starts within GAME_DAY_WINDOW; every 30 minutes
+    in_season   a game within IN_SEASON_WINDOW either side of now; every 6 hours
+    off_season  a game within SEASON_WINDOW either side of now; every 2 days
+    idle        nothing scheduled nearby; not scraped (new seasons are picked up
+                by the weekly full scrape)
+
+Usage (prints the current plan):
+    python -m src.scrapers.scrape_planner
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from src.scrapers.games_scraper import fetch_game_schedule, run_sport_jobs
+from src.services import FeedService, GameService
+from src.utils.constants import SCHEDULE_POSTFIX, SCHEDULE_PREFIX, SPORT_URLS
+
+LIVE_WINDOW = timedelta(hours=5)
+LIVE_LEAD = timedelta(minutes=15)
+GAME_DAY_WINDOW = timedelta(hours=12)
+IN_SEASON_WINDOW = timedelta(days=14)
+SEASON_WINDOW = timedelta(days=60)
+
+# Seconds between scrapes of a sport in each tier; None means never
+TIER_INTERVALS = {
+    "live": 2 * 60,
+    "game_day": 30 * 60,
+    "in_season": 6 * 60 * 60,
+    "off_season": 2 * 24 * 60 * 60,
+    "idle": None,
+}
+
+# How often the plan is recomputed and due sports are scraped (seconds)
+PLAN_INTERVAL = 60
+
+# Full scrape of every sport, to find newly published schedules (seconds)
+FULL_SCRAPE_INTERVAL = 7 * 24 * 60 * 60
+
+
+def plan_scrapes(now=None):
+    """
+    Computes the scrape tier and interval of every sport from the stored games.
+
+    Returns:
+        list: One dict per sport with its `key` (in SPORT_URLS), `sport`,
+        `gender`, `tier`, `interval` (seconds, or None) and a `reason`.
+    """
+    now = now or datetime.now(timezone.utc)
+    summaries = GameService.get_schedule_summary(now - SEASON_WINDOW, now + SEASON_WINDOW, now)
+
+    plan = []
+    for key, data in SPORT_URLS.items():
+        summary = summaries.get((data["sport"], data["gender"]), {})
+        tier, reason = _classify(now, summary.get("last_start"), summary.get("next_start"))
+        plan.append(
+            {
+                "key": key,
+                "sport": data["sport"],
+                "gender": data["gender"],
+                "tier": tier,
+                "interval": TIER_INTERVALS[tier],
+                "reason": reason,
+            }
+        )
+    return plan
+
+
+def _classify(now, last_start, next_start):
+    if last_start and now - last_start <= LIVE_WINDOW:
+        return "live", f"game started {_format(last_start)}"
+    if next_start and next_start - now <= LIVE_LEAD:
+        return "live", f"game starts {_format(next_start)}"
+    if next_start and next_start - now <= GAME_DAY_WINDOW:
+        return "game_day", f"next game {_format(next_start)}"
+    nearest = min(
+        (abs(start - now) for start in (last_start, next_start) if start), default=None
+    )
+    if nearest is not None and nearest <= IN_SEASON_WINDOW:
+        return "in_season", f"games within {IN_SEASON_WINDOW.days} days"
+    if nearest is not None:
+        return "off_season", f"games within {SEASON_WINDOW.days} days"
+    return "idle", "no games scheduled nearby"
+
+
+def _format(value):
+    return value.astimezone(timezone.utc).strftime("%b %d %H:%M UTC")
+
+
+def format_plan(plan):
+    """
+    Renders a plan as one line per sport, most frequently scraped first.
+    """
+    order = list(TIER_INTERVALS)
+    lines = []
+    for entry in sorted(plan, key=lambda entry: (order.index(entry["tier"]), entry["key"])):
+        interval = entry["interval"]
+        every = f"every {_format_interval(interval)}" if interval else "skipped"
+        lines.append(
+            f"{entry['sport']} ({entry['gender']}): {entry['tier']}, {every} - {entry['reason']}"
+        )
+    return "\n".join(lines)
+
+
+def _format_interval(seconds):
+    if seconds % (24 * 60 * 60) == 0:
+        return f"{seconds // (24 * 60 * 60)}d"
+    if seconds % (60 * 60) == 0:
+        return f"{seconds // (60 * 60)}h"
+    return f"{seconds // 60}m"
+
+
+class AdaptiveScrapeScheduler:
+    """
+    Scrapes each sport when its tier's interval has elapsed since its last
+    scrape. `run_due` is meant to be called every PLAN_INTERVAL seconds; the
+    plan is logged whenever a sport changes tier.
+    """
+
+    def __init__(self):
+        self._last_scraped = {}
+        self._last_tiers = None
+        self._lock = threading.Lock()
+
+    def scrape_all(self):
+        """
+        Scrape every sport's full schedule.
+        """
+        with self._lock:
+            started = time.monotonic()
+            fetch_game_schedule()
+            for key in SPORT_URLS:
+                self._last_scraped[key] = started
+
+    def run_due(self, now=None):
+        """
+        Recompute the plan and scrape the sports that are due.
+
+        Returns:
+            list: The plan that was applied.
+        """
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            now = now or datetime.now(timezone.utc)
+            plan = plan_scrapes(now)
+            self._report(plan)
+
+            started = time.monotonic()
+            due = [
+                entry
+                for entry in plan
+                if entry["interval"]
+                and started - self._last_scraped.get(entry["key"], float("-inf")) >= entry["interval"]
+            ]
+            jobs = []
+            for entry in due:
+                # Live sports only re-scrape the games around now
+                window = (now - LIVE_WINDOW, now + LIVE_LEAD) if entry["tier"] == "live" else None
+                url = SCHEDULE_PREFIX + entry["key"] + SCHEDULE_POSTFIX
+                jobs.append((url, entry["sport"], entry["gender"], window))
+                self._last_scraped[entry["key"]] = started
+
+            if jobs:
+                run_sport_jobs(jobs)
+                FeedService.rebuild_all_feed()
+            return plan
+        finally:
+            self._lock.release()
+
+    def _report(self, plan):
+        tiers = {entry["key"]: entry["tier"] for entry in plan}
+        if tiers != self._last_tiers:
+            logging.info("Scrape plan:\n" + format_plan(plan))
+            self._last_tiers = tiers
+
+
+scrape_scheduler = AdaptiveScrapeScheduler()
+
+
+if __name__ == "__main__":
+    print(format_plan(plan_scrapes()))
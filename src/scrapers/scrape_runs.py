@@ -0,0 +1,101 @@
+"""
+Lists and compares recorded scrape runs.
+
+Usage:
+    python -m src.scrapers.scrape_runs list [--limit 20] [--kind full|due]
+    python -m src.scrapers.scrape_runs compare [RUN_ID RUN_ID] [--kind full|due]
+
+`compare` without run IDs compares the two most recent runs (of `--kind`).
+"""
+
+import argparse
+import sys
+
+from src.services.scrape_run_service import ScrapeRunService
+from src.utils.scrape_ledger import STAGES
+
+
+def format_run(run):
+    totals = run["totals"]
+    stages = " ".join(f"{stage}={totals['stages'][stage]:.1f}s" for stage in STAGES)
+    return (
+        f"{run['_id']}  {run['started_at']:%Y-%m-%d %H:%M:%S}  {run['kind']:<4}  "
+        f"{run['elapsed']:7.1f}s  sports {totals['sports_ok']}/{totals['sports']}  "
+        f"pages {totals['pages_fetched']} (+{totals['pages_cached']} cached)  "
+        f"{totals['bytes'] / 1e6:6.1f} MB  "
+        f"games +{totals['inserted']} ~{totals['updated']} ={totals['unchanged']} "
+        f"!{totals['failed_games']}  {stages}"
+    )
+
+
+def list_runs(limit, kind):
+    runs = ScrapeRunService.get_recent_runs(limit=limit, kind=kind)
+    if not runs:
+        print("No scrape runs recorded")
+    for run in runs:
+        print(format_run(run))
+
+
+def compare_runs(run_ids, kind):
+    if run_ids:
+        runs = [ScrapeRunService.get_run(run_id) for run_id in run_ids]
+        missing = [run_id for run_id, run in zip(run_ids, runs) if run is None]
+        if missing:
+            sys.exit(f"Unknown scrape run(s): {', '.join(missing)}")
+        base, other = runs
+    else:
+        recent = ScrapeRunService.get_recent_runs(limit=2, kind=kind)
+        if len(recent) < 2:
+            sys.exit("Need at least two recorded runs to compare")
+        other, base = recent
+
+    print(f"A: {format_run(base)}")
+    print(f"B: {format_run(other)}")
+    print()
+
+    base_sports = {(sport["sport"], sport["gender"]): sport for sport in base["sports"]}
+    other_sports = {(sport["sport"], sport["gender"]): sport for sport in other["sports"]}
+    header = f"{'sport':<32} {'elapsed A':>10} {'elapsed B':>10} {'delta':>8}  " + "  ".join(
+        f"{stage + ' delta':>12}" for stage in STAGES
+    )
+    print(header)
+    for key in sorted(set(base_sports) | set(other_sports)):
+        a, b = base_sports.get(key), other_sports.get(key)
+        name = f"{key[1]} {key[0]}"
+        if not a or not b:
+            print(f"{name:<32} only in run {'A' if a else 'B'}")
+            continue
+        a_elapsed, b_elapsed = a["elapsed"] or 0, b["elapsed"] or 0
+        stage_deltas = "  ".join(
+            f"{b['stages'][stage] - a['stages'][stage]:>+11.1f}s" for stage in STAGES
+        )
+        status = "" if a["status"] == b["status"] else f"  ({a['status']} -> {b['status']})"
+        print(
+            f"{name:<32} {a_elapsed:>9.1f}s {b_elapsed:>9.1f}s {b_elapsed - a_elapsed:>+7.1f}s  "
+            f"{stage_deltas}{status}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="List recent runs, newest first")
+    list_parser.add_argument("--limit", type=int, default=20)
+    list_parser.add_argument("--kind", choices=["full", "due"])
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two runs per sport and stage")
+    compare_parser.add_argument("run_ids", nargs="*", metavar="RUN_ID")
+    compare_parser.add_argument("--kind", choices=["full", "due"])
+
+    args = parser.parse_args()
+    if args.command == "list":
+        list_runs(args.limit, args.kind)
+    else:
+        if len(args.run_ids) not in (0, 2):
+            parser.error("compare takes either no run IDs or exactly two")
+        compare_runs(args.run_ids, args.kind)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,218 @@
-import requests
 from src.utils.constants import CHANNEL_ID, VIDEO_LIMIT
 from dotenv import load_dotenv
-from src.models.youtube_video import YoutubeVideo
 from src.services.youtube_video_service import YoutubeVideoService
+from src.utils.helpers import extract_sport_from_title
+from src.utils.http_client import fetch
 import base64
 import os
 import html
-from bs4 import BeautifulSoup
+import logging
 
 load_dotenv()
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
 
+# Overridable so the ingester can be pointed at a local stub of the YouTube API
+YOUTUBE_API_URL = os.getenv("YOUTUBE_API_URL", "https://www.googleapis.com/youtube/v3")
 
-def fetch_videos():
+# videos.list accepts at most 50 IDs per request
+VIDEOS_BATCH_SIZE = 50
+
+# search.list returns at most 50 results per page
+SEARCH_PAGE_SIZE = 50
+
+# Upper bound on pages requested when catching up after downtime
+MAX_SEARCH_PAGES = 10
+
+
+def fetch_videos(channel_id=CHANNEL_ID):
     """
-    Fetches the latest videos from the YouTube API and stores them in the database.
+    Fetches videos published since the last sync from the YouTube API and
+    stores them in the database.
+
+    The first sync only requests the latest `VIDEO_LIMIT` videos. Later syncs
+    request everything published after the channel's watermark and page through
+    the results, newest first, so catching up after downtime is not capped by
+    `VIDEO_LIMIT`. A catch-up longer than `MAX_SEARCH_PAGES` pages continues on
+    the next sync with the videos published before the oldest one fetched; the
+    watermark only moves once the search has been paged to its end, so no
+    video in between is skipped.
     """
-    url = f"https://www.googleapis.com/youtube/v3/search?key={YOUTUBE_API_KEY}&channelId={CHANNEL_ID}&part=snippet,id&order=date&maxResults={VIDEO_LIMIT}"
-    response = requests.get(url)
-    data = response.json()
+    state = YoutubeVideoService.get_sync_state(channel_id)
+    watermark = state.get("published_after")
+    catch_up_before = state.get("catch_up_before")
+
+    params = {
+        "key": YOUTUBE_API_KEY,
+        "channelId": channel_id,
+        "part": "snippet,id",
+        "order": "date",
+        "type": "video",
+        "maxResults": VIDEO_LIMIT,
+    }
+    if watermark:
+        params["publishedAfter"] = watermark
+        params["maxResults"] = SEARCH_PAGE_SIZE
+        if catch_up_before:
+            params["publishedBefore"] = catch_up_before
+
+    items = []
+    completed = failed = False
+    for _ in range(MAX_SEARCH_PAGES):
+        response = fetch(f"{YOUTUBE_API_URL}/search", params=params)
+        data = response.json()
+        if "error" in data:
+            # Keep what was fetched, but leave the sync state for the next run
+            logging.error(f"Error searching YouTube videos: {data['error']}")
+            failed = True
+            break
+
+        items.extend(
+            item
+            for item in data.get("items", [])
+            if item.get("id", {}).get("kind") == "youtube#video"
+        )
+
+        page_token = data.get("nextPageToken")
+        if not watermark or not page_token:
+            completed = True
+            break
+        params["pageToken"] = page_token
+
+    ingest_video_items(items)
+    YoutubeVideoService.classify_unlabeled_videos()
+
+    published = [item["snippet"]["publishedAt"] for item in items if item["snippet"].get("publishedAt")]
+    newest = max(published, default=None)
+    if catch_up_before and state.get("catch_up_newest"):
+        # The newest videos were fetched by the sync that started the catch-up
+        newest = state["catch_up_newest"]
 
-    for item in data.get("items", []):
-        if item.get("id", {}).get("kind") != "youtube#video":
+    if completed:
+        # publishedAfter is inclusive, so the newest video comes back on every
+        # sync and is simply upserted again
+        if catch_up_before or (newest and (not watermark or newest > watermark)):
+            YoutubeVideoService.update_sync_state(
+                channel_id,
+                published_after=newest or watermark,
+                catch_up_before=None,
+                catch_up_newest=None,
+            )
+    elif not failed and published:
+        # Out of pages: continue before the oldest video fetched next time
+        YoutubeVideoService.update_sync_state(
+            channel_id, catch_up_before=min(published), catch_up_newest=newest
+        )
+
+
+def refresh_video_metadata():
+    """
+    Refreshes title, sport type, description, thumbnail and duration of every
+    stored video.
+    Meant to run at a low frequency, since regular syncs only look at new videos.
+    """
+    video_ids = YoutubeVideoService.get_all_video_ids()
+    updates = {}
+    for start in range(0, len(video_ids), VIDEOS_BATCH_SIZE):
+        batch = video_ids[start : start + VIDEOS_BATCH_SIZE]
+        try:
+            response = fetch(
+                f"{YOUTUBE_API_URL}/videos",
+                params={
+                    "key": YOUTUBE_API_KEY,
+                    "id": ",".join(batch),
+                    "part": "snippet,contentDetails",
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            print(f"Error refreshing video metadata: {e}")
             continue
-        process_video_item(item)
+
+        for item in data.get("items", []):
+            video_data = build_video_data(
+                {"id": {"videoId": item["id"]}, "snippet": item.get("snippet", {})},
+                None,
+                fetch_thumbnail=False,
+            )
+            duration_iso = item.get("contentDetails", {}).get("duration")
+            updates[item["id"]] = {
+                "title": video_data["title"],
+                "sports_type": extract_sport_from_title(video_data["title"]),
+                "description": video_data["description"],
+                "thumbnail": video_data["thumbnail"],
+                "duration": convert_iso_duration(duration_iso) if duration_iso else None,
+            }
+
+    YoutubeVideoService.update_videos(updates)
+    logging.info(f"Refreshed metadata for {len(updates)} YouTube videos")
+
+
+def ingest_video_items(items):
+    """
+    Stores a batch of search result items: durations and thumbnails are only
+    requested for videos not stored yet, and everything is written with a
+    single bulk upsert.
+    """
+    if not items:
+        return
+
+    video_ids = [item["id"]["videoId"] for item in items]
+    existing_ids = YoutubeVideoService.get_existing_video_ids(video_ids)
+    durations = get_video_durations(
+        [video_id for video_id in video_ids if video_id not in existing_ids]
+    )
+
+    videos_data = [
+        build_video_data(
+            item,
+            durations.get(item["id"]["videoId"]),
+            fetch_thumbnail=item["id"]["videoId"] not in existing_ids,
+        )
+        for item in items
+    ]
+    YoutubeVideoService.upsert_videos(videos_data)
+    logging.info(
+        f"Upserted {len(videos_data)} YouTube videos ({len(videos_data) - len(existing_ids)} new)"
+    )
+
+
+def get_video_durations(video_ids):
+    """
+    Gets video durations using the YouTube API, up to 50 IDs per request.
+
+    Returns:
+        dict: A mapping of video ID to readable duration.
+    """
+    durations = {}
+    for start in range(0, len(video_ids), VIDEOS_BATCH_SIZE):
+        batch = video_ids[start : start + VIDEOS_BATCH_SIZE]
+        try:
+            response = fetch(
+                f"{YOUTUBE_API_URL}/videos",
+                params={
+                    "key": YOUTUBE_API_KEY,
+                    "id": ",".join(batch),
+                    "part": "contentDetails",
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            for item in data.get("items", []):
+                duration_iso = item.get("contentDetails", {}).get("duration")
+                if duration_iso:
+                    durations[item["id"]] = convert_iso_duration(duration_iso)
+        except Exception as e:
+            print(f"Error getting video durations: {e}")
+    return durations
 
 
 def get_video_duration(video_id):
     """
     Gets video duration using YouTube API
     """
-    try:
-        url = f"https://www.googleapis.com/youtube/v3/videos?key={YOUTUBE_API_KEY}&id={video_id}&part=contentDetails"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data.get("items"):
-            duration_iso = data["items"][0]["contentDetails"]["duration"]
-            return convert_iso_duration(duration_iso)
-        return None
-    except Exception as e:
-        print(f"Error getting video duration: {e}")
-        return None
+    return get_video_durations([video_id]).get(video_id)
 
 
 def convert_iso_duration(iso_duration):
@@ -54,19 +224,19 @@ def convert_iso_duration(iso_duration):
     - PT30S -> 0:30
     """
     import re
-    
+
     # Remove PT prefix
     duration = iso_duration.replace('PT', '')
-    
+
     # Extract hours, minutes, seconds
     hours = re.search(r'(\d+)H', duration)
     minutes = re.search(r'(\d+)M', duration)
     seconds = re.search(r'(\d+)S', duration)
-    
+
     h = int(hours.group(1)) if hours else 0
     m = int(minutes.group(1)) if minutes else 0
     s = int(seconds.group(1)) if seconds else 0
-    
+
     # Format as MM:SS or HH:MM:SS
     if h > 0:
         return f"{h}:{m:02d}:{s:02d}"
@@ -74,10 +244,15 @@ def convert_iso_duration(iso_duration):
         return f"{m}:{s:02d}"
 
 
-def process_video_item(item):
+def build_video_data(item, duration, fetch_thumbnail=True):
     """
-    Extracts the required data from a video item and
-    passes it to be stored in the database.
+    Extracts the required data from a video item.
+
+    Args:
+        item (dict): A search result item from the YouTube API.
+        duration (str): The readable duration of the video, if known.
+        fetch_thumbnail (bool): Whether to download and encode the thumbnail.
+            Skipped for videos that are already stored.
     """
 
     video_id = item["id"]["videoId"]
@@ -93,9 +268,9 @@ def process_video_item(item):
         thumbnail = snippet.get("thumbnails", {}).get("default", {}).get("url")
 
     encoded_thumbnail = None
-    if thumbnail:
+    if thumbnail and fetch_thumbnail:
         try:
-            response = requests.get(thumbnail)
+            response = fetch(thumbnail)
             response.raise_for_status()
             encoded_thumbnail = base64.b64encode(response.content).decode("utf-8")
         except Exception as e:
@@ -104,10 +279,8 @@ def process_video_item(item):
     published_at = snippet.get("publishedAt")
     video_url = f"https://www.youtube.com/watch?v={video_id}"
 
-    duration = get_video_duration(video_id)
-
-    video_data = {
-        "id": video_id,  
+    return {
+        "id": video_id,
         "title": title,
         "description": description,
         "thumbnail": thumbnail,
@@ -116,15 +289,3 @@ def process_video_item(item):
         "published_at": published_at,
         "duration": duration,
     }
-    process_video_data(video_data)
-
-
-def process_video_data(video_data):
-    """
-    Adds Youtube video data to the database if it doesn't already exist.
-    """
-    existing_video = YoutubeVideoService.get_video_by_id(video_data["id"])
-    if existing_video:
-        return
-
-    YoutubeVideoService.create_video(video_data)
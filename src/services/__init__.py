@@ -1,4 +1,10 @@
 from .game_service import GameService
 from .team_service import TeamService
 from .youtube_video_service import YoutubeVideoService
-from .article_service import ArticleService
\ No newline at end of file
+from .article_service import ArticleService
+from .favorite_service import FavoriteService
+from .feed_service import FeedService
+from .live_score_service import LiveScoreService
+from .scrape_run_service import ScrapeRunService
+from .game_archive_service import GameArchiveService
+from .season_record_service import SeasonRecordService
@@ -0,0 +1,99 @@
+from datetime import datetime, timezone
+from src.repositories.favorite_repository import FavoriteRepository
+from src.repositories.game_repository import GameRepository
+from src.repositories.generation_repository import GenerationRepository
+from src.utils.ttl_cache import TTLCache
+
+# Per-user favorite game IDs. Writes through this process invalidate their
+# user's entry; writes by other workers clear the cache once they show up in
+# the users generation, which favorite writes bump.
+FAVORITES_CACHE_TTL = 10 * 60
+
+# How often (seconds) the users generation is checked for writes by other workers
+FAVORITES_GENERATION_CHECK_INTERVAL = 5
+
+favorites_cache = TTLCache(ttl=FAVORITES_CACHE_TTL, maxsize=10000)
+favorites_generation_cache = TTLCache(ttl=FAVORITES_GENERATION_CHECK_INTERVAL, maxsize=1)
+_cached_generation = None
+
+
+class FavoriteService:
+    @staticmethod
+    def get_favorite_game_ids(user_id):
+        """
+        Retrieve the IDs of a user's favorited games.
+
+        Args:
+            user_id (str): The ID of the user.
+
+        Returns:
+            list: The favorited game IDs (empty if the user does not exist).
+        """
+        FavoriteService.sync_favorites_cache()
+        game_ids = favorites_cache.get(user_id)
+        if game_ids is None:
+            game_ids = FavoriteRepository.find_game_ids(user_id) or []
+            favorites_cache.set(user_id, game_ids)
+        return game_ids
+
+    @staticmethod
+    def get_favorite_games(user_id, limit=None, offset=0, include_box_score=True):
+        """
+        Retrieve a user's favorited games, upcoming games first (soonest first),
+        followed by past games (most recent first).
+
+        Args:
+            user_id (str): The ID of the user.
+            limit (int): Maximum number of games to return. (optional)
+            offset (int): Number of games to skip.
+            include_box_score (bool): Whether to load the box score of each game.
+
+        Returns:
+            list: The favorited games.
+        """
+        game_ids = FavoriteService.get_favorite_game_ids(user_id)
+        return GameRepository.find_favorites(
+            game_ids,
+            datetime.now(timezone.utc),
+            limit=limit,
+            offset=offset,
+            include_box_score=include_box_score,
+        )
+
+    @staticmethod
+    def add_favorite_game(user_id, game_id):
+        """
+        Add a game to a user's favorites.
+
+        Returns:
+            bool: False if the game does not exist.
+        """
+        if not GameRepository.exists(game_id):
+            return False
+        FavoriteRepository.add_game(user_id, game_id)
+        favorites_cache.invalidate(user_id)
+        return True
+
+    @staticmethod
+    def remove_favorite_game(user_id, game_id):
+        """
+        Remove a game from a user's favorites.
+        """
+        FavoriteRepository.remove_game(user_id, game_id)
+        favorites_cache.invalidate(user_id)
+
+    @staticmethod
+    def sync_favorites_cache():
+        """
+        Clear the favorites cache if favorites were written since it was
+        filled, e.g. by another worker. Checked at most every
+        FAVORITES_GENERATION_CHECK_INTERVAL seconds.
+        """
+        global _cached_generation
+        if favorites_generation_cache.get("users") is not None:
+            return
+        generation = GenerationRepository.find_by_names(["users"])["users"]
+        favorites_generation_cache.set("users", generation)
+        if generation != _cached_generation:
+            favorites_cache.clear()
+            _cached_generation = generation
@@ -0,0 +1,122 @@
+from datetime import datetime, timezone
+from src.repositories.feed_repository import FeedRepository
+from src.repositories.game_repository import GameRepository
+from src.repositories.team_repository import TeamRepository
+
+# Number of upcoming games and recent results kept in each feed
+FEED_SIZE = 10
+
+ALL_SPORTS_KEY = "all"
+
+
+class FeedService:
+    @staticmethod
+    def get_feed(sport=None, gender=None, limit=None):
+        """
+        Retrieve the materialized feed of upcoming games and recent results,
+        either across all sports or for one sport and gender.
+
+        Args:
+            sport (str): The sport of the feed. (optional)
+            gender (str): The gender of the feed. (optional)
+            limit (int): Maximum number of upcoming and recent games. (optional)
+
+        Returns:
+            dict: The feed, or None if it has not been built yet.
+        """
+        key = FeedService.feed_key(sport, gender) if sport and gender else ALL_SPORTS_KEY
+        feed = FeedRepository.find_by_key(key)
+        if not feed:
+            return None
+
+        # Games that started since the last rebuild are no longer upcoming
+        now = datetime.now(timezone.utc)
+        feed["upcoming"] = [game for game in feed["upcoming"] if game["utc_date"] >= now]
+        if limit is not None:
+            feed["upcoming"] = feed["upcoming"][:limit]
+            feed["recent"] = feed["recent"][:limit]
+        return feed
+
+    @staticmethod
+    def rebuild_sport_feed(sport, gender):
+        """
+        Rebuild the feed of one sport and gender from the game collection.
+        """
+        now = datetime.now(timezone.utc)
+        upcoming = GameRepository.find_upcoming_by_sport_gender(sport, gender, now, FEED_SIZE)
+        recent = GameRepository.find_recent_by_sport_gender(sport, gender, now, FEED_SIZE)
+
+        team_ids = list({game.opponent_id for game in upcoming + recent})
+        teams = {team.id: team for team in TeamRepository.find_by_ids(team_ids, include_image=False)}
+
+        FeedRepository.replace(
+            FeedService.feed_key(sport, gender),
+            {
+                "sport": sport,
+                "gender": gender,
+                "upcoming": [FeedService.feed_entry(game, teams) for game in upcoming],
+                "recent": [FeedService.feed_entry(game, teams) for game in recent],
+                "updated_at": now,
+            },
+        )
+
+    @staticmethod
+    def rebuild_all_feed():
+        """
+        Rebuild the feed across all sports by merging the per-sport feeds.
+        """
+        now = datetime.now(timezone.utc)
+        upcoming = []
+        recent = []
+        for feed in FeedRepository.find_sport_feeds():
+            upcoming.extend(game for game in feed["upcoming"] if game["utc_date"] >= now)
+            recent.extend(feed["recent"])
+
+        upcoming.sort(key=lambda game: game["utc_date"])
+        recent.sort(key=lambda game: game["utc_date"], reverse=True)
+
+        FeedRepository.replace(
+            ALL_SPORTS_KEY,
+            {
+                "sport": None,
+                "gender": None,
+                "upcoming": upcoming[:FEED_SIZE],
+                "recent": recent[:FEED_SIZE],
+                "updated_at": now,
+            },
+        )
+
+    @staticmethod
+    def feed_key(sport, gender):
+        return f"{sport}|{gender}"
+
+    @staticmethod
+    def feed_entry(game, teams):
+        """
+        Build the pre-joined feed entry of a game: the game without its box score,
+        plus the opponent's name, color and logo URL.
+        """
+        team = teams.get(game.opponent_id)
+        return {
+            "id": game.id,
+            "city": game.city,
+            "date": game.date,
+            "gender": game.gender,
+            "location": game.location,
+            "opponent_id": game.opponent_id,
+            "result": game.result,
+            "sport": game.sport,
+            "state": game.state,
+            "time": game.time,
+            "score_breakdown": game.score_breakdown,
+            "utc_date": game.utc_date,
+            "ticket_link": game.ticket_link,
+            "team": {
+                "id": team.id,
+                "name": team.name,
+                "color": team.color,
+                "image": team.image,
+            }
+            if team
+            else None,
+        }
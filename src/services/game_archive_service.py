@@ -0,0 +1,110 @@
+import logging
+from datetime import datetime, timezone
+
+from src.repositories.game_archive_repository import GameArchiveRepository
+from src.repositories.game_repository import GameRepository
+from src.services.feed_service import FeedService
+
+# Seasons run from July 1 to June 30, so every sport's season (fall, winter
+# or spring) falls in a single one
+SEASON_START_MONTH = 7
+
+# Games moved per round trip when archiving
+ARCHIVE_BATCH_SIZE = 500
+
+
+class GameArchiveService:
+    @staticmethod
+    def season_of(utc_date):
+        """
+        Returns the season label of a game date, e.g. "2024-25" for a game in
+        October 2024 or March 2025.
+        """
+        year = utc_date.year if utc_date.month >= SEASON_START_MONTH else utc_date.year - 1
+        return f"{year}-{(year + 1) % 100:02d}"
+
+    @staticmethod
+    def season_bounds(season):
+        """
+        Returns the (start, end) datetimes of a season label such as "2024-25".
+        """
+        year = int(season[:4])
+        return (
+            datetime(year, SEASON_START_MONTH, 1, tzinfo=timezone.utc),
+            datetime(year + 1, SEASON_START_MONTH, 1, tzinfo=timezone.utc),
+        )
+
+    @staticmethod
+    def current_season_start(now=None):
+        """
+        Returns when the current season started. Games before it belong to
+        completed seasons and are archived.
+        """
+        now = now or datetime.now(timezone.utc)
+        year = now.year if now.month >= SEASON_START_MONTH else now.year - 1
+        return datetime(year, SEASON_START_MONTH, 1, tzinfo=timezone.utc)
+
+    @staticmethod
+    def is_archived_date(utc_date, now=None):
+        """
+        Whether a game on this date belongs to a completed, archived season.
+        """
+        return utc_date is not None and utc_date < GameArchiveService.current_season_start(now)
+
+    @staticmethod
+    def archive_past_seasons(now=None, batch_size=ARCHIVE_BATCH_SIZE):
+        """
+        Move the games of completed seasons from the 'game' collection to the
+        archive, so it only holds the current and next seasons. Each batch is
+        written to the archive before it is deleted, so an interrupted run loses
+        nothing and can be repeated. The feed is rebuilt if any game moved.
+
+        Returns:
+            int: The number of games archived.
+        """
+        cutoff = GameArchiveService.current_season_start(now)
+        archived = 0
+        while True:
+            games = GameRepository.find_before(cutoff, batch_size)
+            if not games:
+                break
+            GameArchiveRepository.upsert_many(games, GameArchiveService.season_of)
+            deleted = GameRepository.delete_games_by_ids([game.id for game in games])
+            archived += deleted
+            if not deleted:
+                break
+        if archived:
+            logging.info(f"Archived {archived} games from seasons before {cutoff:%Y-%m-%d}")
+            FeedService.rebuild_all_feed()
+        return archived
+
+    @staticmethod
+    def get_archived_games(
+        season, sport=None, gender=None, limit=100, offset=0, fields=None, team_fields=None
+    ):
+        """
+        Retrieves the archived games of a season, optionally of one sport and gender.
+        """
+        return GameArchiveRepository.find_by_season(
+            season,
+            sport=sport,
+            gender=gender,
+            limit=limit,
+            offset=offset,
+            fields=fields,
+            team_fields=team_fields,
+        )
+
+    @staticmethod
+    def get_archived_seasons(sport=None, gender=None):
+        """
+        Retrieves the archived seasons with their game counts per sport and gender.
+        """
+        return GameArchiveRepository.find_seasons(sport=sport, gender=gender)
+
+    @staticmethod
+    def get_archived_games_by_ids(game_ids, include_box_score=True):
+        """
+        Retrieves archived games by a list of IDs. Returns only games that exist.
+        """
+        return GameArchiveRepository.find_by_ids(game_ids, include_box_score=include_box_score)
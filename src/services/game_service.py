@@ -1,31 +1,37 @@
 from src.repositories.game_repository import GameRepository
+from src.repositories.game_archive_repository import GameArchiveRepository
 from src.models.game import Game
 from src.services.team_service import TeamService
-from src.utils.helpers import is_tournament_placeholder_team
+from src.utils.helpers import is_tournament_placeholder_team, parse_result
 from pymongo.errors import DuplicateKeyError
 
 
 class GameService:
     @staticmethod
-    def get_all_games(limit=100, offset=0):
+    def get_all_games(limit=100, offset=0, fields=None, team_fields=None):
         """
         Retrieves all games with pagination.
 
         Args:
             limit (int): Maximum number of records to return
             offset (int): Number of records to skip
+            fields (list): Fields to load, or None for all of them
+            team_fields (list): Team fields to join into each game, or None
 
         Returns:
             list: A list of game documents
         """
-        return GameRepository.find_all(limit=limit, offset=offset)
+        return GameRepository.find_all(
+            limit=limit, offset=offset, fields=fields, team_fields=team_fields
+        )
 
     @staticmethod
     def get_game_by_id(game_id):
         """
-        Retrieve a game by its ID.
+        Retrieve a game by its ID, looking in the archive of past seasons
+        if it is not a current game.
         """
-        return GameRepository.find_by_id(game_id)
+        return GameRepository.find_by_id(game_id) or GameArchiveRepository.find_by_id(game_id)
 
     @staticmethod
     def get_games_by_ids(game_ids):
@@ -37,13 +43,13 @@ class GameService:
     @staticmethod
     def create_game(data):
         """
-        Create a new game.
+        Create a new game, with its outcome and final score parsed from its result.
         """
         opponent_id = data.get("opponent_id")
         if not TeamService.get_team_by_id(opponent_id):
             raise ValueError(f"Opponent team with id {opponent_id} does not exist.")
 
-        game = Game(**data)
+        game = Game(**data, **parse_result(data.get("result")))
         try:
             GameRepository.insert(game)
             return game
@@ -60,9 +66,12 @@ class GameService:
     @staticmethod
     def update_game(game_id, data):
         """
-        Update a game by its ID.
+        Update a game by its ID, re-parsing its outcome and final score when
+        the result is updated. Returns whether any field actually changed.
         """
-        GameRepository.update_by_id(game_id, data)
+        if "result" in data:
+            data = {**data, **parse_result(data["result"])}
+        return GameRepository.update_by_id(game_id, data)
 
     @staticmethod
     def get_game_by_data(city, date, gender, location, opponent_id, sport, state, time):
@@ -93,32 +102,44 @@ class GameService:
         )
 
     @staticmethod
-    def get_games_by_sport(sport):
+    def get_games_by_sport(sport, fields=None, team_fields=None):
         """
         Retrieves all game by its sport.
         """
-        return GameRepository.find_by_sport(sport)
+        return GameRepository.find_by_sport(sport, fields=fields, team_fields=team_fields)
 
     @staticmethod
-    def get_games_by_gender(gender):
+    def get_games_by_gender(gender, fields=None, team_fields=None):
         """
         Retrieves all games by its gender.
         """
-        return GameRepository.find_by_gender(gender)
+        return GameRepository.find_by_gender(gender, fields=fields, team_fields=team_fields)
 
     @staticmethod
-    def get_games_by_sport_gender(sport, gender):
+    def get_games_by_sport_gender(sport, gender, fields=None, team_fields=None):
         """
         Retrieves all game by its sport and gender.
         """
-        return GameRepository.find_by_sport_gender(sport, gender)
+        return GameRepository.find_by_sport_gender(
+            sport, gender, fields=fields, team_fields=team_fields
+        )
     
     @staticmethod
-    def get_games_by_date(startDate, endDate):
+    def get_games_by_date(startDate, endDate, fields=None, team_fields=None):
         """
         Retrieves all games between these two dates.
         """
-        return GameRepository.find_by_date(startDate, endDate)
+        return GameRepository.find_by_date(
+            startDate, endDate, fields=fields, team_fields=team_fields
+        )
+
+    @staticmethod
+    def get_schedule_summary(start_date, end_date, now):
+        """
+        Retrieves, per (sport, gender), the latest game start at or before `now`
+        and the next one after it, among games between these two dates.
+        """
+        return GameRepository.find_schedule_summary(start_date, end_date, now)
 
     @staticmethod
     def get_tournament_games_by_sport_gender(sport, gender, after_date=None):
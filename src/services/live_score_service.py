@@ -0,0 +1,222 @@
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from src.repositories.game_change_repository import GameChangeRepository
+from src.utils.convert_to_utc import to_utc_iso
+
+# Game fields whose changes are pushed to live score subscribers
+LIVE_FIELDS = ("result", "box_score", "score_breakdown")
+
+# Changes buffered per subscriber before the oldest are dropped
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# Open streams per process. Each holds a gunicorn thread for the whole stream,
+# so this stays well below the worker's thread count (32, see the Dockerfile)
+# to leave threads for GraphQL requests
+MAX_SUBSCRIBERS = int(os.getenv("LIVE_MAX_SUBSCRIBERS") or 16)
+
+
+class TooManySubscribers(Exception):
+    """
+    Raised when a process already serves MAX_SUBSCRIBERS live streams.
+    """
+
+
+class LiveScoreService:
+    @staticmethod
+    def changed_fields(game, updates):
+        """
+        Returns the live fields whose value in `updates` differs from the stored game.
+        """
+        return [
+            field
+            for field in LIVE_FIELDS
+            if field in updates and updates[field] != getattr(game, field)
+        ]
+
+    @staticmethod
+    def publish_change(game, updates, fields):
+        """
+        Append a live score change for a game to the change feed.
+
+        Args:
+            game (Game): The game before the update.
+            updates (dict): The fields written to the game.
+            fields (List[str]): The live fields that changed.
+        """
+        _ensure_collection()
+        change = {
+            "game_id": game.id,
+            "sport": game.sport,
+            "gender": game.gender,
+            "changed": fields,
+            "changed_at": datetime.now(timezone.utc),
+        }
+        for field in LIVE_FIELDS:
+            change[field] = updates.get(field, getattr(game, field))
+        GameChangeRepository.insert(change)
+
+    @staticmethod
+    def subscribe(game_id=None, sport=None, gender=None, last_event_id=None):
+        """
+        Subscribe to live score changes, optionally for one game or one sport.
+
+        Args:
+            game_id (str): Only changes to this game. (optional)
+            sport (str): Only changes to games of this sport. (optional)
+            gender (str): Only changes to games of this gender. (optional)
+            last_event_id (str): Replay changes after this one, e.g. when an
+                SSE client reconnects. (optional)
+
+        Returns:
+            Subscription: A subscription to read changes from and close when done.
+
+        Raises:
+            TooManySubscribers: If MAX_SUBSCRIBERS streams are already open.
+        """
+        subscription = Subscription(game_id, sport, gender)
+        # Subscribe before replaying so no change falls between the two
+        live_score_broker.add(subscription)
+        after_id = _parse_object_id(last_event_id)
+        if after_id:
+            _ensure_collection()
+            for change in GameChangeRepository.find_after(after_id):
+                subscription.offer(change)
+        return subscription
+
+    @staticmethod
+    def to_event(change):
+        """
+        Formats a change as a Server-Sent Event whose id can be sent back as
+        Last-Event-ID to resume after it.
+        """
+        data = {
+            "gameId": change["game_id"],
+            "sport": change.get("sport"),
+            "gender": change.get("gender"),
+            "changed": change.get("changed", []),
+            "result": change.get("result"),
+            "boxScore": change.get("box_score"),
+            "scoreBreakdown": change.get("score_breakdown"),
+            "changedAt": to_utc_iso(change.get("changed_at")),
+        }
+        return f"id: {change['_id']}\nevent: score\ndata: {json.dumps(data)}\n\n"
+
+
+class Subscription:
+    """
+    A subscriber's filter and its queue of pending changes.
+    """
+
+    def __init__(self, game_id=None, sport=None, gender=None):
+        self.game_id = game_id
+        self.sport = sport
+        self.gender = gender
+        self._queue = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def matches(self, change):
+        return (
+            (self.game_id is None or change.get("game_id") == self.game_id)
+            and (self.sport is None or change.get("sport") == self.sport)
+            and (self.gender is None or change.get("gender") == self.gender)
+        )
+
+    def offer(self, change):
+        """
+        Queue a change if it matches; a slow subscriber loses its oldest changes.
+        """
+        if not self.matches(change):
+            return
+        while True:
+            try:
+                self._queue.put_nowait(change)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout):
+        """
+        Wait up to `timeout` seconds for the next change, or return None.
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        live_score_broker.remove(self)
+
+
+class LiveScoreBroker:
+    """
+    Tails the change feed in one background thread per process and fans
+    changes out to the process's subscribers. The thread starts with the
+    first subscriber.
+    """
+
+    def __init__(self):
+        self._subscriptions = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def add(self, subscription):
+        with self._lock:
+            if len(self._subscriptions) >= MAX_SUBSCRIBERS:
+                raise TooManySubscribers(f"{MAX_SUBSCRIBERS} live streams already open")
+            self._subscriptions.add(subscription)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="LiveScoreBroker", daemon=True)
+                self._thread.start()
+
+    def remove(self, subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def _run(self):
+        _ensure_collection()
+        last_id = GameChangeRepository.find_latest_id()
+        while True:
+            try:
+                # Each read waits server-side for new changes; a cursor opened on
+                # an empty feed dies and is reopened after the last change seen
+                cursor = GameChangeRepository.tail(last_id)
+                while cursor.alive:
+                    for change in cursor:
+                        last_id = change["_id"]
+                        with self._lock:
+                            subscriptions = list(self._subscriptions)
+                        for subscription in subscriptions:
+                            subscription.offer(change)
+            except Exception as e:
+                logging.error(f"Error tailing game changes: {e}")
+            time.sleep(1)
+
+
+def _parse_object_id(value):
+    try:
+        return ObjectId(value) if value else None
+    except (InvalidId, TypeError):
+        return None
+
+
+_collection_ready = False
+
+
+def _ensure_collection():
+    global _collection_ready
+    if not _collection_ready:
+        GameChangeRepository.ensure_collection()
+        _collection_ready = True
+
+
+live_score_broker = LiveScoreBroker()
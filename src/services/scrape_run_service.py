@@ -0,0 +1,53 @@
+from src.repositories.scrape_run_repository import ScrapeRunRepository
+from src.utils.scrape_ledger import COUNTERS, STAGES
+
+
+class ScrapeRunService:
+    @staticmethod
+    def record_run(kind, started_at, ended_at, reports):
+        """
+        Store a scrape run with its per-sport reports and their totals.
+
+        Args:
+            kind (str): What triggered the run ("full" or "due").
+            started_at (datetime): When the run started.
+            ended_at (datetime): When the run finished (or stopped waiting).
+            reports (list): The per-sport reports of `run_sport_jobs`.
+
+        Returns:
+            dict: The stored run.
+        """
+        sports = [dict(report, stages=dict(report["stages"])) for report in reports]
+        totals = {counter: sum(sport[counter] for sport in sports) for counter in COUNTERS}
+        totals["stages"] = {
+            stage: sum(sport["stages"][stage] for sport in sports) for stage in STAGES
+        }
+        totals["games"] = sum(sport["games"] for sport in sports)
+        totals["failed_games"] = sum(sport["failed_games"] for sport in sports)
+        totals["sports"] = len(sports)
+        totals["sports_ok"] = sum(1 for sport in sports if sport["status"] == "ok")
+
+        run = {
+            "kind": kind,
+            "started_at": started_at,
+            "ended_at": ended_at,
+            "elapsed": (ended_at - started_at).total_seconds(),
+            "sports": sports,
+            "totals": totals,
+        }
+        run["_id"] = ScrapeRunRepository.insert(run)
+        return run
+
+    @staticmethod
+    def get_recent_runs(limit=20, kind=None):
+        """
+        Retrieve the most recent scrape runs, newest first.
+        """
+        return ScrapeRunRepository.find_recent(limit=limit, kind=kind)
+
+    @staticmethod
+    def get_run(run_id):
+        """
+        Retrieve a scrape run by its ID.
+        """
+        return ScrapeRunRepository.find_by_id(run_id)
@@ -0,0 +1,108 @@
+from datetime import datetime, timezone
+
+from src.repositories.game_archive_repository import GameArchiveRepository
+from src.repositories.game_repository import GameRepository
+from src.repositories.season_record_repository import SeasonRecordRepository
+from src.services.game_archive_service import GameArchiveService
+
+
+class SeasonRecordService:
+    @staticmethod
+    def get_record(sport, gender, season=None):
+        """
+        Retrieve the precomputed record of a sport and gender over a season.
+
+        Args:
+            sport (str): The sport.
+            gender (str): The gender.
+            season (str): The season, e.g. "2024-25"; the current one if omitted.
+
+        Returns:
+            dict: The record document, or None if the season has no games.
+        """
+        season = season or GameArchiveService.season_of(GameArchiveService.current_season_start())
+        return SeasonRecordRepository.find_by_key(SeasonRecordService.record_key(sport, gender, season))
+
+    @staticmethod
+    def rebuild_records_for_dates(sport, gender, dates):
+        """
+        Rebuild the records of the seasons the given game dates fall in, e.g.
+        after a scrape of one sport.
+        """
+        seasons = {GameArchiveService.season_of(date) for date in dates if date}
+        for season in seasons:
+            SeasonRecordService.rebuild_record(sport, gender, season)
+
+    @staticmethod
+    def rebuild_record(sport, gender, season):
+        """
+        Rebuild the record of a sport, gender and season from its games, in the
+        game collection and in the archive. Nothing is stored for a season
+        without games, and the stored record is only replaced (and its
+        `updated_at` set) when it changed.
+        """
+        start_date, end_date = GameArchiveService.season_bounds(season)
+        games = GameArchiveRepository.find_results_by_season(sport, gender, season)
+        games += GameRepository.find_results_between(sport, gender, start_date, end_date)
+        if not games:
+            return
+
+        games.sort(key=lambda game: game.utc_date)
+        record = SeasonRecordService.build_record(games)
+        record.update({"sport": sport, "gender": gender, "season": season})
+
+        # Most scrapes change no result: leave the record (and its generation,
+        # which seasonRecord ETags depend on) alone unless it changed
+        key = SeasonRecordService.record_key(sport, gender, season)
+        stored = SeasonRecordRepository.find_by_key(key)
+        if stored is not None:
+            stored = {field: value for field, value in stored.items() if field not in ("_id", "updated_at")}
+            if stored == record:
+                return
+
+        record["updated_at"] = datetime.now(timezone.utc)
+        SeasonRecordRepository.replace(key, record)
+
+    @staticmethod
+    def build_record(games):
+        """
+        Compute the overall, home and away W-L-T record, the current streak and
+        the points for and against from games in date order. Games without a
+        win, loss or tie outcome are ignored.
+        """
+        splits = {side: {"wins": 0, "losses": 0, "ties": 0} for side in ("overall", "home", "away")}
+        counters = {"W": "wins", "L": "losses", "T": "ties"}
+        points_for = points_against = 0
+        played = [game for game in games if game.outcome in counters]
+
+        for game in played:
+            counter = counters[game.outcome]
+            side = "home" if game.city and "Ithaca" in game.city else "away"
+            splits["overall"][counter] += 1
+            splits[side][counter] += 1
+            points_for += game.cornell_score or 0
+            points_against += game.opponent_score or 0
+
+        streak = None
+        if played:
+            outcome = played[-1].outcome
+            length = 0
+            for game in reversed(played):
+                if game.outcome != outcome:
+                    break
+                length += 1
+            streak = f"{outcome}{length}"
+
+        return {
+            **splits["overall"],
+            "games_played": len(played),
+            "home": splits["home"],
+            "away": splits["away"],
+            "streak": streak,
+            "points_for": points_for,
+            "points_against": points_against,
+        }
+
+    @staticmethod
+    def record_key(sport, gender, season):
+        return f"{sport}|{gender}|{season}"
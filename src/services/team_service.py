@@ -1,13 +1,45 @@
-from src.repositories import TeamRepository
+from src.repositories import GenerationRepository, TeamRepository
 from src.models.team import Team
+from src.utils.ttl_cache import TTLCache
+
+# Teams by ID, shared by every request of the process. Bounded by the size of
+# the teams (logos are stored base64-encoded) rather than their number; writes
+# through TeamService invalidate their team, and writes by other processes
+# (the scraper) clear the cache once they show up in the team generation.
+TEAM_CACHE_TTL = 60 * 60
+TEAM_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# IDs with no team are remembered for less time
+MISSING_TEAM_TTL = 5 * 60
+
+# How often (seconds) the team generation is checked for writes by other processes
+TEAM_GENERATION_CHECK_INTERVAL = 5
+
+# Cached in place of a team that does not exist
+MISSING_TEAM = object()
+
+
+def team_size(team):
+    """
+    Approximate memory used by a cached team, dominated by its logo.
+    """
+    if team is MISSING_TEAM:
+        return 64
+    return 256 + sum(len(value) for value in (team.b64_image, team.image, team.name, team.color) if value)
+
+
+team_cache = TTLCache(ttl=TEAM_CACHE_TTL, maxsize=None, maxbytes=TEAM_CACHE_MAX_BYTES, sizeof=team_size)
+team_generation_cache = TTLCache(ttl=TEAM_GENERATION_CHECK_INTERVAL, maxsize=1)
+_cached_generation = None
+
 
 class TeamService:
     @staticmethod
-    def get_all_teams():
+    def get_all_teams(fields=None):
         """
-        Retrieve all teams.
+        Retrieve all teams, loading only `fields` when given.
         """
-        return TeamRepository.find_all()
+        return TeamRepository.find_all(fields=fields)
 
     @staticmethod
     def create_team(team_data):
@@ -33,20 +65,22 @@ class TeamService:
 
         team = Team(**team_data)
         TeamRepository.insert(team)
+        team_cache.invalidate(team.id)
         return team
 
     @staticmethod
     def get_team_by_id(team_id):
         """
-        Retrieve a team by ID.
+        Retrieve a team by ID, from the shared team cache when possible.
 
         Args:
             team_id (str): The ID of the team to retrieve.
 
         Returns:
-            Team: The retrieved team.
+            Team: The retrieved team, or None if it does not exist.
         """
-        return TeamRepository.find_by_id(team_id)
+        teams = TeamService.get_teams_by_ids([team_id])
+        return teams[0] if teams else None
 
     @staticmethod
     def delete_team(team_id):
@@ -57,6 +91,7 @@ class TeamService:
             team_id (str): The ID of the team to delete.
         """
         TeamRepository.delete_by_id(team_id)
+        team_cache.invalidate(team_id)
 
     @staticmethod
     def update_team(team_id, team_data):
@@ -68,6 +103,7 @@ class TeamService:
             team_data (dict): The updated data for the team.
         """
         TeamRepository.update_by_id(team_id, team_data)
+        team_cache.invalidate(team_id)
 
     @staticmethod
     def get_team_by_name(name):
@@ -85,12 +121,48 @@ class TeamService:
     @staticmethod
     def get_teams_by_ids(team_ids):
         """
-        Retrieve teams by a list of IDs.
+        Retrieve teams by a list of IDs. Teams (and IDs without a team) are
+        served from the shared team cache; only the rest are loaded.
 
         Args:
             team_ids (list): The list of team IDs to retrieve.
 
         Returns:
-            list: The list of retrieved teams.
+            list: The list of retrieved teams; IDs without a team are left out.
+        """
+        TeamService.sync_team_cache()
+
+        teams = {}
+        uncached = []
+        for team_id in team_ids:
+            team = team_cache.get(team_id)
+            if team is None:
+                uncached.append(team_id)
+            elif team is not MISSING_TEAM:
+                teams[team_id] = team
+
+        if uncached:
+            for team in TeamRepository.find_by_ids(uncached):
+                teams[team.id] = team
+                team_cache.set(team.id, team)
+            for team_id in uncached:
+                if team_id not in teams:
+                    team_cache.set(team_id, MISSING_TEAM, ttl=MISSING_TEAM_TTL)
+
+        return [teams[team_id] for team_id in dict.fromkeys(team_ids) if team_id in teams]
+
+    @staticmethod
+    def sync_team_cache():
+        """
+        Clear the shared team cache if the team collection was written since it
+        was filled, e.g. by the scraper process. Checked at most every
+        TEAM_GENERATION_CHECK_INTERVAL seconds.
         """
-        return TeamRepository.find_by_ids(team_ids)
\ No newline at end of file
+        global _cached_generation
+        if team_generation_cache.get("team") is not None:
+            return
+        generation = GenerationRepository.find_by_names(["team"])["team"]
+        team_generation_cache.set("team", generation)
+        if generation != _cached_generation:
+            team_cache.clear()
+            _cached_generation = generation
\ No newline at end of file
@@ -1,14 +1,23 @@
 from src.repositories.youtube_video_repository import YoutubeVideoRepository
+from src.repositories.sync_state_repository import SyncStateRepository
 from src.models.youtube_video import YoutubeVideo
+from src.utils.helpers import extract_sport_from_title
 
 
 class YoutubeVideoService:
     @staticmethod
-    def get_all_videos():
+    def get_all_videos(fields=None):
         """
-        Retrieve all stored YouTube videos.
+        Retrieve all stored YouTube videos, loading only `fields` when given.
         """
-        return YoutubeVideoRepository.find_all()
+        return YoutubeVideoRepository.find_all(fields=fields)
+
+    @staticmethod
+    def get_videos_by_sports_type(sports_type, fields=None):
+        """
+        Retrieve stored YouTube videos of a sport, newest first.
+        """
+        return YoutubeVideoRepository.find_by_sports_type(sports_type, fields=fields)
 
     @staticmethod
     def get_video_by_id(video_id):
@@ -31,10 +40,93 @@ class YoutubeVideoService:
             url=data.get("url"),
             published_at=data.get("published_at"),
             duration=data.get("duration"),
+            sports_type=extract_sport_from_title(data.get("title")),
         )
         YoutubeVideoRepository.insert(video)
         return video
 
+    @staticmethod
+    def get_existing_video_ids(video_ids):
+        """
+        Return the subset of the given video IDs that are already stored.
+        """
+        return YoutubeVideoRepository.find_existing_ids(video_ids)
+
+    @staticmethod
+    def upsert_videos(videos_data):
+        """
+        Create or update multiple YouTube videos in a single bulk write.
+        """
+        videos = [
+            YoutubeVideo(
+                id=data.get("id"),
+                title=data.get("title"),
+                description=data.get("description"),
+                thumbnail=data.get("thumbnail"),
+                b64_thumbnail=data.get("b64_thumbnail"),
+                url=data.get("url"),
+                published_at=data.get("published_at"),
+                duration=data.get("duration"),
+                sports_type=extract_sport_from_title(data.get("title")),
+            )
+            for data in videos_data
+        ]
+        YoutubeVideoRepository.bulk_upsert(videos)
+        return videos
+
+    @staticmethod
+    def get_all_video_ids():
+        """
+        Retrieve the IDs of all stored YouTube videos.
+        """
+        return YoutubeVideoRepository.find_all_ids()
+
+    @staticmethod
+    def update_videos(updates):
+        """
+        Update several YouTube videos at once.
+
+        Args:
+            updates (dict): A mapping of video ID to the fields to set.
+        """
+        YoutubeVideoRepository.bulk_update(updates)
+
+    @staticmethod
+    def classify_unlabeled_videos():
+        """
+        Store the sport type on videos that were ingested before it was
+        classified at ingest time.
+        """
+        videos = YoutubeVideoRepository.find_without_sports_type()
+        YoutubeVideoRepository.bulk_update(
+            {
+                video.id: {"sports_type": extract_sport_from_title(video.title)}
+                for video in videos
+            }
+        )
+
+    @staticmethod
+    def get_sync_state(channel_id):
+        """
+        Retrieve the sync state of a channel: `published_after`, the newest
+        `published_at` of a completed sync, and while a catch-up is unfinished,
+        `catch_up_before` (the oldest video fetched so far) and
+        `catch_up_newest` (the newest, the next watermark).
+
+        Returns:
+            dict: The state, empty if the channel was never synced.
+        """
+        state = SyncStateRepository.find_by_key(f"youtube:{channel_id}") or {}
+        state.pop("_id", None)
+        return state
+
+    @staticmethod
+    def update_sync_state(channel_id, **fields):
+        """
+        Store fields of a channel's sync state; a None value clears the field.
+        """
+        SyncStateRepository.update_by_key(f"youtube:{channel_id}", fields)
+
     @staticmethod
     def update_video(video_id, data):
         """
@@ -1,5 +1,7 @@
-from graphene import ObjectType, Field, String, List, Int
+from graphene import ObjectType, Field, String, List, Int, DateTime
 from datetime import datetime
+from src.models.team import Team
+from src.utils.convert_to_utc import to_utc_iso
 
 class TeamType(ObjectType):
     """
@@ -73,7 +75,8 @@ class ScoreBreakdownType(ObjectType):
 
 class GameType(ObjectType):
     """
-    A GraphQL type representing a game.
+    A GraphQL type representing a game. Resolves fields directly from the
+    `Game` view returned by the services, without copying it.
 
     Attributes:
         - `id`: The ID of the game (optional).
@@ -89,6 +92,9 @@ class GameType(ObjectType):
         - `box_score`: The box score of the game.
         - `score_breakdown`: The score breakdown of the game.
         - `ticket_link`: The ticket link of the game. (optional)
+        - `outcome`: "W", "L" or "T", parsed from the result. (optional)
+        - `cornell_score`: Cornell's final score, parsed from the result. (optional)
+        - `opponent_score`: The opponent's final score, parsed from the result. (optional)
     """
 
     id = String(required=False)
@@ -106,44 +112,24 @@ class GameType(ObjectType):
     team = Field(TeamType, required=False)
     utc_date = String(required=False)
     ticket_link = String(required=False)
-    def __init__(
-        self, id, city, date, gender, location, opponent_id, result, sport, state, time, box_score=None, score_breakdown=None, utc_date=None, ticket_link=None
-    ):
-        self.id = id    
-        self.city = city
-        self.date = date
-        self.gender = gender
-        self.location = location
-        self.opponent_id = opponent_id
-        self.result = result
-        self.sport = sport
-        self.state = state
-        self.time = time
-        self.box_score = box_score
-        self.score_breakdown = score_breakdown
-        self.utc_date = utc_date
-        self.ticket_link = ticket_link
-    @staticmethod
-    def team_to_team_type(team_obj):
-        if team_obj is None:
-            return None
-        return TeamType(
-            id=str(team_obj.id),
-            color=team_obj.color,
-            image=team_obj.image,
-            b64_image=team_obj.b64_image,
-            name=team_obj.name
-        )
+    outcome = String(required=False)
+    cornell_score = Int(required=False)
+    opponent_score = Int(required=False)
 
     def resolve_team(parent, info):
+        # list queries join the team in their own query when it is selected
+        if parent.is_team_joined:
+            return Team.from_dict(parent.joined_team) if parent.joined_team else None
         # getting team id - team could be None in older data
         team_id = parent.team if parent.team is not None else parent.opponent_id
         if team_id and isinstance(team_id, str):
-            # promise to get team object once    the dataloader is ready
-            promise = info.context["team_loader"].load(team_id)
-            return promise.then(GameType.team_to_team_type)
+            # promise resolving to the Team once the dataloader is ready
+            return info.context["team_loader"].load(team_id)
         return None
 
+    def resolve_utc_date(parent, info):
+        return to_utc_iso(parent.utc_date)
+
 class YoutubeVideoType(ObjectType):
     """
     A GraphQL type representing a YouTube video.
@@ -156,7 +142,7 @@ class YoutubeVideoType(ObjectType):
         - url: The URL to the video.
         - published_at: The date and time the video was published.
         - duration: The duration of the video (optional).
-        - sportsType: The sport type extracted from the video title.
+        - sportsType: The sport type classified from the video title at ingest time.
     """
     id = String(required=False)
     title = String(required=True)
@@ -174,10 +160,9 @@ class YoutubeVideoType(ObjectType):
 
     def resolve_sportsType(video, info):
         """
-        Resolver to extract sport type from the video title.
+        Resolver for the sport type stored on the video at ingest time.
         """
-        from src.utils.helpers import extract_sport_from_title
-        return extract_sport_from_title(video.title)
+        return video.sports_type
 
 class ArticleType(ObjectType):
     """
@@ -199,4 +184,130 @@ class ArticleType(ObjectType):
 
     def __init__(self, **kwargs):
         for key, value in kwargs.items():
-            setattr(self, key, value)
\ No newline at end of file
+            setattr(self, key, value)
+
+    def resolve_published_at(article, info):
+        return to_utc_iso(article.published_at, z_suffix=True)
+
+class FeedGameType(ObjectType):
+    """
+    A GraphQL type representing a game in the materialized feed, with the
+    opponent's team info embedded.
+
+    Attributes:
+        - `id`: The ID of the game.
+        - `city`: The city of the game.
+        - `date`: The date of the game.
+        - `gender`: The gender of the game.
+        - `location`: The location of the game. (optional)
+        - `opponent_id`: The id of the opposing team.
+        - `result`: The result of the game. (optional)
+        - `sport`: The sport of the game.
+        - `state`: The state of the game.
+        - `time`: The time of the game. (optional)
+        - `score_breakdown`: The score breakdown of the game.
+        - `utc_date`: The date and time of the game in UTC.
+        - `ticket_link`: The ticket link of the game. (optional)
+        - `team`: The opposing team's name, color and logo URL.
+    """
+
+    id = String(required=True)
+    city = String(required=False)
+    date = String(required=True)
+    gender = String(required=True)
+    location = String(required=False)
+    opponent_id = String(required=True)
+    result = String(required=False)
+    sport = String(required=True)
+    state = String(required=False)
+    time = String(required=False)
+    score_breakdown = List(List(String), required=False)
+    utc_date = String(required=False)
+    ticket_link = String(required=False)
+    team = Field(TeamType, required=False)
+
+    def resolve_utc_date(game, info):
+        return to_utc_iso(game["utc_date"])
+
+class FeedType(ObjectType):
+    """
+    A GraphQL type representing the home screen feed of upcoming games and
+    recent results.
+
+    Attributes:
+        - `sport`: The sport of the feed, or null for all sports.
+        - `gender`: The gender of the feed, or null for all sports.
+        - `upcoming`: The next games, soonest first.
+        - `recent`: The latest results, most recent first.
+        - `updated_at`: When the feed was last rebuilt.
+    """
+
+    sport = String(required=False)
+    gender = String(required=False)
+    upcoming = List(FeedGameType)
+    recent = List(FeedGameType)
+    updated_at = DateTime(required=False)
+
+class ArchivedSeasonType(ObjectType):
+    """
+    A GraphQL type representing a season of a sport in the game archive.
+
+    Attributes:
+        - `season`: The season, e.g. "2023-24".
+        - `sport`: The sport.
+        - `gender`: The gender.
+        - `game_count`: The number of archived games.
+    """
+
+    season = String(required=True)
+    sport = String(required=True)
+    gender = String(required=True)
+    game_count = Int(required=True)
+
+class RecordSplitType(ObjectType):
+    """
+    A GraphQL type representing a win-loss-tie record.
+
+    Attributes:
+        - `wins`: The number of wins.
+        - `losses`: The number of losses.
+        - `ties`: The number of ties.
+    """
+
+    wins = Int(required=True)
+    losses = Int(required=True)
+    ties = Int(required=True)
+
+class SeasonRecordType(ObjectType):
+    """
+    A GraphQL type representing a team's record over a season.
+
+    Attributes:
+        - `sport`: The sport.
+        - `gender`: The gender.
+        - `season`: The season, e.g. "2024-25".
+        - `wins`: The number of wins.
+        - `losses`: The number of losses.
+        - `ties`: The number of ties.
+        - `games_played`: The number of games with a result.
+        - `home`: The record in Ithaca.
+        - `away`: The record elsewhere, including neutral sites.
+        - `streak`: The current streak, e.g. "W3". (optional)
+        - `points_for`: Cornell's total score. (optional)
+        - `points_against`: The opponents' total score. (optional)
+        - `updated_at`: When the record was last rebuilt.
+    """
+
+    sport = String(required=True)
+    gender = String(required=True)
+    season = String(required=True)
+    wins = Int(required=True)
+    losses = Int(required=True)
+    ties = Int(required=True)
+    games_played = Int(required=True)
+    home = Field(RecordSplitType, required=True)
+    away = Field(RecordSplitType, required=True)
+    streak = String(required=False)
+    points_for = Int(required=False)
+    points_against = Int(required=False)
+    updated_at = DateTime(required=False)
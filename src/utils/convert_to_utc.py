@@ -67,4 +67,31 @@ def convert_to_utc(date_str, time_str, eastern_tz=pytz.timezone('US/Eastern')):
     except Exception as e:
         print(f"Error converting date/time to UTC: {e} for date={date_str}, time={time_str}")
     
-    return None
\ No newline at end of file
+    return None
+
+def parse_utc_iso(value):
+    """
+    Parse an ISO 8601 string (e.g. "2024-08-31T16:00:00+00:00" or
+    "2024-08-31T16:00:00Z") into a UTC datetime. Datetimes are passed through.
+    """
+    if not value or isinstance(value, datetime):
+        return value
+
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+def to_utc_iso(value, z_suffix=False):
+    """
+    Format a stored UTC datetime as an ISO 8601 string, as exposed by the API
+    (e.g. "2024-08-31T16:00:00+00:00", or "2024-08-31T16:00:00Z" with `z_suffix`).
+    Strings are passed through.
+    """
+    if not isinstance(value, datetime):
+        return value
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    iso = value.astimezone(timezone.utc).isoformat()
+    return iso.replace("+00:00", "Z") if z_suffix else iso
@@ -0,0 +1,142 @@
+import itertools
+from contextlib import nullcontext
+
+from flask import Response, request
+from flask_graphql import GraphQLView
+from graphql_server import HttpQueryError, encode_execution_results, run_http_query
+
+from src.database import replica_reads
+from src.utils.http_cache import query_etag, root_fields
+from src.utils.json_stream import compress_chunks, iter_chunks, iter_json, negotiate_encoding
+
+# Bodies smaller than this (bytes) are sent uncompressed
+COMPRESSION_THRESHOLD = 1024
+
+
+class StreamingGraphQLView(GraphQLView):
+    """
+    A GraphQLView that streams query results as chunked JSON.
+
+    The result tree is encoded piece by piece (one encoder call per list item)
+    instead of in a single `json.dumps`, and is gzip or brotli compressed as it
+    is sent when the client accepts it and the body is large enough. GraphiQL
+    and `?pretty` requests are handled by GraphQLView as before.
+
+    GET queries that only read shared data carry an ETag built from the
+    generation counters of the collections they read, so a conditional request
+    is answered with 304 Not Modified without executing the query.
+
+    Requests that only run queries read with the configured read preference
+    (see `replica_reads`); mutations read and write on the primary.
+    """
+
+    def dispatch_request(self):
+        request_method = request.method.lower()
+        if request.args.get("pretty") or (
+            request_method == "get" and self.should_display_graphiql()
+        ):
+            return super().dispatch_request()
+
+        encoding = negotiate_encoding(request.accept_encodings)
+        etag = None
+        if request_method == "get" and request.args.get("query"):
+            etag = query_etag(
+                request.args["query"],
+                request.args.get("variables"),
+                request.args.get("operationName"),
+                encoding,
+            )
+            if etag and request.if_none_match.contains(etag):
+                return Response(status=304, headers=self.cache_headers(etag))
+
+        try:
+            data = self.parse_body()
+            extra_options = {}
+            executor = self.get_executor()
+            if executor:
+                extra_options["executor"] = executor
+
+            read_scope = replica_reads() if self.is_read_only(data) else nullcontext()
+            with read_scope:
+                execution_results, _ = run_http_query(
+                    self.schema,
+                    request_method,
+                    data,
+                    query_data=request.args,
+                    batch_enabled=self.batch,
+                    catch=False,
+                    backend=self.get_backend(),
+                    root=self.get_root_value(),
+                    context=self.get_context(),
+                    middleware=self.get_middleware(),
+                    **extra_options
+                )
+            # Keep the formatted result as a tree; it is encoded while streaming
+            result, status_code = encode_execution_results(
+                execution_results,
+                is_batch=isinstance(data, list),
+                format_error=self.format_error,
+                encode=lambda result: result,
+            )
+        except HttpQueryError as e:
+            return Response(
+                self.encode({"errors": [self.format_error(e)]}),
+                status=e.status_code,
+                headers=e.headers,
+                content_type="application/json",
+            )
+
+        headers = self.cache_headers(etag) if etag and status_code == 200 else {}
+        return self.stream_response(result, status_code, encoding, headers)
+
+    @staticmethod
+    def is_read_only(data):
+        """
+        Whether every operation of a (possibly batched) request is a query.
+        Request body parameters take precedence over the query string, as in
+        `run_http_query`.
+        """
+        operations = data if isinstance(data, list) else [data]
+        for params in operations:
+            params = params if isinstance(params, dict) else {}
+            query = params.get("query") or request.args.get("query")
+            operation_name = params.get("operationName") or request.args.get("operationName")
+            if not query or root_fields(query, operation_name) is None:
+                return False
+        return True
+
+    @staticmethod
+    def cache_headers(etag):
+        """
+        Validator headers for a cacheable query; clients must revalidate every time.
+        """
+        return {"ETag": f'"{etag}"', "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+    def stream_response(self, result, status_code, encoding, headers):
+        """
+        Builds a chunked JSON response for a result, compressed with `encoding`
+        unless the whole body fits under COMPRESSION_THRESHOLD.
+        """
+        chunks = iter_chunks(iter_json(result))
+        first = next(chunks, b"")
+        headers = dict(headers, Vary="Accept-Encoding")
+
+        if len(first) < COMPRESSION_THRESHOLD:
+            rest = next(chunks, None)
+            if rest is None:
+                return Response(
+                    first, status=status_code, headers=headers, content_type="application/json"
+                )
+            chunks = itertools.chain([first, rest], chunks)
+        else:
+            chunks = itertools.chain([first], chunks)
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(
+            compress_chunks(chunks, encoding),
+            status=status_code,
+            headers=headers,
+            content_type="application/json",
+            direct_passthrough=True,
+        )
@@ -1,5 +1,5 @@
 import logging
-import requests
+from src.utils.http_client import fetch
 from PIL import Image
 from io import BytesIO
 from collections import Counter
@@ -21,7 +21,7 @@ def get_dominant_color(image_url, white_threshold=200, black_threshold=50):
     default_color = "#000000" 
 
     try:
-        response = requests.get(image_url)
+        response = fetch(image_url)
         image = Image.open(BytesIO(response.content)).convert("RGBA")
 
         image = image.resize((50, 50))
@@ -97,6 +97,32 @@ def is_cornell_loss(result: str):
     loss_indicators = ["L", "Loss", "loss", "Defeated", "defeated"]
     return any(indicator in result for indicator in loss_indicators)
 
+# Results like "W, 3-1", "L, 2-3 (OT)" or "T, 1-1 (2OT)": Cornell's outcome and the score
+RESULT_PATTERN = re.compile(r"^\s*([WLT])\b[\s,]*(?:(\d+)\s*-\s*(\d+))?")
+
+def parse_result(result: str):
+    """
+    Parse a game's free-text result into structured fields.
+
+    Returns:
+        dict: `outcome` ("W", "L" or "T"), `cornell_score` and `opponent_score`
+        (ints); all None when the result is missing or not a win, loss or tie
+        (e.g. a placing in a multi-team event).
+    """
+    match = RESULT_PATTERN.match(result) if result else None
+    if not match:
+        return {"outcome": None, "cornell_score": None, "opponent_score": None}
+    outcome, first, second = match.groups()
+    if first is None:
+        return {"outcome": outcome, "cornell_score": None, "opponent_score": None}
+    # Pages differ on whose score comes first, but the outcome tells them apart
+    high, low = max(int(first), int(second)), min(int(first), int(second))
+    return {
+        "outcome": outcome,
+        "cornell_score": low if outcome == "L" else high,
+        "opponent_score": high if outcome == "L" else low,
+    }
+
 def extract_sport_from_title(title):
     """
     Extracts the sport type from a YouTube video title.
@@ -107,38 +133,16 @@ def extract_sport_from_title(title):
     Returns:
         str: The sport type if found, None otherwise
     """
+    from .sport_classifier import VIDEO_SPORT_CLASSIFIER
+
     if not title:
         return None
-    
+
+    sport_name = VIDEO_SPORT_CLASSIFIER.classify(title)
+    if sport_name:
+        return sport_name
+
     title_lower = title.lower()
-    
-    sport_patterns = [
-        # Ice Hockey
-        (r"ice\s+hockey", "Ice Hockey"),
-        (r"women'?s\s+ice\s+hockey", "Ice Hockey"),
-        (r"men'?s\s+ice\s+hockey", "Ice Hockey"),
-        # Field Hockey
-        (r"field\s+hockey", "Field Hockey"),
-        # Hockey
-        (r"\bhockey\b", "Ice Hockey"),
-        # Basketball
-        (r"basketball", "Basketball"),
-        # Football
-        (r"\bfootball\b", "Football"),
-        # Soccer
-        (r"\bsoccer\b", "Soccer"),
-        # Volleyball
-        (r"volleyball", "Volleyball"),
-        # Wrestling
-        (r"wrestling", "Wrestling"),
-        # Sprint Football
-        (r"sprint\s+football", "Sprint Football"),
-    ]
-    
-    for pattern, sport_name in sport_patterns:
-        if re.search(pattern, title_lower):
-            return sport_name
-    
     if "ice" in title_lower and ("hockey" in title_lower or "cornell" in title_lower):
         return "Ice Hockey"
     
@@ -154,36 +158,9 @@ def extract_sport_type_from_title(title: str):
     Returns:
         str: The sport name if found, otherwise "sports" as default
     """
-    from .constants import SPORT_URLS
-    
+    from .sport_classifier import ARTICLE_SPORT_CLASSIFIER
+
     if not title:
         return "sports"
-    
-    # Get all unique sport names from SPORT_URLS
-    sport_names = set()
-    for sport_data in SPORT_URLS.values():
-        sport_name = sport_data["sport"].strip()
-        if sport_name:
-            sport_names.add(sport_name)
-    
-    # Sort by length (longest first) to match "Swimming & Diving" before "Swimming"
-    sport_names_sorted = sorted(sport_names, key=len, reverse=True)
-    
-    title_lower = title.lower()
-    
-    for sport_name in sport_names_sorted:
-        if sport_name.lower() in title_lower:
-            return sport_name
-    
-    # Special mappings for common variations in titles
-    # Only checked if no exact match found above
-    # e.g., "Hockey" in title should match "Ice Hockey" in sport names
-    special_mappings = {
-        "hockey": "Ice Hockey",  # "Men's Hockey" or "Women's Hockey" → "Ice Hockey"
-    }
-    
-    for keyword, sport_name in special_mappings.items():
-        if keyword in title_lower and sport_name in sport_names:
-            return sport_name
-    
-    return "sports"
+
+    return ARTICLE_SPORT_CLASSIFIER.classify(title) or "sports"
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import time
+
+from graphql import parse
+
+from src.database import MAX_STALENESS_SECONDS, REPLICA_READS
+from src.repositories.generation_repository import GenerationRepository
+from src.utils.ttl_cache import TTLCache
+
+# Collections read by each cacheable root query field. Queries selecting any
+# other field (e.g. myFavoritedGames, which depends on the caller) get no ETag.
+QUERY_COLLECTIONS = {
+    "games": ("game", "team"),
+    "game": ("game", "game_archive", "team"),
+    "gameByData": ("game", "team"),
+    "gamesBySport": ("game", "team"),
+    "gamesByGender": ("game", "team"),
+    "gamesBySportGender": ("game", "team"),
+    "gamesByDate": ("game", "team"),
+    "teams": ("team",),
+    "team": ("team",),
+    "teamByName": ("team",),
+    "youtubeVideos": ("youtubevideo",),
+    "youtubeVideo": ("youtubevideo",),
+    "articles": ("news_articles",),
+    "feed": ("game_feed",),
+    "archivedGames": ("game_archive", "team"),
+    "archivedSeasons": ("game_archive",),
+    "seasonRecord": ("season_record",),
+    "__typename": (),
+}
+
+# Fields whose results also change with the clock (started games leave the
+# feed, old articles leave the recent window, the current season rolls over),
+# with how many seconds their ETag stays valid when nothing is written
+TIME_DEPENDENT_FIELDS = {"feed": 60, "articles": 3600, "seasonRecord": 86400}
+
+# Generations are re-read at most this often (seconds) per set of collections
+generations_cache = TTLCache(1)
+
+
+def query_etag(query, variables=None, operation_name=None, encoding=None):
+    """
+    Builds a strong ETag for a read query from the generations of the
+    collections it reads, without executing it.
+
+    Args:
+        query (str): The GraphQL query document.
+        variables (str): The raw `variables` request parameter.
+        operation_name (str): The operation to run, if the document has several.
+        encoding (str): The response's content coding, which is part of the entity.
+
+    Returns:
+        str: The (unquoted) ETag, or None if the query cannot be cached.
+    """
+    fields = root_fields(query, operation_name)
+    if fields is None or any(field not in QUERY_COLLECTIONS for field in fields):
+        return None
+
+    collections = tuple(sorted({name for field in fields for name in QUERY_COLLECTIONS[field]}))
+    generations = generations_cache.get(collections)
+    if generations is None:
+        generations = GenerationRepository.find_by_names(collections)
+        generations_cache.set(collections, generations)
+
+    buckets = {
+        field: int(time.time() // TIME_DEPENDENT_FIELDS[field])
+        for field in fields
+        if field in TIME_DEPENDENT_FIELDS
+    }
+    if REPLICA_READS:
+        # Queries may read from a secondary that has not seen the writes behind
+        # the current generations yet, so a stale body must not keep their ETag
+        # for longer than a secondary may lag behind
+        buckets["_replica"] = int(time.time() // MAX_STALENESS_SECONDS)
+    key = json.dumps(
+        [query, variables, operation_name, generations, buckets, encoding],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def root_fields(query, operation_name=None):
+    """
+    Returns the root field names selected by a query operation, or None if the
+    document does not parse or the operation is not a query.
+    """
+    try:
+        document = parse(query)
+    except Exception:
+        return None
+
+    operations = []
+    fragments = {}
+    for definition in document.definitions:
+        kind = type(definition).__name__
+        if kind in ("OperationDefinition", "OperationDefinitionNode"):
+            operations.append(definition)
+        elif kind in ("FragmentDefinition", "FragmentDefinitionNode"):
+            fragments[definition.name.value] = definition
+
+    if operation_name:
+        operations = [op for op in operations if op.name and op.name.value == operation_name]
+    if len(operations) != 1 or _operation_type(operations[0]) != "query":
+        return None
+
+    fields = set()
+    _collect_fields(operations[0].selection_set, fragments, fields, set())
+    return fields
+
+
+def _operation_type(operation):
+    # graphql-core 2 stores the operation as a string, 3 as an enum
+    return getattr(operation.operation, "value", operation.operation)
+
+
+def _collect_fields(selection_set, fragments, fields, seen):
+    for node in selection_set.selections:
+        kind = type(node).__name__
+        if kind in ("Field", "FieldNode"):
+            fields.add(node.name.value)
+        elif kind in ("FragmentSpread", "FragmentSpreadNode"):
+            name = node.name.value
+            if name in fragments and name not in seen:
+                seen.add(name)
+                _collect_fields(fragments[name].selection_set, fragments, fields, seen)
+        elif kind in ("InlineFragment", "InlineFragmentNode"):
+            _collect_fields(node.selection_set, fragments, fields, seen)
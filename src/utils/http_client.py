@@ -0,0 +1,242 @@
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from src.utils.constants import SPORT_URLS
+from src.utils.scrape_ledger import record_response, stage
+from src.utils.ttl_cache import TTLCache
+
+# (connect, read) timeouts in seconds for every scraper request
+DEFAULT_TIMEOUT = (5, 20)
+
+# Attempts per request, and the backoff between them: a random delay up to
+# min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) seconds ("full jitter")
+MAX_ATTEMPTS = 3
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8
+
+# Statuses worth retrying; other responses are returned to the caller as is
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Consecutive failures that open a host's circuit, and how long it stays open
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 60
+
+
+# Hosts kept in the connection pool (cornellbigred.com, its image CDN,
+# cornellsun.com, googleapis.com, YouTube thumbnails, ...)
+POOL_HOSTS = 10
+
+# Keep-alive connections kept per host: every sport is scraped concurrently
+# from cornellbigred.com, one thread each
+POOL_SIZE = len(SPORT_URLS)
+
+
+# Pages fetched with `conditional=True` are kept with their validators (ETag,
+# Last-Modified) so the next fetch can revalidate them and reuse the cached
+# response on 304 Not Modified; bounded by the size of the pages
+PAGE_CACHE_TTL = 24 * 60 * 60
+PAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+page_cache = TTLCache(
+    ttl=PAGE_CACHE_TTL,
+    maxsize=None,
+    maxbytes=PAGE_CACHE_MAX_BYTES,
+    sizeof=lambda response: len(response.content),
+)
+
+
+def _build_session():
+    # Retries are handled by `fetch`, not by urllib3
+    adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_SIZE, max_retries=0)
+    http_session = requests.Session()
+    http_session.mount("https://", adapter)
+    http_session.mount("http://", adapter)
+    return http_session
+
+
+# Shared by every scraper so connections (and TLS sessions) are reused. This
+# is HTTP/1.1 only: requests/urllib3 cannot speak HTTP/2, and an HTTP/2 client
+# (httpx[http2]) would change the response type every scraper relies on. With
+# keep-alive pools the handshake is already paid once per pooled connection,
+# and scrape concurrency is one request per sport thread, which HTTP/1.1 pools
+# of POOL_SIZE cover.
+session = _build_session()
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """
+    Raised without a request being made while a host's circuit is open.
+    """
+
+
+class DeadlineExceeded(requests.Timeout):
+    """
+    Raised when the current scrape job's deadline has passed.
+    """
+
+
+class CircuitBreaker:
+    """
+    Fails fast for a host after FAILURE_THRESHOLD consecutive failures. After
+    RESET_TIMEOUT seconds a single trial request is let through: success
+    closes the circuit, failure keeps it open for another RESET_TIMEOUT.
+    """
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_in_flight or time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+_local = threading.local()
+
+
+def _breaker(host):
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker()
+        return breaker
+
+
+@contextmanager
+def deadline(seconds):
+    """
+    Bound every fetch made by the current thread inside the block to finish
+    within `seconds` from now; timeouts are shortened to fit and a fetch
+    started after the deadline raises DeadlineExceeded.
+    """
+    previous = getattr(_local, "deadline", None)
+    _local.deadline = time.monotonic() + seconds
+    try:
+        yield
+    finally:
+        _local.deadline = previous
+
+
+def _remaining():
+    expires_at = getattr(_local, "deadline", None)
+    if expires_at is None:
+        return None
+    remaining = expires_at - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded("Scrape deadline exceeded")
+    return remaining
+
+
+def _validators(response):
+    """
+    The conditional request headers that revalidate a cached response.
+    """
+    headers = {}
+    if response.headers.get("ETag"):
+        headers["If-None-Match"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        headers["If-Modified-Since"] = response.headers["Last-Modified"]
+    return headers
+
+
+def fetch(url, method="GET", timeout=DEFAULT_TIMEOUT, conditional=False, **kwargs):
+    """
+    Make an HTTP request on the shared keep-alive session, with timeouts,
+    retries and a per-host circuit breaker.
+
+    Connection errors, timeouts and RETRY_STATUSES responses are retried up to
+    MAX_ATTEMPTS times with jittered exponential backoff. Any other response,
+    including 4xx errors, is returned for the caller to handle.
+
+    With `conditional`, a GET of a page fetched before is sent with its
+    validators, and the cached response is returned if the server answers
+    304 Not Modified.
+
+    Args:
+        url (str): The URL to request.
+        method (str): The HTTP method.
+        timeout (tuple): The (connect, read) timeouts in seconds.
+        conditional (bool): Revalidate and reuse the page cached for `url`. (optional)
+        **kwargs: Passed to `Session.request` (params, headers, ...).
+
+    Returns:
+        requests.Response: The final response.
+
+    Raises:
+        requests.RequestException: If every attempt failed, the host's circuit
+            is open (CircuitOpenError) or the job's deadline passed (DeadlineExceeded).
+    """
+    host = urlsplit(url).netloc
+    breaker = _breaker(host)
+
+    conditional = conditional and method == "GET"
+    cached = page_cache.get(url) if conditional else None
+    if cached is not None:
+        kwargs["headers"] = {**kwargs.get("headers", {}), **_validators(cached)}
+
+    for attempt in range(MAX_ATTEMPTS):
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {host}")
+
+        remaining = _remaining()
+        attempt_timeout = timeout
+        if remaining is not None:
+            attempt_timeout = tuple(min(value, remaining) for value in timeout)
+
+        try:
+            with stage("fetch"):
+                response = session.request(method, url, timeout=attempt_timeout, **kwargs)
+            record_response(response)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            breaker.record_failure()
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+            logging.warning(f"Retrying {method} {url} after error: {e}")
+        else:
+            if response.status_code not in RETRY_STATUSES:
+                breaker.record_success()
+                if cached is not None and response.status_code == 304:
+                    return cached
+                if conditional and response.status_code == 200 and _validators(response):
+                    page_cache.set(url, response)
+                return response
+            breaker.record_failure()
+            if attempt == MAX_ATTEMPTS - 1:
+                return response
+            logging.warning(f"Retrying {method} {url} after HTTP {response.status_code}")
+
+        delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+        remaining = _remaining()
+        if remaining is not None and delay >= remaining:
+            raise DeadlineExceeded(f"Scrape deadline exceeded while retrying {url}")
+        time.sleep(delay)
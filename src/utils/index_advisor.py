@@ -0,0 +1,605 @@
+"""
+Index advisor: runs every query shape used by the repositories and the auth
+mutations through `explain()` against a seeded, throwaway local database.
+
+It reports collection scans, in-memory sorts, keys/documents examined versus
+documents returned, and unused or redundant indexes, then emits a recommended
+index spec in the format of `src.utils.index_spec.INDEX_SPEC`. Unused indexes
+are only reported as drop candidates, never dropped from the recommendation.
+
+Usage:
+    python -m src.utils.index_advisor --uri mongodb://localhost:27017/ --output index_spec.json
+
+Point INDEX_SPEC_PATH at the emitted file to have `setup_database_indexes`
+apply it. This module deliberately does not import `src.database`, so it never
+touches the configured application database.
+"""
+
+import argparse
+import copy
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+from pymongo import MongoClient
+
+from src.utils.index_spec import apply_index_spec, index_name, load_index_spec
+from src.utils.query_filters import (
+    RESULT_FIELDS,
+    UNCLASSIFIED_VIDEOS_FILTER,
+    archive_season_filter,
+    date_range_filter,
+    game_key_filter,
+    recent_articles_filter,
+    sport_gender_filter,
+    stale_articles_filter,
+    tournament_key_filter,
+)
+
+SEED_SPORTS = [
+    ("Baseball", "Mens"),
+    ("Basketball", "Mens"),
+    ("Basketball", "Womens"),
+    ("Football", "Mens"),
+    ("Ice Hockey", "Mens"),
+    ("Ice Hockey", "Womens"),
+    ("Lacrosse", "Mens"),
+    ("Soccer", "Mens"),
+    ("Soccer", "Womens"),
+    ("Field Hockey", "Womens"),
+]
+
+RANGE_OPERATORS = {"$gt", "$gte", "$lt", "$lte", "$ne", "$exists", "$type"}
+
+
+def seed(databases, games_per_sport=400, rng_seed=42):
+    """
+    Fill the advisor databases with deterministic synthetic data shaped like
+    production documents.
+    """
+    rng = random.Random(rng_seed)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    score_db = databases["score_db"]
+    daily_sun_db = databases["daily_sun_db"]
+
+    teams = [
+        {
+            "_id": f"team-{i}",
+            "color": "#B31B1B",
+            "image": f"https://example.com/logos/{i}.png",
+            "b64_image": "A" * 2048,
+            "name": f"Opponent {i}",
+        }
+        for i in range(200)
+    ]
+    score_db["team"].insert_many(teams)
+
+    games = []
+    for sport, gender in SEED_SPORTS:
+        for i in range(games_per_sport):
+            utc_date = now + timedelta(days=rng.randint(-3 * 365, 180), hours=rng.randint(0, 23))
+            games.append(
+                {
+                    "_id": str(ObjectId()),
+                    "city": rng.choice(["Ithaca", "Boston", "Princeton"]),
+                    "date": utc_date.strftime("%b %d (%a) %Y"),
+                    "gender": gender,
+                    "location": rng.choice(["Schoellkopf Field", "Lynah Rink", None]),
+                    "opponent_id": rng.choice(teams)["_id"],
+                    "result": rng.choice(["W, 3-1", "L, 1-2", "T, 0-0", None]),
+                    "sport": sport,
+                    "state": rng.choice(["NY", "MA", "NJ"]),
+                    "time": "7:00 PM",
+                    "box_score": [
+                        {"team": "COR", "period": "1st", "time": "10:00", "description": "Goal"}
+                        for _ in range(20)
+                    ],
+                    "score_breakdown": [["1", "2", "3"], ["0", "1", "1"]],
+                    "utc_date": utc_date,
+                    "ticket_link": None,
+                }
+            )
+    score_db["game"].insert_many(games)
+
+    # Past seasons (July to June) as the archiver would have moved them
+    archived = []
+    for game in games:
+        if game["utc_date"] < now - timedelta(days=365):
+            year = game["utc_date"].year - (game["utc_date"].month < 7)
+            archived.append({**game, "season": f"{year}-{(year + 1) % 100:02d}"})
+    if archived:
+        score_db["game_archive"].insert_many(archived)
+
+    score_db["game_feed"].insert_many(
+        [{"_id": "all", "upcoming": [], "recent": []}]
+        + [{"_id": f"{sport}|{gender}", "upcoming": [], "recent": []} for sport, gender in SEED_SPORTS]
+    )
+    score_db["season_record"].insert_many(
+        {"_id": f"{sport}|{gender}|{season}", "sport": sport, "gender": gender, "season": season}
+        for sport, gender in SEED_SPORTS
+        for season in {game["season"] for game in archived} | {"current"}
+    )
+    score_db["scrape_runs"].insert_many(
+        {
+            "kind": rng.choice(["full", "due"]),
+            "started_at": now - timedelta(minutes=30 * i),
+            "sports": [],
+            "totals": {},
+        }
+        for i in range(1000)
+    )
+    score_db["users"].insert_many(
+        {
+            "net_id": f"net{i}",
+            "favorite_game_ids": [rng.choice(games)["_id"] for _ in range(5)],
+        }
+        for i in range(1000)
+    )
+    score_db["token_blocklist"].insert_many(
+        {"jti": str(ObjectId()), "expires_at": now + timedelta(minutes=rng.randint(-60, 60))}
+        for _ in range(500)
+    )
+    score_db["youtubevideo"].insert_many(
+        {
+            "_id": f"video-{i}",
+            "title": f"Video {i}",
+            "sports_type": rng.choice([sport for sport, _ in SEED_SPORTS] + [None]),
+            "published_at": (now - timedelta(days=i)).isoformat().replace("+00:00", "Z"),
+        }
+        for i in range(300)
+    )
+    daily_sun_db["news_articles"].insert_many(
+        {
+            "_id": str(ObjectId()),
+            "title": f"Article {i}",
+            "sports_type": rng.choice([sport for sport, _ in SEED_SPORTS] + ["sports"]),
+            "published_at": now - timedelta(hours=i * 6),
+            "slug": f"article-{i}",
+        }
+        for i in range(300)
+    )
+
+    sample_game = games[0]
+    return {
+        "now": now,
+        "game": sample_game,
+        "game_ids": [game["_id"] for game in games[:20]],
+        "season": archived[0]["season"] if archived else None,
+        "team_ids": [team["_id"] for team in teams[:20]],
+        "run_id": score_db["scrape_runs"].find_one()["_id"],
+        "user": score_db["users"].find_one(),
+    }
+
+
+def query_shapes(sample):
+    """
+    The query shapes issued by the repositories and the auth mutations, filled
+    in with values from the seeded data. Each is named after the method that
+    issues it; filters beyond a single field come from `src.utils.query_filters`,
+    which the repositories use too. Aggregations are explained through their
+    leading `$match` (and `$sort`), the only stages that use an index. The
+    archive shapes are left out when no seeded game is old enough to be
+    archived.
+    """
+    game = sample["game"]
+    now = sample["now"]
+    key_fields = {
+        field: game[field] for field in ("city", "date", "gender", "location", "opponent_id", "sport", "state")
+    }
+    shapes = [
+        # GameRepository
+        {"name": "GameRepository.find_all", "db": "score_db", "collection": "game", "filter": {}, "limit": 100},
+        {"name": "GameRepository.find_by_id", "db": "score_db", "collection": "game", "filter": {"_id": game["_id"]}},
+        {
+            "name": "GameRepository.find_by_data",
+            "db": "score_db",
+            "collection": "game",
+            "filter": {**game_key_filter(**key_fields), "time": game["time"]},
+        },
+        {
+            "name": "GameRepository.find_by_key_fields",
+            "db": "score_db",
+            "collection": "game",
+            "filter": game_key_filter(**key_fields),
+        },
+        {
+            "name": "GameRepository.find_by_tournament_key_fields",
+            "db": "score_db",
+            "collection": "game",
+            "filter": tournament_key_filter(
+                game["city"], game["date"], game["gender"], game["location"], game["sport"], game["state"]
+            ),
+        },
+        {"name": "GameRepository.find_by_sport", "db": "score_db", "collection": "game", "filter": {"sport": game["sport"]}},
+        {"name": "GameRepository.find_by_gender", "db": "score_db", "collection": "game", "filter": {"gender": game["gender"]}},
+        {
+            "name": "GameRepository.find_by_sport_gender",
+            "db": "score_db",
+            "collection": "game",
+            "filter": sport_gender_filter(game["sport"], game["gender"]),
+        },
+        {
+            "name": "GameRepository.find_games_by_sport_gender_after_date",
+            "db": "score_db",
+            "collection": "game",
+            "filter": sport_gender_filter(game["sport"], game["gender"], {"$gt": now}),
+        },
+        {
+            "name": "GameRepository.find_upcoming_by_sport_gender",
+            "db": "score_db",
+            "collection": "game",
+            "filter": sport_gender_filter(game["sport"], game["gender"], {"$gte": now}),
+            "sort": {"utc_date": 1},
+            "projection": {"box_score": 0},
+            "limit": 10,
+        },
+        {
+            "name": "GameRepository.find_recent_by_sport_gender",
+            "db": "score_db",
+            "collection": "game",
+            "filter": sport_gender_filter(game["sport"], game["gender"], {"$lt": now}),
+            "sort": {"utc_date": -1},
+            "projection": {"box_score": 0},
+            "limit": 10,
+        },
+        {
+            "name": "GameRepository.find_by_date",
+            "db": "score_db",
+            "collection": "game",
+            "filter": date_range_filter(now - timedelta(days=7), now),
+        },
+        {"name": "GameRepository.find_by_ids", "db": "score_db", "collection": "game", "filter": {"_id": {"$in": sample["game_ids"]}}},
+        {
+            "name": "GameRepository.find_favorites ($match)",
+            "db": "score_db",
+            "collection": "game",
+            "filter": {"_id": {"$in": sample["game_ids"]}},
+        },
+        {
+            "name": "GameRepository.find_schedule_summary ($match)",
+            "db": "score_db",
+            "collection": "game",
+            "filter": date_range_filter(now - timedelta(days=7), now + timedelta(days=7)),
+        },
+        {
+            "name": "GameRepository.find_results_between",
+            "db": "score_db",
+            "collection": "game",
+            "filter": sport_gender_filter(
+                game["sport"], game["gender"], {"$gte": now - timedelta(days=365), "$lt": now}
+            ),
+            "sort": {"utc_date": 1},
+            "projection": RESULT_FIELDS,
+        },
+        {
+            "name": "GameRepository.find_before",
+            "db": "score_db",
+            "collection": "game",
+            "filter": {"utc_date": {"$lt": now - timedelta(days=365)}},
+            "limit": 500,
+        },
+        {
+            "name": "find_games ($lookup of the team)",
+            "db": "score_db",
+            "collection": "team",
+            "filter": {"_id": "team-1"},
+        },
+        # FeedRepository
+        {"name": "FeedRepository.find_by_key", "db": "score_db", "collection": "game_feed", "filter": {"_id": "all"}},
+        {"name": "FeedRepository.find_sport_feeds", "db": "score_db", "collection": "game_feed", "filter": {"_id": {"$ne": "all"}}},
+        # SeasonRecordRepository
+        {
+            "name": "SeasonRecordRepository.find_by_key",
+            "db": "score_db",
+            "collection": "season_record",
+            "filter": {"_id": f"{game['sport']}|{game['gender']}|current"},
+        },
+        # ScrapeRunRepository
+        {
+            "name": "ScrapeRunRepository.find_recent",
+            "db": "score_db",
+            "collection": "scrape_runs",
+            "filter": {},
+            "sort": {"started_at": -1},
+            "limit": 20,
+        },
+        {
+            "name": "ScrapeRunRepository.find_recent (kind)",
+            "db": "score_db",
+            "collection": "scrape_runs",
+            "filter": {"kind": "due"},
+            "sort": {"started_at": -1},
+            "limit": 20,
+        },
+        {"name": "ScrapeRunRepository.find_by_id", "db": "score_db", "collection": "scrape_runs", "filter": {"_id": sample["run_id"]}},
+        # TeamRepository
+        {"name": "TeamRepository.find_all", "db": "score_db", "collection": "team", "filter": {}},
+        {"name": "TeamRepository.find_by_id", "db": "score_db", "collection": "team", "filter": {"_id": "team-1"}},
+        {"name": "TeamRepository.find_by_name", "db": "score_db", "collection": "team", "filter": {"name": "Opponent 1"}},
+        {"name": "TeamRepository.find_by_ids", "db": "score_db", "collection": "team", "filter": {"_id": {"$in": sample["team_ids"]}}},
+        # YoutubeVideoRepository
+        {"name": "YoutubeVideoRepository.find_all", "db": "score_db", "collection": "youtubevideo", "filter": {}},
+        {"name": "YoutubeVideoRepository.find_by_id", "db": "score_db", "collection": "youtubevideo", "filter": {"_id": "video-1"}},
+        {
+            "name": "YoutubeVideoRepository.find_by_sports_type",
+            "db": "score_db",
+            "collection": "youtubevideo",
+            "filter": {"sports_type": game["sport"]},
+            "sort": {"published_at": -1},
+        },
+        {
+            "name": "YoutubeVideoRepository.find_without_sports_type",
+            "db": "score_db",
+            "collection": "youtubevideo",
+            "filter": UNCLASSIFIED_VIDEOS_FILTER,
+            "projection": {"title": 1},
+        },
+        # ArticleRepository
+        {"name": "ArticleRepository.upsert", "db": "daily_sun_db", "collection": "news_articles", "filter": {"slug": "article-1"}},
+        {
+            "name": "ArticleRepository.find_recent",
+            "db": "daily_sun_db",
+            "collection": "news_articles",
+            "filter": recent_articles_filter(3, now),
+            "sort": {"published_at": -1},
+        },
+        {
+            "name": "ArticleRepository.find_by_sports_type",
+            "db": "daily_sun_db",
+            "collection": "news_articles",
+            "filter": {"sports_type": game["sport"], **recent_articles_filter(3, now)},
+            "sort": {"published_at": -1},
+        },
+        {
+            "name": "ArticleRepository.delete_not_recent",
+            "db": "daily_sun_db",
+            "collection": "news_articles",
+            "filter": stale_articles_filter(3, now),
+        },
+        # Auth mutations, favorites and the token blocklist
+        {"name": "LoginUser / SignupUser", "db": "score_db", "collection": "users", "filter": {"net_id": "net1"}},
+        {
+            "name": "FavoriteRepository.find_game_ids",
+            "db": "score_db",
+            "collection": "users",
+            "filter": {"_id": sample["user"]["_id"]},
+            "projection": {"favorite_game_ids": 1},
+        },
+        {"name": "LogoutUser", "db": "score_db", "collection": "token_blocklist", "filter": {"jti": "unknown"}},
+        {
+            "name": "TokenBlocklist.load",
+            "db": "score_db",
+            "collection": "token_blocklist",
+            "filter": {"expires_at": {"$gt": now}},
+        },
+    ]
+    if sample["season"]:
+        shapes += [
+            # GameArchiveRepository
+            {
+                "name": "GameArchiveRepository.find_by_season",
+                "db": "score_db",
+                "collection": "game_archive",
+                "filter": archive_season_filter(sample["season"], game["sport"], game["gender"]),
+                "sort": {"utc_date": 1},
+                "limit": 100,
+            },
+            {
+                "name": "GameArchiveRepository.find_by_season (all sports)",
+                "db": "score_db",
+                "collection": "game_archive",
+                "filter": archive_season_filter(sample["season"]),
+                "sort": {"utc_date": 1},
+                "limit": 100,
+            },
+            {"name": "GameArchiveRepository.find_by_ids", "db": "score_db", "collection": "game_archive", "filter": {"_id": {"$in": sample["game_ids"]}}},
+            {
+                "name": "GameArchiveRepository.find_results_by_season",
+                "db": "score_db",
+                "collection": "game_archive",
+                "filter": archive_season_filter(sample["season"], game["sport"], game["gender"]),
+                "sort": {"utc_date": 1},
+                "projection": RESULT_FIELDS,
+            },
+            {
+                "name": "GameArchiveRepository.find_seasons ($match)",
+                "db": "score_db",
+                "collection": "game_archive",
+                "filter": {"sport": game["sport"], "gender": game["gender"]},
+            },
+        ]
+    return shapes
+
+
+def explain(databases, shape):
+    """
+    Runs a query shape through `explain` and summarizes the winning plan.
+    """
+    command = {"find": shape["collection"], "filter": shape["filter"]}
+    for option in ("sort", "projection", "limit"):
+        if option in shape:
+            command[option] = shape[option]
+
+    result = databases[shape["db"]].command(
+        {"explain": command, "verbosity": "executionStats"}
+    )
+    winning_plan = result["queryPlanner"]["winningPlan"]
+    winning_plan = winning_plan.get("queryPlan", winning_plan)
+
+    stages, indexes = [], []
+    pending = [winning_plan]
+    while pending:
+        stage = pending.pop()
+        stages.append(stage.get("stage"))
+        if stage.get("indexName"):
+            indexes.append(stage["indexName"])
+        if "inputStage" in stage:
+            pending.append(stage["inputStage"])
+        pending.extend(stage.get("inputStages", []))
+
+    stats = result["executionStats"]
+    return {
+        "name": shape["name"],
+        "collection": f"{shape['db']}.{shape['collection']}",
+        "collscan": "COLLSCAN" in stages,
+        "in_memory_sort": "SORT" in stages,
+        "indexes": indexes,
+        "keys_examined": stats["totalKeysExamined"],
+        "docs_examined": stats["totalDocsExamined"],
+        "returned": stats["nReturned"],
+    }
+
+
+def recommend_index(shape):
+    """
+    Suggests an index for a query shape using the equality, sort, range rule.
+    Returns None for shapes that read the whole collection anyway.
+    """
+    equality, ranges = [], []
+    for field, condition in shape["filter"].items():
+        if isinstance(condition, dict) and set(condition) & RANGE_OPERATORS:
+            ranges.append([field, 1])
+        else:
+            equality.append([field, 1])
+    sort = [[field, direction] for field, direction in shape.get("sort", {}).items()]
+
+    keys = equality + [key for key in sort if key[0] not in {field for field, _ in equality}]
+    keys += [key for key in ranges if key[0] not in {field for field, _ in keys}]
+    if not keys or keys[0][0] == "_id":
+        return None
+    return keys
+
+
+def analyze(databases, spec, shapes):
+    """
+    Explains every shape and derives unused/redundant indexes and a recommended
+    spec, which drops redundant indexes but keeps unused ones.
+    """
+    reports = [explain(databases, shape) for shape in shapes]
+    used = {(report["collection"], name) for report in reports for name in report["indexes"]}
+    # Collections without query shapes (e.g. an empty archive) tell nothing about their indexes
+    explained = {report["collection"] for report in reports}
+
+    unused, redundant = [], []
+    for database_name, collections in spec.items():
+        for collection_name, indexes in collections.items():
+            if f"{database_name}.{collection_name}" not in explained:
+                continue
+            created = indexes.get("create", [])
+            for index in created:
+                name = index_name(index["keys"])
+                if index.get("unique") or "expireAfterSeconds" in index:
+                    continue
+                if any(
+                    other is not index
+                    and len(other["keys"]) > len(index["keys"])
+                    and [list(key) for key in other["keys"][: len(index["keys"])]] == [list(key) for key in index["keys"]]
+                    for other in created
+                ):
+                    redundant.append((database_name, collection_name, name))
+                elif (f"{database_name}.{collection_name}", name) not in used:
+                    unused.append((database_name, collection_name, name))
+
+    # Unused indexes are only reported: a query missing from `query_shapes`
+    # may still need them. Redundant ones are covered by the longer index.
+    recommended = copy.deepcopy(spec)
+    for database_name, collection_name, name in redundant:
+        indexes = recommended[database_name][collection_name]
+        indexes["create"] = [index for index in indexes["create"] if index_name(index["keys"]) != name]
+        indexes.setdefault("drop", [])
+        if name not in indexes["drop"]:
+            indexes["drop"].append(name)
+
+    for shape, report in zip(shapes, reports):
+        if not (report["collscan"] or report["in_memory_sort"]):
+            continue
+        keys = recommend_index(shape)
+        if keys is None:
+            continue
+        indexes = recommended.setdefault(shape["db"], {}).setdefault(shape["collection"], {"create": []})
+        indexes.setdefault("create", [])
+        if any(
+            [list(key) for key in index["keys"][: len(keys)]] == keys
+            for index in indexes["create"]
+        ):
+            continue
+        indexes["create"].append({"keys": keys})
+        if index_name(keys) in indexes.get("drop", []):
+            indexes["drop"].remove(index_name(keys))
+
+    return reports, unused, redundant, recommended
+
+
+def print_report(reports, unused, redundant):
+    print(f"{'query':58} {'plan':12} {'keys':>7} {'docs':>7} {'returned':>8}  indexes")
+    for report in reports:
+        if report["collscan"]:
+            plan = "COLLSCAN"
+        elif report["in_memory_sort"]:
+            plan = "IXSCAN+SORT"
+        else:
+            plan = "IXSCAN"
+        print(
+            f"{report['name']:58} {plan:12} {report['keys_examined']:>7} "
+            f"{report['docs_examined']:>7} {report['returned']:>8}  {', '.join(report['indexes'])}"
+        )
+
+    for database_name, collection_name, name in unused:
+        print(
+            f"Unused index: {database_name}.{collection_name}.{name} "
+            f"(drop candidate, kept in the recommended spec)"
+        )
+    for database_name, collection_name, name in redundant:
+        print(f"Redundant index: {database_name}.{collection_name}.{name} (prefix of another index)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Explain repository queries and recommend indexes.")
+    parser.add_argument("--uri", default="mongodb://localhost:27017/", help="Local MongoDB to seed.")
+    parser.add_argument("--prefix", default="index_advisor", help="Prefix of the throwaway databases.")
+    parser.add_argument("--games-per-sport", type=int, default=400)
+    parser.add_argument("--output", help="Write the recommended index spec to this JSON file.")
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded databases afterwards.")
+    args = parser.parse_args()
+
+    client = MongoClient(args.uri, tz_aware=True)
+    names = {"score_db": f"{args.prefix}_score", "daily_sun_db": f"{args.prefix}_daily_sun"}
+    for name in names.values():
+        client.drop_database(name)
+    databases = {key: client[name] for key, name in names.items()}
+
+    try:
+        spec = load_index_spec()
+        sample = seed(databases, games_per_sport=args.games_per_sport)
+        apply_index_spec(databases, spec)
+
+        shapes = query_shapes(sample)
+        if sample["season"] is None:
+            print("No seeded game is old enough to be archived; skipping the archive queries\n")
+        reports, unused, redundant, recommended = analyze(databases, spec, shapes)
+        print_report(reports, unused, redundant)
+
+        # Check the recommendation against the same data before emitting it
+        for name in names.values():
+            for collection_name in client[name].list_collection_names():
+                client[name][collection_name].drop_indexes()
+        apply_index_spec(databases, recommended)
+        print("\nWith the recommended spec:")
+        after, unused, redundant, _ = analyze(databases, recommended, shapes)
+        print_report(after, unused, redundant)
+
+        if args.output:
+            with open(args.output, "w") as spec_file:
+                json.dump(recommended, spec_file, indent=2)
+            print(f"\nRecommended index spec written to {args.output}")
+        else:
+            print("\n" + json.dumps(recommended, indent=2))
+    finally:
+        if not args.keep:
+            for name in names.values():
+                client.drop_database(name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+import json
+import os
+
+from pymongo.errors import DuplicateKeyError, OperationFailure
+
+# The indexes every collection should have, per logical database. Each index
+# lists its keys and optional `unique` / `expireAfterSeconds` options; `drop`
+# names indexes that used to be created and are no longer wanted.
+#
+# `python -m src.utils.index_advisor` checks this spec against every repository
+# query shape and emits a recommended spec in the same format, which is applied
+# instead of this one when INDEX_SPEC_PATH points at it.
+INDEX_SPEC = {
+    "score_db": {
+        "game": {
+            "create": [
+                # gamesByGender
+                {"keys": [["gender", 1]]},
+                # gamesByDate
+                {"keys": [["utc_date", 1]]},
+                # gamesBySport, gamesBySportGender, feed rebuilds and
+                # tournament game lookups after a date
+                {"keys": [["sport", 1], ["gender", 1], ["utc_date", 1]]},
+                # Scraper lookups by game data, and no duplicate games
+                {
+                    "keys": [
+                        ["sport", 1],
+                        ["gender", 1],
+                        ["date", 1],
+                        ["opponent_id", 1],
+                        ["city", 1],
+                        ["state", 1],
+                        ["location", 1],
+                    ],
+                    "unique": True,
+                },
+                # Tournament games (without opponent_id)
+                {
+                    "keys": [
+                        ["sport", 1],
+                        ["gender", 1],
+                        ["date", 1],
+                        ["city", 1],
+                        ["state", 1],
+                    ]
+                },
+            ],
+            # Prefixes of (sport, gender, utc_date), or never used by any query
+            "drop": ["sport_1", "sport_1_gender_1", "date_1", "date_-1"],
+        },
+        "game_archive": {
+            "create": [
+                # archivedGames of one sport, in date order, and archivedSeasons
+                {"keys": [["season", 1], ["sport", 1], ["gender", 1], ["utc_date", 1]]},
+                # archivedGames of every sport, in date order
+                {"keys": [["season", 1], ["utc_date", 1]]},
+            ],
+        },
+        "team": {
+            "create": [
+                # Scraper and teamByName lookups
+                {"keys": [["name", 1]]},
+            ],
+        },
+        "users": {
+            "create": [
+                # Login and signup lookups
+                {"keys": [["net_id", 1]], "unique": True},
+            ],
+        },
+        "youtubevideo": {
+            "create": [
+                # youtubeVideos(sportsType:), newest first
+                {"keys": [["sports_type", 1], ["published_at", -1]]},
+            ],
+        },
+        "scrape_runs": {
+            "create": [
+                # Recent runs, newest first; runs are kept for 30 days
+                {"keys": [["started_at", 1]], "expireAfterSeconds": 30 * 24 * 60 * 60},
+            ],
+        },
+        "token_blocklist": {
+            "create": [
+                # Logout inserts if absent
+                {"keys": [["jti", 1]], "unique": True},
+                # MongoDB removes entries once their token has expired
+                {"keys": [["expires_at", 1]], "expireAfterSeconds": 0},
+            ],
+        },
+    },
+    "daily_sun_db": {
+        "news_articles": {
+            "create": [
+                # Upserts by slug
+                {"keys": [["slug", 1]], "unique": True},
+                # Recent articles, newest first
+                {"keys": [["published_at", -1]]},
+                # Recent articles by sport, newest first
+                {"keys": [["sports_type", 1], ["published_at", -1]]},
+            ],
+        },
+    },
+}
+
+INDEX_OPTIONS = ("unique", "expireAfterSeconds")
+
+
+def load_index_spec():
+    """
+    Returns the index spec to apply: the JSON file at INDEX_SPEC_PATH if set,
+    otherwise `INDEX_SPEC`.
+    """
+    path = os.getenv("INDEX_SPEC_PATH")
+    if path:
+        with open(path) as spec_file:
+            return json.load(spec_file)
+    return INDEX_SPEC
+
+
+def index_name(keys):
+    """
+    Returns MongoDB's default name for an index on the given keys, e.g. "sport_1_gender_1".
+    """
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+
+def is_unique_fallback(current, options):
+    """
+    Whether an existing index differs from its spec only by not being unique,
+    as when `apply_index_spec` fell back to a non-unique index.
+    """
+    return (
+        options.get("unique")
+        and not current.get("unique")
+        and all(current.get(option) == options.get(option) for option in INDEX_OPTIONS if option != "unique")
+    )
+
+
+def has_duplicates(collection, keys):
+    """
+    Whether two documents of a collection share the same values for `keys`.
+    """
+    duplicates = collection.aggregate(
+        [
+            {"$group": {"_id": {field.replace(".", "_"): f"${field}" for field, _ in keys}, "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}},
+            {"$limit": 1},
+        ],
+        allowDiskUse=True,
+    )
+    return next(duplicates, None) is not None
+
+
+def apply_index_spec(databases, spec):
+    """
+    Creates (and drops) indexes so the databases match an index spec.
+
+    An existing index with the same keys but different options is rebuilt. If a
+    unique index cannot be built because of existing duplicates, a non-unique
+    index is created instead and a warning is printed; that index is kept on
+    later runs for as long as the duplicates remain.
+
+    Args:
+        databases (dict): A mapping of logical database name to pymongo Database.
+        spec (dict): The index spec, in the format of `INDEX_SPEC`.
+    """
+    for database_name, collections in spec.items():
+        database = databases[database_name]
+        for collection_name, indexes in collections.items():
+            collection = database[collection_name]
+            existing = collection.index_information()
+
+            for name in indexes.get("drop", []):
+                if name in existing:
+                    collection.drop_index(name)
+
+            for index in indexes.get("create", []):
+                keys = [(field, direction) for field, direction in index["keys"]]
+                options = {option: index[option] for option in INDEX_OPTIONS if option in index}
+                name = index_name(keys)
+
+                current = existing.get(name)
+                if current and any(current.get(option) != options.get(option) for option in INDEX_OPTIONS):
+                    if is_unique_fallback(current, options) and has_duplicates(collection, keys):
+                        # Rebuilding would fail again and fall back to the same
+                        # index, leaving the collection without it meanwhile
+                        print(
+                            f"Warning: Keeping non-unique index {collection_name}.{name} "
+                            f"while duplicates remain"
+                        )
+                        continue
+                    collection.drop_index(name)
+
+                try:
+                    collection.create_index(keys, background=True, **options)
+                except (DuplicateKeyError, OperationFailure) as e:
+                    if not options.get("unique"):
+                        raise
+                    print(
+                        f"Warning: Could not create unique index {collection_name}.{name} "
+                        f"due to existing duplicates: {e}"
+                    )
+                    options.pop("unique")
+                    collection.create_index(keys, background=True, **options)
@@ -0,0 +1,106 @@
+import json
+import zlib
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - Brotli is listed in requirements.txt
+    brotli = None
+
+# Bytes buffered before a chunk is handed to the server (and compressor)
+CHUNK_SIZE = 64 * 1024
+
+# Containers are split into separately encoded pieces down to this depth, which
+# for `{"data": {"games": [...]}}` means one encoder call per game
+STREAM_DEPTH = 3
+
+
+def dumps(value):
+    """
+    Encodes a value as compact UTF-8 JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def iter_json(value, depth=STREAM_DEPTH):
+    """
+    Yields the JSON encoding of a value in pieces, so the whole document is
+    never held as a single string.
+    """
+    if depth and isinstance(value, dict):
+        yield b"{"
+        for i, (key, item) in enumerate(value.items()):
+            yield (b"," if i else b"") + dumps(key) + b":"
+            yield from iter_json(item, depth - 1)
+        yield b"}"
+    elif depth and isinstance(value, (list, tuple)):
+        yield b"["
+        for i, item in enumerate(value):
+            if i:
+                yield b","
+            yield from iter_json(item, depth - 1)
+        yield b"]"
+    else:
+        yield dumps(value)
+
+
+def iter_chunks(pieces, chunk_size=CHUNK_SIZE):
+    """
+    Groups small pieces into chunks of at least `chunk_size` bytes.
+    """
+    buffer = bytearray()
+    for piece in pieces:
+        buffer += piece
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def supported_encodings():
+    """
+    Returns the content codings we can produce, most preferred first.
+    """
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate_encoding(accept_encodings):
+    """
+    Picks the content coding for a response from the request's Accept-Encoding.
+
+    Args:
+        accept_encodings: The werkzeug `request.accept_encodings`.
+
+    Returns:
+        str: "br", "gzip", or None to send the body uncompressed.
+    """
+    return accept_encodings.best_match(supported_encodings())
+
+
+def compress_chunks(chunks, encoding):
+    """
+    Compresses a stream of chunks with the given content coding.
+    """
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=4)
+        for chunk in chunks:
+            data = compressor.process(chunk)
+            if data:
+                yield data
+        yield compressor.finish()
+    elif encoding == "gzip":
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+    else:
+        yield from chunks
@@ -0,0 +1,99 @@
+import logging
+from datetime import datetime
+from pymongo import UpdateOne
+from src.database import db, daily_sun_db
+from src.repositories.generation_repository import GenerationRepository
+
+
+def migrate_dates_to_bson():
+    """
+    Convert game and article dates stored as ISO 8601 strings into BSON datetimes.
+
+    The conversion runs server-side with `$convert` and only touches documents
+    whose field is still a string, so running it again is a no-op. Strings
+    that are not valid dates are left as they are and reported.
+    """
+    conversions = [
+        (db["game"], "utc_date"),
+        (daily_sun_db["news_articles"], "published_at"),
+        (daily_sun_db["news_articles"], "created_at"),
+    ]
+    migrated = False
+    for collection, field in conversions:
+        result = collection.update_many(
+            {field: {"$type": "string", "$ne": ""}},
+            [
+                {
+                    "$set": {
+                        field: {
+                            "$convert": {
+                                "input": f"${field}",
+                                "to": "date",
+                                "onError": f"${field}",
+                                "onNull": f"${field}",
+                            }
+                        }
+                    }
+                }
+            ],
+        )
+        if result.modified_count:
+            migrated = True
+            GenerationRepository.increment(collection.name)
+            logging.info(
+                f"Converted {result.modified_count} {collection.name}.{field} value(s) to BSON dates"
+            )
+        invalid = collection.count_documents({field: {"$type": "string", "$ne": ""}})
+        if invalid:
+            logging.warning(
+                f"Left {invalid} {collection.name}.{field} value(s) that are not valid dates as strings"
+            )
+
+    # The feed embeds game dates, so rebuild it from the migrated games
+    if migrated:
+        from src.services.feed_service import FeedService
+        from src.utils.constants import SPORT_URLS
+
+        for data in SPORT_URLS.values():
+            FeedService.rebuild_sport_feed(data["sport"], data["gender"])
+        FeedService.rebuild_all_feed()
+
+
+def migrate_game_results():
+    """
+    Parse the outcome and final score of games stored before they were parsed
+    at ingest, then build the season records of those games.
+
+    Only games without an `outcome` field are touched, so running it again is
+    a no-op. Run it after `migrate_dates_to_bson`.
+    """
+    from src.services.game_archive_service import GameArchiveService
+    from src.services.season_record_service import SeasonRecordService
+    from src.utils.helpers import parse_result
+
+    seasons = set()
+    for collection in (db["game"], db["game_archive"]):
+        updates = []
+        games = collection.find(
+            {"outcome": {"$exists": False}},
+            {"result": 1, "sport": 1, "gender": 1, "utc_date": 1},
+        )
+        for game in games:
+            updates.append(UpdateOne({"_id": game["_id"]}, {"$set": parse_result(game.get("result"))}))
+            if isinstance(game.get("utc_date"), datetime):
+                seasons.add(
+                    (game["sport"], game["gender"], GameArchiveService.season_of(game["utc_date"]))
+                )
+        if updates:
+            collection.bulk_write(updates, ordered=False)
+            GenerationRepository.increment(collection.name)
+            logging.info(f"Parsed the results of {len(updates)} {collection.name} document(s)")
+
+    for sport, gender, season in seasons:
+        SeasonRecordService.rebuild_record(sport, gender, season)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    migrate_dates_to_bson()
+    migrate_game_results()
@@ -0,0 +1,92 @@
+"""
+Query filters and projections shared by the repositories and the index
+advisor, so the shapes the advisor explains are the ones the repositories
+actually send.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+
+# The fields season records are built from
+RESULT_FIELDS = {"outcome": 1, "cornell_score": 1, "opponent_score": 1, "city": 1, "utc_date": 1}
+
+
+def game_key_filter(city, date, gender, location, opponent_id, sport, state):
+    """
+    Matches the games of one scraped schedule entry, ignoring its time.
+    """
+    return {
+        "city": city,
+        "date": date,
+        "gender": gender,
+        "location": location,
+        "opponent_id": opponent_id,
+        "sport": sport,
+        "state": state,
+    }
+
+
+def tournament_key_filter(city, date, gender, location, sport, state):
+    """
+    Matches tournament games by date and place, excluding the opponent, which
+    may still be a placeholder. Missing places match games without one, so a
+    game is still found when TBD/TBA values change to real values.
+    """
+    return {
+        "date": date,
+        "gender": gender,
+        "sport": sport,
+        "city": {"$in": [city or None]},
+        "state": {"$in": [state or None]},
+        "location": {"$in": [location or None]},
+    }
+
+
+def sport_gender_filter(sport, gender, utc_date=None):
+    """
+    Matches the games of a sport and gender, optionally with a `utc_date`
+    condition such as {"$gte": now}.
+    """
+    query = {"sport": sport, "gender": gender}
+    if utc_date:
+        query["utc_date"] = utc_date
+    return query
+
+
+def date_range_filter(start_date, end_date):
+    """
+    Matches games between two dates, both included.
+    """
+    return {"utc_date": {"$gte": start_date, "$lte": end_date}}
+
+
+def archive_season_filter(season, sport=None, gender=None):
+    """
+    Matches the archived games of a season, optionally of one sport and gender.
+    """
+    query = {"season": season}
+    if sport:
+        query["sport"] = sport
+    if gender:
+        query["gender"] = gender
+    return query
+
+
+def recent_articles_filter(limit_days, now=None):
+    """
+    Matches articles published in the last `limit_days` days.
+    """
+    now = now or datetime.now(timezone.utc)
+    return {"published_at": {"$gte": now - timedelta(days=limit_days)}}
+
+
+def stale_articles_filter(limit_days, now=None):
+    """
+    Matches articles published more than `limit_days` days ago.
+    """
+    now = now or datetime.now(timezone.utc)
+    return {"published_at": {"$lt": now - timedelta(days=limit_days)}}
+
+
+# Videos stored before sports were classified at ingest time
+UNCLASSIFIED_VIDEOS_FILTER = {"sports_type": {"$exists": False}}
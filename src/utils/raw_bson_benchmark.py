@@ -0,0 +1,136 @@
+"""
+Compares the default decoding of list query results against the RAW_BSON_READS
+fast path.
+
+Both paths start from the same encoded BSON documents pymongo receives from the
+server, wrap them in models the way the repositories do, and then read only the
+fields a typical list query resolves. The benchmark reports the time taken and
+the number of objects allocated per document.
+
+Usage:
+    python -m src.utils.raw_bson_benchmark [--games 5000] [--repeat 5]
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import bson
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+
+from src.models.game import Game
+
+DICT_CODEC_OPTIONS = CodecOptions(tz_aware=True)
+RAW_CODEC_OPTIONS = CodecOptions(document_class=RawBSONDocument, tz_aware=True)
+
+# The fields the app's schedule list reads for each game
+LIST_FIELDS = ("id", "sport", "gender", "date", "opponent_id", "result", "utc_date")
+
+
+def build_documents(count):
+    """
+    Encodes `count` game documents shaped like scraped games, box scores included.
+    """
+    start = datetime(2025, 1, 1, 17, tzinfo=timezone.utc)
+    documents = []
+    for i in range(count):
+        box_score = [
+            {
+                "corScore": str(j // 3),
+                "oppScore": str(j // 4),
+                "team": "COR" if j % 2 else "OPP",
+                "period": str(j // 10 + 1),
+                "time": f"{j % 20}:00",
+                "description": f"Goal by Player {j} (assisted by Player {j + 1})",
+                "scorer": f"Player {j}",
+                "assist": f"Player {j + 1}",
+                "scoreBy": "Player",
+            }
+            for j in range(30)
+        ]
+        document = {
+            "_id": f"{i:024x}",
+            "city": "Ithaca",
+            "date": "Jan 1 (Wed)",
+            "gender": "Men",
+            "location": "Lynah Rink",
+            "opponent_id": f"{i % 40:024x}",
+            "result": "W, 3-1",
+            "sport": "Ice Hockey",
+            "state": "NY",
+            "time": "7:00 p.m.",
+            "box_score": box_score,
+            "score_breakdown": [["1", "1", "1", "3"], ["0", "1", "0", "1"]],
+            "team": f"{i % 40:024x}",
+            "utc_date": start + timedelta(days=i),
+            "ticket_link": "https://cornellbigred.com/tickets",
+        }
+        documents.append(bson.encode(document))
+    return documents
+
+
+def read_dicts(documents):
+    return [Game.from_dict(bson.decode(data, DICT_CODEC_OPTIONS)) for data in documents]
+
+
+def read_raw(documents):
+    return [Game.from_dict(RawBSONDocument(data, RAW_CODEC_OPTIONS)) for data in documents]
+
+
+def touch(games):
+    for game in games:
+        for field in LIST_FIELDS:
+            getattr(game, field)
+
+
+def measure(read, documents, repeat):
+    """
+    Returns the best wall time over `repeat` runs and the number of objects
+    still allocated once the games have been read.
+    """
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        touch(read(documents))
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    games = read(documents)
+    touch(games)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return best, allocated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=5000, help="Number of game documents")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path (best is reported)")
+    args = parser.parse_args()
+
+    documents = build_documents(args.games)
+    print(f"{args.games} games, {sum(len(data) for data in documents) / len(documents):.0f} bytes each")
+    results = {}
+    for name, read in (("dict", read_dicts), ("raw", read_raw)):
+        elapsed, allocated = measure(read, documents, args.repeat)
+        results[name] = (elapsed, allocated)
+        print(
+            f"{name:>5}: {elapsed * 1000:8.1f} ms  "
+            f"{elapsed / args.games * 1e6:6.2f} us/doc  "
+            f"{allocated / args.games:6.1f} objects/doc"
+        )
+
+    (dict_elapsed, dict_allocated), (raw_elapsed, raw_allocated) = results["dict"], results["raw"]
+    print(
+        f"raw is {dict_elapsed / raw_elapsed:.1f}x faster and allocates "
+        f"{dict_allocated / max(raw_allocated, 1):.1f}x fewer objects"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# Stages a sport's scrape time is split into
+STAGES = ("fetch", "parse", "diff", "write")
+
+# Counters kept for every sport in a scrape run
+COUNTERS = ("pages_fetched", "pages_cached", "bytes", "inserted", "updated", "unchanged")
+
+_local = threading.local()
+
+
+def new_record():
+    """
+    Returns an empty per-sport ledger record.
+    """
+    record = {counter: 0 for counter in COUNTERS}
+    record["stages"] = {stage: 0.0 for stage in STAGES}
+    return record
+
+
+@contextmanager
+def recording(record):
+    """
+    Attribute the stage timings and counters of the current thread to `record`
+    for the duration of the block.
+    """
+    previous = getattr(_local, "record", None), getattr(_local, "stack", None)
+    _local.record, _local.stack = record, []
+    try:
+        yield record
+    finally:
+        _local.record, _local.stack = previous
+
+
+@contextmanager
+def stage(name):
+    """
+    Time the block as stage `name` of the current record. Stages nest: time
+    spent in an inner stage (e.g. a fetch while parsing) only counts towards
+    the inner one. Does nothing outside `recording`.
+    """
+    record = getattr(_local, "record", None)
+    if record is None:
+        yield
+        return
+
+    stack = _local.stack
+    now = time.monotonic()
+    if stack:
+        parent, since = stack[-1]
+        record["stages"][parent] += now - since
+    stack.append((name, now))
+    try:
+        yield
+    finally:
+        now = time.monotonic()
+        _, since = stack.pop()
+        record["stages"][name] += now - since
+        if stack:
+            stack[-1] = (stack[-1][0], now)
+
+
+def count(counter, amount=1):
+    """
+    Add to a counter of the current record, if any.
+    """
+    record = getattr(_local, "record", None)
+    if record is not None:
+        record[counter] += amount
+
+
+def record_response(response):
+    """
+    Count a fetched page and the bytes downloaded for it; a 304 Not Modified
+    (a revalidated page, see `fetch(conditional=True)`) counts as cached.
+    """
+    if response.status_code == 304:
+        count("pages_cached")
+    else:
+        count("pages_fetched")
+    count("bytes", downloaded_bytes(response))
+
+
+def downloaded_bytes(response):
+    """
+    The size of a response body as sent over the wire, i.e. before it is
+    decompressed.
+    """
+    response.content  # Read the whole body
+    try:
+        return response.raw.tell()
+    except (AttributeError, OSError):
+        pass
+    length = response.headers.get("Content-Length", "")
+    return int(length) if length.isdigit() else len(response.content)
@@ -0,0 +1,83 @@
+import re
+
+
+def get_selection(info):
+    """
+    Returns the fields the client selected below the field being resolved.
+
+    Fragments are expanded, and names are kept as they appear in the query
+    (camelCase), e.g. `{"id": {}, "team": {"name": {}}}`.
+
+    Args:
+        info: The graphene resolve info.
+
+    Returns:
+        dict: A mapping of selected field name to its own nested selection.
+    """
+    field_nodes = getattr(info, "field_nodes", None) or getattr(info, "field_asts", None) or []
+    selection = {}
+    for node in field_nodes:
+        _collect(node.selection_set, info.fragments, selection)
+    return selection
+
+
+def _collect(selection_set, fragments, selection):
+    if selection_set is None:
+        return
+    for node in selection_set.selections:
+        kind = type(node).__name__
+        if kind in ("Field", "FieldNode"):
+            nested = selection.setdefault(node.name.value, {})
+            _collect(node.selection_set, fragments, nested)
+        elif kind in ("FragmentSpread", "FragmentSpreadNode"):
+            fragment = fragments.get(node.name.value)
+            if fragment is not None:
+                _collect(fragment.selection_set, fragments, selection)
+        elif kind in ("InlineFragment", "InlineFragmentNode"):
+            _collect(node.selection_set, fragments, selection)
+
+
+def selected_fields(info, dependencies=None):
+    """
+    Returns the document fields needed to resolve the client's selection, for
+    use as a MongoDB projection. `_id` is always included.
+
+    Args:
+        info: The graphene resolve info.
+        dependencies (dict): Document fields a selected field's resolver reads,
+            keyed by the snake_case field name, e.g. {"team": ["team", "opponent_id"]}.
+
+    Returns:
+        list: The snake_case document field names.
+    """
+    return fields_of(get_selection(info), dependencies)
+
+
+def fields_of(selection, dependencies=None):
+    """
+    Returns the document fields needed to resolve a selection as returned by
+    `get_selection` (or one of its nested selections), e.g. `selection["team"]`.
+    `_id` is always included.
+    """
+    dependencies = dependencies or {}
+    fields = {"_id"}
+    for name in selection:
+        if name == "id" or name.startswith("__"):
+            continue
+        field = to_snake_case(name)
+        fields.update(dependencies.get(field, [field]))
+    return sorted(fields)
+
+
+def to_snake_case(name):
+    """
+    Converts a camelCase GraphQL field name to the snake_case document field.
+    """
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def projection(fields):
+    """
+    Builds a MongoDB projection from a list of fields, or None to load everything.
+    """
+    return {field: 1 for field in fields} if fields else None
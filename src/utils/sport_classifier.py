@@ -0,0 +1,92 @@
+import re
+from src.utils.constants import SPORT_URLS
+
+
+class SportClassifier:
+    """
+    Classifies titles by sport using a single compiled regex.
+
+    All patterns are combined into one alternation of named groups inside a
+    lookahead, so a title is scanned once regardless of how many sports are
+    known. The lookahead consumes nothing, so a match never hides another one
+    overlapping it (e.g. "football" inside "sprint football"); at each position
+    the alternation tries the patterns in order. When several patterns match,
+    the one listed first wins.
+
+    Args:
+        patterns (list): (regex, sport name) pairs in priority order.
+    """
+
+    def __init__(self, patterns):
+        self._sports = [sport for _, sport in patterns]
+        self._regex = re.compile(
+            "(?="
+            + "|".join(f"(?P<s{rank}>{pattern})" for rank, (pattern, _) in enumerate(patterns))
+            + ")",
+            re.IGNORECASE,
+        )
+
+    def classify(self, title):
+        """
+        Returns the highest-priority sport matching the title, or None.
+        """
+        if not title:
+            return None
+
+        best_rank = None
+        for match in self._regex.finditer(title):
+            rank = int(match.lastgroup[1:])
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                if rank == 0:
+                    break
+
+        return self._sports[best_rank] if best_rank is not None else None
+
+
+VIDEO_SPORT_CLASSIFIER = SportClassifier(
+    [
+        # Ice Hockey
+        (r"ice\s+hockey", "Ice Hockey"),
+        (r"women'?s\s+ice\s+hockey", "Ice Hockey"),
+        (r"men'?s\s+ice\s+hockey", "Ice Hockey"),
+        # Field Hockey
+        (r"field\s+hockey", "Field Hockey"),
+        # Hockey
+        (r"\bhockey\b", "Ice Hockey"),
+        # Basketball
+        (r"basketball", "Basketball"),
+        # Sprint Football, before Football which it contains
+        (r"sprint\s+football", "Sprint Football"),
+        # Football
+        (r"\bfootball\b", "Football"),
+        # Soccer
+        (r"\bsoccer\b", "Soccer"),
+        # Volleyball
+        (r"volleyball", "Volleyball"),
+        # Wrestling
+        (r"wrestling", "Wrestling"),
+    ]
+)
+
+
+def _build_article_classifier():
+    sport_names = {
+        sport_data["sport"].strip()
+        for sport_data in SPORT_URLS.values()
+        if sport_data["sport"].strip()
+    }
+
+    # Longest first, to match "Swimming & Diving" before "Swimming"
+    patterns = [
+        (re.escape(sport_name), sport_name)
+        for sport_name in sorted(sport_names, key=lambda name: (-len(name), name))
+    ]
+
+    # Special mappings for common variations in titles, only used when no exact
+    # sport name matches: "Men's Hockey" or "Women's Hockey" -> "Ice Hockey"
+    patterns.append((r"hockey", "Ice Hockey"))
+    return SportClassifier(patterns)
+
+
+ARTICLE_SPORT_CLASSIFIER = _build_article_classifier()
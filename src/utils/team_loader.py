@@ -3,6 +3,11 @@ from promise.dataloader import DataLoader
 from src.services import TeamService
 
 class TeamLoader(DataLoader):
+    """
+    Batches the team lookups of one request. The teams themselves come from
+    TeamService's process-wide team cache, so they are shared across requests.
+    """
+
     def batch_load_fn(self, team_ids):
         teams = TeamService.get_teams_by_ids(team_ids)
         team_map = {team.id: team for team in teams}
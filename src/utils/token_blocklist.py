@@ -0,0 +1,101 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+from src.database import db
+
+
+class TokenBlocklist:
+    """
+    An in-process copy of the revoked, unexpired token `jti`s.
+
+    The set is preloaded from the `token_blocklist` collection and kept in sync
+    by polling for entries inserted since the last poll, at most once every
+    `poll_interval` seconds. Checking a token is therefore a set lookup; a token
+    revoked by another process is rejected here within one poll interval.
+
+    Args:
+        collection: The MongoDB collection holding revoked tokens.
+        poll_interval (float): Minimum number of seconds between delta polls.
+    """
+
+    # ObjectId timestamps come from whichever clock inserted the entry, so each
+    # poll re-reads a short window before the previous one
+    POLL_OVERLAP = timedelta(seconds=5)
+
+    def __init__(self, collection, poll_interval=5):
+        self._collection = collection
+        self._poll_interval = poll_interval
+        self._revoked = {}
+        self._since = None
+        self._last_poll = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """
+        Preload every unexpired revoked token.
+        """
+        with self._lock:
+            self._revoked.clear()
+            self._load()
+
+    def add(self, jti, expires_at):
+        """
+        Record a token revoked by this process without waiting for the next poll.
+        """
+        with self._lock:
+            self._revoked[jti] = _as_utc(expires_at)
+
+    def is_revoked(self, jti):
+        """
+        Check whether a token has been revoked.
+        """
+        if self._last_poll is None or time.monotonic() - self._last_poll >= self._poll_interval:
+            self._refresh()
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > datetime.now(timezone.utc)
+
+    def _refresh(self):
+        # Only one thread polls; the others keep answering from the current set
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self._since is None:
+                self._load()
+            else:
+                since = datetime.now(timezone.utc) - self.POLL_OVERLAP
+                self._poll({"_id": {"$gte": ObjectId.from_datetime(self._since)}})
+                self._since = since
+            self._evict_expired()
+        except Exception as e:
+            # Wait a poll interval before retrying, so that while MongoDB is
+            # unreachable only one request per interval waits on it
+            self._last_poll = time.monotonic()
+            logging.error(f"Error polling token blocklist: {e}")
+        finally:
+            self._lock.release()
+
+    def _load(self):
+        since = datetime.now(timezone.utc) - self.POLL_OVERLAP
+        self._poll({"expires_at": {"$gt": datetime.now(timezone.utc)}})
+        self._since = since
+
+    def _poll(self, query):
+        for entry in self._collection.find(query, {"jti": 1, "expires_at": 1}):
+            self._revoked[entry["jti"]] = _as_utc(entry["expires_at"])
+        self._last_poll = time.monotonic()
+
+    def _evict_expired(self):
+        now = datetime.now(timezone.utc)
+        for jti in [jti for jti, expires_at in self._revoked.items() if expires_at <= now]:
+            del self._revoked[jti]
+
+
+def _as_utc(value):
+    # pymongo returns naive datetimes in UTC
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+token_blocklist = TokenBlocklist(db["token_blocklist"])
@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    A thread-safe, in-process LRU cache whose entries expire after a fixed time.
+
+    Args:
+        ttl (float): Number of seconds an entry stays valid.
+        maxsize (int): Maximum number of entries, or None for no limit; the least
+            recently used entry is evicted when it is exceeded.
+        maxbytes (int): Maximum total size of the cached values as measured by
+            `sizeof`, or None for no limit; least recently used entries are
+            evicted when it is exceeded.
+        sizeof (callable): Returns the approximate size in bytes of a value.
+            Required with `maxbytes`.
+    """
+
+    def __init__(self, ttl, maxsize=1024, maxbytes=None, sizeof=None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for a key, or `default` if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        """
+        Cache a value for a key, evicting the least recently used entries if needed.
+
+        Args:
+            ttl (float): Seconds this entry stays valid, instead of the cache's
+                default. (optional)
+        """
+        size = self.sizeof(value) if self.maxbytes is not None else 0
+        with self._lock:
+            self._remove(key)
+            expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+            self._entries[key] = (expires_at, value, size)
+            self._bytes += size
+            while self._entries and (
+                (self.maxsize is not None and len(self._entries) > self.maxsize)
+                or (self.maxbytes is not None and self._bytes > self.maxbytes)
+            ):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def invalidate(self, key):
+        """
+        Remove a key from the cache.
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        """
+        Remove every entry from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
@@ -0,0 +1,4 @@
+import os
+
+# src.utils.constants reads the JWT secret at import
+os.environ.setdefault("JWT_SECRET_KEY", "test")
@@ -0,0 +1,17 @@
+from src.utils.sport_classifier import VIDEO_SPORT_CLASSIFIER
+
+
+def test_higher_priority_match_after_lower_priority_one():
+    assert VIDEO_SPORT_CLASSIFIER.classify("Soccer Sprint Football") == "Sprint Football"
+
+
+def test_overlapping_matches_are_all_considered():
+    assert VIDEO_SPORT_CLASSIFIER.classify("Sprint Football beats Football team") == "Sprint Football"
+
+
+def test_football():
+    assert VIDEO_SPORT_CLASSIFIER.classify("Football beats Princeton") == "Football"
+
+
+def test_no_match():
+    assert VIDEO_SPORT_CLASSIFIER.classify("Commencement 2025") is None